@@ -67,6 +67,10 @@ npm_install() {
   npm_config_loglevel=error npm install -g "$@" 2>/dev/null || npm install -g "$@"
 }
 
+# Tool installation. Sandboxes restored from a pre-bootstrapped snapshot
+# already carry everything below and set JANUS_BOOTSTRAP_SKIP_INSTALL=true.
+if [ "${JANUS_BOOTSTRAP_SKIP_INSTALL:-false}" != "true" ]; then
+
 # Install Playwright for browser automation
 echo "=== Installing Playwright ==="
 if ! python3 - <<'PY' >/dev/null 2>&1
@@ -133,6 +137,10 @@ for agent in opencode openhands codex roo-code-cli cline; do
   fi
 done
 
+else
+  echo "=== Using pre-installed tooling from snapshot ==="
+fi
+
 start_artifact_server() {
   python3 - <<'PY'
 import os
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import io
 import json
 import os
 import time
@@ -22,31 +23,70 @@ class Screenshot:
     timestamp: float
 
 
+def _encode_for_stream(data: bytes) -> tuple[bytes, str]:
+    """Downscale / re-encode a PNG screenshot for the event stream.
+
+    Controlled by ``JANUS_SCREENSHOT_MAX_WIDTH`` (0 keeps the size) and
+    ``JANUS_SCREENSHOT_FORMAT`` (``png`` or ``webp``). Falls back to the
+    original PNG when Pillow is unavailable or re-encoding fails.
+    """
+    image_format = os.environ.get("JANUS_SCREENSHOT_FORMAT", "png").strip().lower()
+    try:
+        max_width = int(os.environ.get("JANUS_SCREENSHOT_MAX_WIDTH", "0") or 0)
+    except ValueError:
+        max_width = 0
+    if image_format != "webp" and max_width <= 0:
+        return data, "image/png"
+    try:
+        from PIL import Image
+
+        image = Image.open(io.BytesIO(data))
+        if max_width > 0 and image.width > max_width:
+            height = max(1, round(image.height * max_width / image.width))
+            image = image.resize((max_width, height))
+        output = io.BytesIO()
+        if image_format == "webp":
+            image.save(output, "WEBP", quality=80)
+            return output.getvalue(), "image/webp"
+        image.save(output, "PNG", optimize=True)
+        return output.getvalue(), "image/png"
+    except Exception:
+        return data, "image/png"
+
+
 def _default_screenshot_handler(shot: Screenshot) -> None:
+    """Save the screenshot and append a ``screenshot`` event to the event log.
+
+    The service tails ``JANUS_EVENT_LOG`` (one JSON object per line) and
+    forwards new events to the client as they appear.
+    """
     target_dir = os.environ.get("JANUS_SCREENSHOT_DIR", "/workspace/artifacts/screenshots")
+    event_log = os.environ.get("JANUS_EVENT_LOG") or os.path.join(target_dir, "events.jsonl")
     try:
         os.makedirs(target_dir, exist_ok=True)
+        os.makedirs(os.path.dirname(event_log), exist_ok=True)
     except OSError:
         return
 
     stamp_ms = int(shot.timestamp * 1000)
     token = uuid.uuid4().hex[:6]
-    base_name = f"screenshot-{stamp_ms}-{token}"
-    image_path = os.path.join(target_dir, f"{base_name}.png")
-    meta_path = os.path.join(target_dir, f"{base_name}.json")
+    image_path = os.path.join(target_dir, f"screenshot-{stamp_ms}-{token}.png")
+    image_data, mime_type = _encode_for_stream(shot.data)
+    event = {
+        "event": "screenshot",
+        "url": shot.url,
+        "title": shot.title,
+        "timestamp": shot.timestamp,
+        "mime_type": mime_type,
+        "image_base64": base64.b64encode(image_data).decode("ascii"),
+    }
 
     try:
         with open(image_path, "wb") as handle:
             handle.write(shot.data)
-        with open(meta_path, "w", encoding="utf-8") as handle:
-            json.dump(
-                {
-                    "url": shot.url,
-                    "title": shot.title,
-                    "timestamp": shot.timestamp,
-                },
-                handle,
-            )
+        # A single write of a complete line keeps appends atomic for readers.
+        with open(event_log, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(event) + "\n")
     except OSError:
         return
 
@@ -1,7 +1,7 @@
 """Configuration settings for the baseline competitor."""
 
 from functools import lru_cache
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -232,6 +232,41 @@ class Settings(BaseSettings):
             "BASELINE_SANDY_TIMEOUT",
         ),
     )
+    sandy_http2: bool = Field(
+        default=True,
+        description="Negotiate HTTP/2 with the Sandy API when h2 is installed",
+        validation_alias=AliasChoices(
+            "SANDY_HTTP2",
+            "BASELINE_AGENT_CLI_SANDY_HTTP2",
+        ),
+    )
+    sandy_max_connections: int = Field(
+        default=100,
+        description="Max connections in the shared Sandy API client pool",
+        validation_alias=AliasChoices(
+            "SANDY_MAX_CONNECTIONS",
+            "BASELINE_AGENT_CLI_SANDY_MAX_CONNECTIONS",
+        ),
+    )
+    sandy_max_keepalive_connections: int = Field(
+        default=20,
+        description="Max idle keep-alive connections kept open to the Sandy API",
+        validation_alias=AliasChoices(
+            "SANDY_MAX_KEEPALIVE_CONNECTIONS",
+            "BASELINE_AGENT_CLI_SANDY_MAX_KEEPALIVE_CONNECTIONS",
+        ),
+    )
+    sandy_snapshot_mode: bool = Field(
+        default=False,
+        description=(
+            "Bootstrap one template sandbox per agent-pack hash, snapshot it and "
+            "create agent sandboxes from the snapshot"
+        ),
+        validation_alias=AliasChoices(
+            "SANDY_SNAPSHOT_MODE",
+            "BASELINE_AGENT_CLI_SANDY_SNAPSHOT_MODE",
+        ),
+    )
     sandy_git_timeout: int = Field(
         default=120,
         description="Git operation timeout in seconds inside Sandy sandboxes",
@@ -284,6 +319,22 @@ class Settings(BaseSettings):
             "BASELINE_ARTIFACT_GRACE_SECONDS",
         ),
     )
+    screenshot_max_width: int = Field(
+        default=1280,
+        description="Downscale streamed browser screenshots to this width (0 keeps the size)",
+        validation_alias=AliasChoices(
+            "JANUS_SCREENSHOT_MAX_WIDTH",
+            "BASELINE_AGENT_CLI_SCREENSHOT_MAX_WIDTH",
+        ),
+    )
+    screenshot_format: Literal["png", "webp"] = Field(
+        default="webp",
+        description="Image format of streamed browser screenshots",
+        validation_alias=AliasChoices(
+            "JANUS_SCREENSHOT_FORMAT",
+            "BASELINE_AGENT_CLI_SCREENSHOT_FORMAT",
+        ),
+    )
 
     # Memory service configuration
     memory_service_url: str = Field(
@@ -361,13 +412,40 @@ class Settings(BaseSettings):
     )
     warm_pool_size: int = Field(
         default=2,
-        description="Number of warm sandboxes to maintain",
+        description="Initial number of warm sandboxes to maintain",
         validation_alias=AliasChoices(
             "WARM_POOL_SIZE",
             "BASELINE_AGENT_CLI_WARM_POOL_SIZE",
             "BASELINE_WARM_POOL_SIZE",
         ),
     )
+    warm_pool_min_size: int = Field(
+        default=1,
+        description="Lower bound for the demand-driven warm pool target",
+        validation_alias=AliasChoices(
+            "WARM_POOL_MIN_SIZE",
+            "BASELINE_AGENT_CLI_WARM_POOL_MIN_SIZE",
+            "BASELINE_WARM_POOL_MIN_SIZE",
+        ),
+    )
+    warm_pool_max_size: int = Field(
+        default=6,
+        description="Upper bound for the demand-driven warm pool target",
+        validation_alias=AliasChoices(
+            "WARM_POOL_MAX_SIZE",
+            "BASELINE_AGENT_CLI_WARM_POOL_MAX_SIZE",
+            "BASELINE_WARM_POOL_MAX_SIZE",
+        ),
+    )
+    warm_pool_refill_concurrency: int = Field(
+        default=2,
+        description="Maximum number of warm sandboxes prepared in parallel",
+        validation_alias=AliasChoices(
+            "WARM_POOL_REFILL_CONCURRENCY",
+            "BASELINE_AGENT_CLI_WARM_POOL_REFILL_CONCURRENCY",
+            "BASELINE_WARM_POOL_REFILL_CONCURRENCY",
+        ),
+    )
     warm_pool_max_age: int = Field(
         default=3600,
         description="Max sandbox age in seconds",
@@ -386,6 +464,24 @@ class Settings(BaseSettings):
             "BASELINE_WARM_POOL_MAX_REQUESTS",
         ),
     )
+    warm_pool_liveness_ttl: float = Field(
+        default=30.0,
+        description="Seconds a health check stays valid before acquire re-probes a sandbox",
+        validation_alias=AliasChoices(
+            "WARM_POOL_LIVENESS_TTL",
+            "BASELINE_AGENT_CLI_WARM_POOL_LIVENESS_TTL",
+            "BASELINE_WARM_POOL_LIVENESS_TTL",
+        ),
+    )
+    warm_pool_speculative_acquire: bool = Field(
+        default=True,
+        description="Start acquiring a warm sandbox before routing when heuristics suggest the agent path",
+        validation_alias=AliasChoices(
+            "WARM_POOL_SPECULATIVE_ACQUIRE",
+            "BASELINE_AGENT_CLI_WARM_POOL_SPECULATIVE_ACQUIRE",
+            "BASELINE_WARM_POOL_SPECULATIVE_ACQUIRE",
+        ),
+    )
 
     # Complexity detection
     complexity_threshold: int = Field(
@@ -403,6 +499,50 @@ class Settings(BaseSettings):
         default=3.0,
         description="Timeout in seconds for LLM routing check",
     )
+    llm_routing_hedge: bool = Field(
+        default=True,
+        description="Race the fallback routing model when the primary is slow",
+    )
+    llm_routing_hedge_delay: float = Field(
+        default=1.0,
+        description="Hedge delay in seconds until enough routing latencies are observed",
+    )
+    llm_routing_hedge_quantile: float = Field(
+        default=0.9,
+        description="Observed latency quantile of a routing model used as its hedge delay",
+    )
+    local_routing_model_path: Optional[str] = Field(
+        default=None,
+        description="JSON weights of the local routing classifier (unset disables it)",
+    )
+    local_routing_confidence: float = Field(
+        default=0.85,
+        description="Minimum local classifier probability; below it the routing LLM decides",
+    )
+    routing_cache_size: int = Field(
+        default=1024,
+        description="Routing decisions memoized per process (0 disables the cache)",
+        validation_alias=AliasChoices(
+            "ROUTING_CACHE_SIZE",
+            "BASELINE_AGENT_CLI_ROUTING_CACHE_SIZE",
+        ),
+    )
+    routing_cache_ttl: float = Field(
+        default=3600.0,
+        description="Seconds a memoized routing decision stays valid",
+        validation_alias=AliasChoices(
+            "ROUTING_CACHE_TTL",
+            "BASELINE_AGENT_CLI_ROUTING_CACHE_TTL",
+        ),
+    )
+    routing_cache_similarity: float = Field(
+        default=0.0,
+        description="MinHash similarity for near-duplicate cache hits (0 disables them)",
+        validation_alias=AliasChoices(
+            "ROUTING_CACHE_SIMILARITY",
+            "BASELINE_AGENT_CLI_ROUTING_CACHE_SIMILARITY",
+        ),
+    )
 
     # Logging
     log_level: str = Field(
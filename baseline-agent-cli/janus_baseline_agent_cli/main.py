@@ -39,6 +39,7 @@ from janus_baseline_agent_cli.services import (
     LLMService,
     MemoryService,
     SandyService,
+    SpeculativeAcquire,
     WarmPoolManager,
     get_complexity_detector,
     get_llm_service,
@@ -106,6 +107,61 @@ def _extract_last_user_prompt(messages: list[Message]) -> str:
     return extract_text_content(messages[index].content)
 
 
+def _start_speculative_acquire(
+    request: ChatCompletionRequest,
+    complexity_detector: ComplexityDetector,
+    sandy_service: SandyService,
+    baseline_agent_override: str | None,
+) -> SpeculativeAcquire | None:
+    """Start a warm-pool acquire when cheap heuristics predict the agent path.
+
+    Runs before memory retrieval and routing so sandbox acquisition overlaps
+    them; the caller must claim or abandon the returned handle.
+    """
+    if not (
+        warm_pool
+        and settings.warm_pool_speculative_acquire
+        and settings.use_sandy_agent_api
+        and sandy_service.is_available
+    ):
+        return None
+    if hasattr(sandy_service, "requires_cli_execution") and sandy_service.requires_cli_execution(
+        baseline_agent_override
+    ):
+        return None
+    metadata_decision = decision_from_metadata(request.metadata)
+    if metadata_decision is not None:
+        likely_agent = decision_requires_agent(metadata_decision)
+        reason = "routing_metadata"
+    elif settings.always_use_agent or baseline_agent_override:
+        likely_agent = True
+        reason = "agent_forced"
+    else:
+        first_pass = complexity_detector.analyze(request.messages, request.generation_flags)
+        likely_agent = first_pass.is_complex
+        reason = first_pass.reason
+    if not likely_agent:
+        return None
+    logger.info("speculative_sandbox_acquire", reason=reason)
+    return warm_pool.speculate()
+
+
+async def _abandon_when_done(
+    stream: AsyncGenerator[str, None],
+    speculative: SpeculativeAcquire,
+) -> AsyncGenerator[str, None]:
+    """Return an unclaimed speculative sandbox once the response ends.
+
+    A stream that is never iterated is covered by the handle's own lease
+    expiry (``SPECULATIVE_LEASE_SECONDS``).
+    """
+    try:
+        async for payload in stream:
+            yield payload
+    finally:
+        speculative.abandon()
+
+
 def _build_conversation_base(messages: list[Message]) -> list[dict[str, str]]:
     conversation: list[dict[str, str]] = []
     for message in messages:
@@ -303,6 +359,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         host=settings.host,
         port=settings.port,
     )
+    if get_sandy_service().is_available:
+        # Build the agent pack archive once, before the first sandbox needs it.
+        await asyncio.to_thread(get_sandy_service().agent_pack_archive)
     if settings.warm_pool_enabled and settings.use_sandy_agent_api:
         sandy_service = get_sandy_service()
         warm_pool = WarmPoolManager(
@@ -310,6 +369,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             pool_size=settings.warm_pool_size,
             max_age_seconds=settings.warm_pool_max_age,
             max_requests=settings.warm_pool_max_requests,
+            min_size=settings.warm_pool_min_size,
+            max_size=settings.warm_pool_max_size,
+            refill_concurrency=settings.warm_pool_refill_concurrency,
+            liveness_ttl_seconds=settings.warm_pool_liveness_ttl,
         )
         await warm_pool.start()
     elif settings.warm_pool_enabled and not settings.use_sandy_agent_api:
@@ -318,6 +381,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if warm_pool:
         await warm_pool.stop()
         warm_pool = None
+    await get_sandy_service().aclose()
     logger.info("baseline_stopping")
 
 
@@ -355,12 +419,15 @@ class HealthResponse(BaseModel):
     version: str
     sandbox_available: bool
     features: dict[str, bool]
-    warm_pool: dict[str, int | bool]
+    warm_pool: dict[str, int | float | bool]
+    sandy_connections: dict[str, int | float] = {}
+    routing_cache: dict[str, int | float | bool | str] = {}
 
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check(
     sandy_service: SandyService = Depends(get_sandy_service),
+    complexity_detector: ComplexityDetector = Depends(get_complexity_detector),
 ) -> HealthResponse:
     """Health check endpoint."""
     if warm_pool:
@@ -381,6 +448,16 @@ async def health_check(
             "vision": True,
         },
         warm_pool=warm_pool_status,
+        sandy_connections=(
+            sandy_service.connection_stats()
+            if hasattr(sandy_service, "connection_stats")
+            else {}
+        ),
+        routing_cache=(
+            complexity_detector.routing_cache_stats()
+            if hasattr(complexity_detector, "routing_cache_stats")
+            else {}
+        ),
     )
 
 
@@ -394,6 +471,7 @@ async def stream_response(
     conversation_base: list[dict[str, str]] | None = None,
     debug_emitter: DebugEmitter | None = None,
     baseline_agent_override: str | None = None,
+    speculative: SpeculativeAcquire | None = None,
 ) -> AsyncGenerator[str, None]:
     """Generate streaming response based on complexity."""
     if debug_emitter:
@@ -424,6 +502,10 @@ async def stream_response(
         if hasattr(sandy_service, "requires_cli_execution")
         else False
     )
+    if speculative and not (
+        using_agent and settings.use_sandy_agent_api and warm_pool and not use_cli_fallback
+    ):
+        speculative.abandon()
     flags_payload = _generation_flags_payload(request.generation_flags)
     metadata_payload = {
         "using_agent": using_agent,
@@ -603,7 +685,9 @@ async def stream_response(
         try:
             if using_agent:
                 if settings.use_sandy_agent_api and warm_pool and not use_cli_fallback:
-                    sandbox = await warm_pool.acquire()
+                    sandbox = (
+                        await speculative.claim() if speculative else await warm_pool.acquire()
+                    )
                     if sandbox:
                         try:
                             async for chunk in sandbox.stream(
@@ -620,11 +704,10 @@ async def stream_response(
                                     )
                                 first_chunk = False
                                 yield f"data: {chunk.model_dump_json(exclude_none=True)}\n\n"
-                        except Exception:
-                            await warm_pool.release(sandbox, reusable=False)
-                            raise
-                        else:
-                            await warm_pool.release(sandbox, reusable=True)
+                        finally:
+                            # Quarantined by the pool if the run did not finish,
+                            # including when the client disconnects mid-stream.
+                            await warm_pool.release(sandbox)
                     else:
                         async for chunk in sandy_service.execute_via_agent_api(
                             request,
@@ -786,6 +869,9 @@ async def chat_completions(
             },
         )
 
+    speculative = _start_speculative_acquire(
+        request, complexity_detector, sandy_service, baseline_agent_header
+    )
     memory_enabled = bool(
         settings.enable_memory_feature and request.enable_memory and request.user_id
     )
@@ -811,23 +897,27 @@ async def chat_completions(
         }
         if debug_request_id:
             headers["X-Debug-Request-Id"] = debug_request_id
+        stream = stream_response(
+            request,
+            complexity_detector,
+            llm_service,
+            sandy_service,
+            memory_service if memory_enabled else None,
+            request.user_id if memory_enabled else None,
+            conversation_base if memory_enabled else None,
+            debug_emitter,
+            baseline_agent_header,
+            speculative,
+        )
+        if speculative:
+            stream = _abandon_when_done(stream, speculative)
         return StreamingResponse(
-            stream_response(
-                request,
-                complexity_detector,
-                llm_service,
-                sandy_service,
-                memory_service if memory_enabled else None,
-                request.user_id if memory_enabled else None,
-                conversation_base if memory_enabled else None,
-                debug_emitter,
-                baseline_agent_header,
-            ),
+            stream,
             media_type="text/event-stream",
             headers=headers,
         )
-    else:
-        # Non-streaming - route based on complexity
+    # Non-streaming - route based on complexity
+    try:
         if debug_emitter:
             await debug_emitter.emit(
                 DebugEventType.COMPLEXITY_CHECK_START,
@@ -850,6 +940,10 @@ async def chat_completions(
         routing_model = model_for_decision(decision)
         request.metadata = apply_decision_metadata(request.metadata, decision)
         sandy_unavailable = is_complex and not sandy_service.is_available
+        if speculative and not (is_complex and sandy_service.is_available):
+            # The speculative acquire only starts when the warm-pool agent
+            # path is otherwise available, so the decision alone settles it.
+            speculative.abandon()
         logger.info(
             "complexity_check",
             is_complex=is_complex,
@@ -927,7 +1021,9 @@ async def chat_completions(
             )
             if settings.use_sandy_agent_api and not use_cli_fallback:
                 if warm_pool:
-                    sandbox = await warm_pool.acquire()
+                    sandbox = (
+                        await speculative.claim() if speculative else await warm_pool.acquire()
+                    )
                     if sandbox:
                         try:
                             response = await sandbox.complete(
@@ -935,11 +1031,9 @@ async def chat_completions(
                                 debug_emitter=debug_emitter,
                                 baseline_agent_override=baseline_agent_header,
                             )
-                        except Exception:
-                            await warm_pool.release(sandbox, reusable=False)
-                            raise
-                        else:
-                            await warm_pool.release(sandbox, reusable=True)
+                        finally:
+                            # Quarantined by the pool if the run did not finish.
+                            await warm_pool.release(sandbox)
                     else:
                         response = await sandy_service.complete_via_agent_api(
                             request,
@@ -981,6 +1075,10 @@ async def chat_completions(
             )
 
         return response
+    finally:
+        # No-op once claimed; otherwise the sandbox goes back unused.
+        if speculative:
+            speculative.abandon()
 
 
 def main() -> None:
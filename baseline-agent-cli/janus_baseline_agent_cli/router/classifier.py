@@ -14,6 +14,7 @@ from janus_baseline_agent_cli.routing import (
     RoutingDecision,
     decision_for_images,
 )
+from janus_baseline_agent_cli.routing_cache import RoutingDecisionCache
 
 logger = structlog.get_logger()
 
@@ -21,11 +22,17 @@ logger = structlog.get_logger()
 class RoutingDecisionClassifier:
     """Classifies incoming requests to determine routing decision."""
 
-    def __init__(self, api_key: str, api_base: str = "https://llm.chutes.ai/v1") -> None:
+    def __init__(
+        self,
+        api_key: str,
+        api_base: str = "https://llm.chutes.ai/v1",
+        cache: RoutingDecisionCache[tuple[RoutingDecision, float]] | None = None,
+    ) -> None:
         self.api_key = api_key
         self.api_base = api_base
         self.model_id = DECISION_MODEL_ID
         self.client = httpx.AsyncClient(timeout=5.0)
+        self.cache = cache if cache is not None else RoutingDecisionCache("classifier")
 
     async def classify(
         self,
@@ -42,6 +49,10 @@ class RoutingDecisionClassifier:
         if len(user_content) < 30:
             return RoutingDecision.FAST_QWEN, 0.9
 
+        cached = self.cache.get(user_content, has_images)
+        if cached is not None:
+            return cached
+
         try:
             response = await self.client.post(
                 f"{self.api_base}/chat/completions",
@@ -77,6 +88,7 @@ class RoutingDecisionClassifier:
                 args = json.loads(tool_calls[0]["function"]["arguments"])
                 decision = RoutingDecision(args["decision"])
                 confidence = float(args.get("confidence", 0.7)) if isinstance(args, dict) else 0.7
+                self.cache.set(user_content, has_images, (decision, confidence))
                 return decision, confidence
         except Exception as exc:
             logger.warning("router_classification_error", error=str(exc), text_preview=user_lower[:200])
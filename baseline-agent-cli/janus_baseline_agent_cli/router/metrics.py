@@ -1,8 +1,115 @@
-"""Metrics for routing decisions."""
+"""Metrics for routing decisions.
+
+Everything here uses fixed memory regardless of how long the router runs:
+latencies go into log-bucketed histograms (quantiles within ~2% relative
+error) and request rates into per-second rings covering a sliding window.
+"""
 
 from __future__ import annotations
 
+import math
+import time
+from collections import deque
 from dataclasses import dataclass, field
+from typing import Callable
+
+# Relative bucket width of the latency histograms; bounds quantile error.
+HISTOGRAM_RELATIVE_ERROR = 0.02
+# Latencies are clamped to this range (ms) so the bucket count is bounded.
+HISTOGRAM_MIN_MS = 0.01
+HISTOGRAM_MAX_MS = 600_000.0
+RATE_WINDOW_SECONDS = 60
+QUANTILES = (0.5, 0.95, 0.99)
+
+_GAMMA = (1 + HISTOGRAM_RELATIVE_ERROR) / (1 - HISTOGRAM_RELATIVE_ERROR)
+_LOG_GAMMA = math.log(_GAMMA)
+
+
+class LatencyHistogram:
+    """Streaming latency summary: count, running mean, extremes and quantiles.
+
+    Values fall into logarithmic buckets whose midpoints are within
+    ``HISTOGRAM_RELATIVE_ERROR`` of every value they hold, the same
+    trade-off HDR histograms make. At most a few hundred buckets exist
+    for the clamped range.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[int, int] = {}
+        self.count = 0
+        self.mean = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value_ms: float) -> None:
+        value = min(max(value_ms, HISTOGRAM_MIN_MS), HISTOGRAM_MAX_MS)
+        index = math.ceil(math.log(value) / _LOG_GAMMA)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.mean += (value - self.mean) / self.count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def total(self) -> float:
+        return self.mean * self.count
+
+    def quantile(self, q: float) -> float:
+        """Estimated ``q`` quantile (0-1), or 0.0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                estimate = 2 * _GAMMA**index / (_GAMMA + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float | int]:
+        payload: dict[str, float | int] = {
+            "count": self.count,
+            "mean_ms": round(self.mean, 2),
+            "min_ms": round(self.min, 2) if self.count else 0.0,
+            "max_ms": round(self.max, 2),
+        }
+        for q in QUANTILES:
+            payload[f"p{round(q * 100)}_ms"] = round(self.quantile(q), 2)
+        return payload
+
+
+class WindowedCounter:
+    """Event count over the last ``window_seconds``, in one-second slots."""
+
+    def __init__(
+        self,
+        window_seconds: int = RATE_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._window = window_seconds
+        self._clock = clock
+        self._slots: deque[list[int]] = deque()  # [second, count]
+
+    def _expire(self, now_second: int) -> None:
+        while self._slots and self._slots[0][0] <= now_second - self._window:
+            self._slots.popleft()
+
+    def add(self, amount: int = 1) -> None:
+        second = int(self._clock())
+        self._expire(second)
+        if self._slots and self._slots[-1][0] == second:
+            self._slots[-1][1] += amount
+        else:
+            self._slots.append([second, amount])
+
+    def count(self) -> int:
+        self._expire(int(self._clock()))
+        return sum(slot[1] for slot in self._slots)
+
+    def rate(self) -> float:
+        """Events per second averaged over the window."""
+        return self.count() / self._window
 
 
 @dataclass
@@ -14,8 +121,21 @@ class RoutingMetrics:
     requests_by_model: dict[str, int] = field(default_factory=dict)
     fallback_count: int = 0
     errors_by_model: dict[str, int] = field(default_factory=dict)
-    avg_classification_time_ms: float = 0.0
-    classification_times: list[float] = field(default_factory=list)
+    classification_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    upstream_latency_by_model: dict[str, LatencyHistogram] = field(default_factory=dict)
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+    _recent_requests: dict[str, WindowedCounter] = field(default_factory=dict, repr=False)
+    _recent_errors: dict[str, WindowedCounter] = field(default_factory=dict, repr=False)
+
+    @property
+    def avg_classification_time_ms(self) -> float:
+        return self.classification_latency.mean
+
+    def _window(self, counters: dict[str, WindowedCounter], model_id: str) -> WindowedCounter:
+        counter = counters.get(model_id)
+        if counter is None:
+            counter = counters[model_id] = WindowedCounter(clock=self.clock)
+        return counter
 
     def record_request(
         self,
@@ -29,15 +149,22 @@ class RoutingMetrics:
         self.requests_by_model[model_id] = self.requests_by_model.get(model_id, 0) + 1
         if used_fallback:
             self.fallback_count += 1
-        self.classification_times.append(classification_time_ms)
-        self.avg_classification_time_ms = (
-            sum(self.classification_times) / len(self.classification_times)
-            if self.classification_times
-            else 0.0
-        )
+        self.classification_latency.record(classification_time_ms)
+        self._window(self._recent_requests, model_id).add()
+
+    def record_upstream_latency(self, model_id: str, latency_ms: float) -> None:
+        """Time until an upstream model answered (headers, for streams)."""
+        histogram = self.upstream_latency_by_model.get(model_id)
+        if histogram is None:
+            histogram = self.upstream_latency_by_model[model_id] = LatencyHistogram()
+        histogram.record(latency_ms)
 
     def record_error(self, model_id: str) -> None:
         self.errors_by_model[model_id] = self.errors_by_model.get(model_id, 0) + 1
+        self._window(self._recent_errors, model_id).add()
+
+    def _rates(self, counters: dict[str, WindowedCounter]) -> dict[str, float]:
+        return {model_id: round(counter.rate(), 4) for model_id, counter in counters.items()}
 
     def to_dict(self) -> dict:
         return {
@@ -48,7 +175,78 @@ class RoutingMetrics:
             "fallback_rate": self.fallback_count / max(self.total_requests, 1),
             "errors_by_model": self.errors_by_model,
             "avg_classification_time_ms": round(self.avg_classification_time_ms, 2),
+            "classification_latency": self.classification_latency.summary(),
+            "upstream_latency_by_model": {
+                model_id: histogram.summary()
+                for model_id, histogram in self.upstream_latency_by_model.items()
+            },
+            "rate_window_seconds": RATE_WINDOW_SECONDS,
+            "request_rate_by_model": self._rates(self._recent_requests),
+            "error_rate_by_model": self._rates(self._recent_errors),
         }
 
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition (format 0.0.4) of these metrics."""
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        family("janus_router_requests_total", "counter", "Routed requests.")
+        lines.append(f"janus_router_requests_total {self.total_requests}")
+        family("janus_router_fallbacks_total", "counter", "Requests served by a fallback model.")
+        lines.append(f"janus_router_fallbacks_total {self.fallback_count}")
+        family("janus_router_decision_requests_total", "counter", "Requests by routing decision.")
+        for decision, count in sorted(self.requests_by_decision.items()):
+            lines.append(
+                f"janus_router_decision_requests_total{_labels(decision=decision)} {count}"
+            )
+        family("janus_router_model_requests_total", "counter", "Requests served by model.")
+        for model_id, count in sorted(self.requests_by_model.items()):
+            lines.append(f"janus_router_model_requests_total{_labels(model=model_id)} {count}")
+        family("janus_router_model_errors_total", "counter", "Failed upstream calls by model.")
+        for model_id, count in sorted(self.errors_by_model.items()):
+            lines.append(f"janus_router_model_errors_total{_labels(model=model_id)} {count}")
+
+        for name, counters, help_text in (
+            ("janus_router_model_request_rate", self._recent_requests, "Requests per second"),
+            ("janus_router_model_error_rate", self._recent_errors, "Errors per second"),
+        ):
+            family(name, "gauge", f"{help_text} over the last {RATE_WINDOW_SECONDS}s by model.")
+            for model_id, counter in sorted(counters.items()):
+                lines.append(f"{name}{_labels(model=model_id)} {counter.rate():.6g}")
+
+        family(
+            "janus_router_classification_seconds", "summary", "Routing classification latency."
+        )
+        _summary_lines(lines, "janus_router_classification_seconds", self.classification_latency)
+        family("janus_router_upstream_seconds", "summary", "Upstream model latency by model.")
+        for model_id, histogram in sorted(self.upstream_latency_by_model.items()):
+            _summary_lines(lines, "janus_router_upstream_seconds", histogram, model=model_id)
+
+        return "\n".join(lines) + "\n"
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    pairs = ",".join(f'{key}="{_label_value(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _summary_lines(
+    lines: list[str], name: str, histogram: LatencyHistogram, **labels: str
+) -> None:
+    for q in QUANTILES:
+        lines.append(
+            f"{name}{_labels(**labels, quantile=str(q))} {histogram.quantile(q) / 1000:.6g}"
+        )
+    suffix = _labels(**labels) if labels else ""
+    lines.append(f"{name}_sum{suffix} {histogram.total / 1000:.6g}")
+    lines.append(f"{name}_count{suffix} {histogram.count}")
+
 
 metrics = RoutingMetrics()
@@ -14,7 +14,7 @@ from typing import Any, AsyncIterator, Literal, Optional
 import httpx
 import structlog
 from fastapi import FastAPI, Header, HTTPException, Request, Response
-from fastapi.responses import StreamingResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
 
 from janus_baseline_agent_cli.routing import (
@@ -24,6 +24,7 @@ from janus_baseline_agent_cli.routing import (
     decision_from_model_id,
     decision_requires_agent,
 )
+from janus_baseline_agent_cli.routing_cache import RoutingDecisionCache
 from .classifier import RoutingDecisionClassifier
 from .metrics import metrics
 from .models import ModelConfig, get_fallback_models, get_model_for_decision
@@ -400,7 +401,13 @@ async def startup() -> None:
         or os.environ.get("CHUTES_API_URL")
         or "https://llm.chutes.ai/v1"
     )
-    classifier = RoutingDecisionClassifier(api_key, api_base)
+    cache = RoutingDecisionCache(
+        "classifier",
+        max_entries=int(os.environ.get("ROUTING_CACHE_SIZE", "1024")),
+        ttl_seconds=float(os.environ.get("ROUTING_CACHE_TTL", "3600")),
+        similarity_threshold=float(os.environ.get("ROUTING_CACHE_SIMILARITY", "0")),
+    )
+    classifier = RoutingDecisionClassifier(api_key, api_base, cache=cache)
 
 
 @app.on_event("shutdown")
@@ -431,8 +438,18 @@ async def list_models() -> dict:
 
 @app.get("/v1/router/metrics")
 async def get_metrics() -> dict:
-    """Return routing metrics."""
-    return metrics.to_dict()
+    """Return routing metrics, including this process's classifier decision cache."""
+    payload = metrics.to_dict()
+    payload["decision_cache"] = classifier.cache.stats() if classifier else {}
+    return payload
+
+
+@app.get("/v1/router/metrics/prometheus")
+async def get_prometheus_metrics() -> PlainTextResponse:
+    """Return routing metrics in the Prometheus text format."""
+    return PlainTextResponse(
+        metrics.to_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
 
 
 async def _resolve_routing_decision(
@@ -653,6 +670,7 @@ async def _anthropic_stream_response(
     # synthetic Anthropic stream. Run the call before returning so fallbacks
     # can trigger on failures/empty content.
     if openai_tools or openai_tool_choice is not None:
+        started = time.perf_counter()
         async with httpx.AsyncClient(timeout=model_config.timeout_seconds) as client:
             response = await client.post(
                 f"{api_base}/chat/completions",
@@ -663,6 +681,9 @@ async def _anthropic_stream_response(
                 json={**payload, "stream": False},
             )
             response.raise_for_status()
+            metrics.record_upstream_latency(
+                model_config.model_id, (time.perf_counter() - started) * 1000
+            )
             openai_data = response.json()
         if _is_empty_chat_completion(openai_data):
             raise RuntimeError(f"Upstream returned empty content for model {model_config.model_id}")
@@ -686,6 +707,7 @@ async def _anthropic_stream_response(
 
     async def stream_generator() -> AsyncIterator[str]:
         # Stream from OpenAI endpoint and convert to Anthropic deltas
+        started = time.perf_counter()
         async with httpx.AsyncClient(timeout=model_config.timeout_seconds) as client:
             async with client.stream(
                 "POST",
@@ -697,6 +719,9 @@ async def _anthropic_stream_response(
                 json={**payload, "stream": True},
             ) as response:
                 response.raise_for_status()
+                metrics.record_upstream_latency(
+                    model_config.model_id, (time.perf_counter() - started) * 1000
+                )
 
                 # Send message_start event
                 message_start = {
@@ -798,6 +823,7 @@ async def _anthropic_non_stream_response(
     metadata["routing_decision"] = routing_decision.value
     payload["metadata"] = metadata
 
+    started = time.perf_counter()
     async with httpx.AsyncClient(timeout=model_config.timeout_seconds) as client:
         response = await client.post(
             f"{api_base}/chat/completions",
@@ -808,6 +834,9 @@ async def _anthropic_non_stream_response(
             json=payload,
         )
         response.raise_for_status()
+        metrics.record_upstream_latency(
+            model_config.model_id, (time.perf_counter() - started) * 1000
+        )
         openai_data = response.json()
         if _is_empty_chat_completion(openai_data):
             raise RuntimeError(f"Upstream returned empty content for model {model_config.model_id}")
@@ -899,6 +928,7 @@ async def _stream_response(
     """Stream response from the backend model."""
 
     async def stream_generator():
+        started = time.perf_counter()
         async with httpx.AsyncClient(timeout=model_config.timeout_seconds) as client:
             async with client.stream(
                 "POST",
@@ -910,6 +940,9 @@ async def _stream_response(
                 json=_build_payload(request, model_config, stream=True, decision=routing_decision),
             ) as response:
                 response.raise_for_status()
+                metrics.record_upstream_latency(
+                    model_config.model_id, (time.perf_counter() - started) * 1000
+                )
                 async for line in response.aiter_lines():
                     if not line:
                         continue
@@ -946,6 +979,7 @@ async def _non_stream_response(
     routing_decision: RoutingDecision,
 ) -> dict:
     """Return non-streaming response from backend model."""
+    started = time.perf_counter()
     async with httpx.AsyncClient(timeout=model_config.timeout_seconds) as client:
         response = await client.post(
             f"{api_base}/chat/completions",
@@ -956,6 +990,9 @@ async def _non_stream_response(
             json=_build_payload(request, model_config, stream=False, decision=routing_decision),
         )
         response.raise_for_status()
+        metrics.record_upstream_latency(
+            model_config.model_id, (time.perf_counter() - started) * 1000
+        )
         data = response.json()
         if _is_empty_chat_completion(data):
             raise RuntimeError(f"Upstream returned empty content for model {model_config.model_id}")
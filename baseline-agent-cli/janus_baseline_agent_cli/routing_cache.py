@@ -0,0 +1,214 @@
+"""Memoization of routing decisions for repeated and near-duplicate prompts."""
+
+from __future__ import annotations
+
+import random
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Optional, TypeVar
+
+V = TypeVar("V")
+
+# Character shingle length for near-duplicate detection.
+SHINGLE_SIZE = 5
+# MinHash signature length; split into LSH bands of ``MINHASH_ROWS`` rows.
+MINHASH_PERMUTATIONS = 32
+MINHASH_ROWS = 4
+# Only this much of a prompt is shingled; routing looks at the start anyway.
+MAX_SHINGLED_CHARS = 2000
+_MERSENNE_PRIME = (1 << 61) - 1
+
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(MINHASH_PERMUTATIONS)
+]
+
+def normalize_prompt(text: str) -> str:
+    """Lowercase and collapse whitespace.
+
+    Punctuation is kept: "2+2" and "22", or "rm -rf" and "rm rf", must not
+    share a cached decision.
+    """
+    return " ".join(text.lower().split())
+
+
+def minhash_signature(text: str) -> tuple[int, ...]:
+    """MinHash signature of the character shingles of normalized ``text``."""
+    text = text[:MAX_SHINGLED_CHARS]
+    if len(text) <= SHINGLE_SIZE:
+        shingles = {text}
+    else:
+        shingles = {text[i : i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+    hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles]
+    return tuple(
+        min((a * value + b) % _MERSENNE_PRIME for value in hashes) for a, b in _PERMUTATIONS
+    )
+
+
+def _similarity(left: tuple[int, ...], right: tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    expires_at: float
+    signature: Optional[tuple[int, ...]] = None
+
+
+class RoutingDecisionCache(Generic[V]):
+    """LRU cache of routing decisions keyed by normalized prompt and image flag.
+
+    Lookups first try the exact key. When ``similarity_threshold`` is set,
+    misses fall back to a MinHash index over character shingles: locality
+    sensitive hashing buckets narrow the search to candidates sharing a
+    band, and the best candidate at or above the threshold is returned.
+    Entries expire after ``ttl_seconds``; the least recently used entry is
+    evicted when ``max_entries`` is reached.
+
+    Caches are not registered globally; whoever owns one reports its
+    ``stats()`` (the complexity detector on ``/health``, the router on
+    ``/v1/router/metrics``).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        similarity_threshold: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._max_entries = max(max_entries, 0)
+        self._ttl_seconds = ttl_seconds
+        self._similarity_threshold = similarity_threshold
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, bool], _Entry[V]] = OrderedDict()
+        self._bands: dict[tuple[bool, int, tuple[int, ...]], set[str]] = {}
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0
+
+    @property
+    def near_duplicates_enabled(self) -> bool:
+        return self.enabled and self._similarity_threshold > 0
+
+    def get(self, text: str, has_images: bool) -> Optional[V]:
+        """Return the cached decision for ``text``, if any."""
+        if not self.enabled:
+            return None
+        prompt = normalize_prompt(text)
+        key = (prompt, has_images)
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            self._remove(key)
+            self.expirations += 1
+        if self.near_duplicates_enabled and prompt:
+            value = self._near_duplicate(prompt, has_images, now)
+            if value is not None:
+                self.near_hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def set(self, text: str, has_images: bool, value: V) -> None:
+        """Remember the decision made for ``text``."""
+        if not self.enabled:
+            return
+        prompt = normalize_prompt(text)
+        key = (prompt, has_images)
+        if key in self._entries:
+            self._remove(key)
+        signature = minhash_signature(prompt) if self.near_duplicates_enabled and prompt else None
+        self._entries[key] = _Entry(value, self._clock() + self._ttl_seconds, signature)
+        if signature is not None:
+            for band in self._band_keys(has_images, signature):
+                self._bands.setdefault(band, set()).add(prompt)
+        while len(self._entries) > self._max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _near_duplicate(self, prompt: str, has_images: bool, now: float) -> Optional[V]:
+        signature = minhash_signature(prompt)
+        candidates: set[str] = set()
+        for band in self._band_keys(has_images, signature):
+            candidates.update(self._bands.get(band, ()))
+        best: Optional[tuple[float, tuple[str, bool]]] = None
+        for candidate in candidates:
+            key = (candidate, has_images)
+            entry = self._entries.get(key)
+            if entry is None or entry.signature is None:
+                continue
+            if entry.expires_at <= now:
+                self._remove(key)
+                self.expirations += 1
+                continue
+            score = _similarity(signature, entry.signature)
+            if score >= self._similarity_threshold and (best is None or score > best[0]):
+                best = (score, key)
+        if best is None:
+            return None
+        self._entries.move_to_end(best[1])
+        return self._entries[best[1]].value
+
+    @staticmethod
+    def _band_keys(
+        has_images: bool, signature: tuple[int, ...]
+    ) -> list[tuple[bool, int, tuple[int, ...]]]:
+        return [
+            (has_images, start, signature[start : start + MINHASH_ROWS])
+            for start in range(0, len(signature), MINHASH_ROWS)
+        ]
+
+    def _remove(self, key: tuple[str, bool]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None or entry.signature is None:
+            return
+        for band in self._band_keys(key[1], entry.signature):
+            bucket = self._bands.get(band)
+            if bucket is None:
+                continue
+            bucket.discard(key[0])
+            if not bucket:
+                del self._bands[band]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bands.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int | float | bool]:
+        lookups = self.hits + self.near_hits + self.misses
+        return {
+            "name": self.name,
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl_seconds,
+            "similarity_threshold": self._similarity_threshold,
+            "hits": self.hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.near_hits) / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
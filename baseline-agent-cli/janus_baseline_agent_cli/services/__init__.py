@@ -4,7 +4,7 @@ from .llm import LLMService, get_llm_service
 from .memory import MemoryService, get_memory_service
 from .sandy import SandyService, get_sandy_service
 from .complexity import ComplexityDetector, get_complexity_detector
-from .warm_pool import WarmPoolManager
+from .warm_pool import SpeculativeAcquire, WarmPoolManager
 
 __all__ = [
     "LLMService",
@@ -13,6 +13,7 @@ __all__ = [
     "get_memory_service",
     "SandyService",
     "get_sandy_service",
+    "SpeculativeAcquire",
     "WarmPoolManager",
     "ComplexityDetector",
     "get_complexity_detector",
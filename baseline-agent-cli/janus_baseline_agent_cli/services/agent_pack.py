@@ -0,0 +1,74 @@
+"""Agent pack archive built once and uploaded to sandboxes in one request."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import tarfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+# Written next to the extracted pack; holds the manifest hash of the pack
+# that was extracted so later uploads to the same sandbox can be skipped.
+AGENT_PACK_MARKER = ".agent-pack-hash"
+
+
+@dataclass(frozen=True)
+class AgentPackArchive:
+    """Compressed tarball of the agent pack and its manifest hash."""
+
+    data: bytes
+    manifest_hash: str
+    file_count: int
+
+    @property
+    def short_hash(self) -> str:
+        return self.manifest_hash[:12]
+
+
+def _iter_pack_files(root: Path) -> list[Path]:
+    return sorted(
+        (path for path in root.rglob("*") if path.is_file() and "__pycache__" not in path.parts),
+        key=lambda path: path.relative_to(root).as_posix(),
+    )
+
+
+def build_agent_pack_archive(root: Path) -> Optional[AgentPackArchive]:
+    """Build a deterministic ``.tar.gz`` of ``root``.
+
+    The manifest hash covers every file's relative path, mode and content
+    hash, so it only changes when the pack itself does. Timestamps and
+    ownership are normalised so the archive bytes are reproducible too.
+    """
+    if not root.exists():
+        return None
+    files = _iter_pack_files(root)
+    if not files:
+        return None
+
+    manifest = hashlib.sha256()
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as gz:
+        with tarfile.open(fileobj=gz, mode="w", format=tarfile.PAX_FORMAT) as tar:
+            for path in files:
+                rel_path = path.relative_to(root).as_posix()
+                content = path.read_bytes()
+                mode = 0o755 if path.stat().st_mode & 0o111 else 0o644
+                manifest.update(
+                    f"{rel_path}\0{mode:o}\0{hashlib.sha256(content).hexdigest()}\n".encode()
+                )
+                info = tarfile.TarInfo(rel_path)
+                info.size = len(content)
+                info.mode = mode
+                info.mtime = 0
+                info.uid = info.gid = 0
+                info.uname = info.gname = ""
+                tar.addfile(info, io.BytesIO(content))
+
+    return AgentPackArchive(
+        data=buffer.getvalue(),
+        manifest_hash=manifest.hexdigest(),
+        file_count=len(files),
+    )
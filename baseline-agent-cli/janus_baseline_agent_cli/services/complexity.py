@@ -1,8 +1,11 @@
 """Complexity detection service to route between fast and complex paths."""
 
+import asyncio
+from bisect import bisect_left
 from dataclasses import dataclass
 from functools import lru_cache
 import re
+import time
 from typing import Optional
 
 import httpx
@@ -21,7 +24,17 @@ from janus_baseline_agent_cli.routing import (
     decision_from_metadata,
     decision_requires_agent,
 )
+from janus_baseline_agent_cli.routing_cache import RoutingDecisionCache
 from janus_baseline_agent_cli.tools.parser import robust_parse_tool_call
+from janus_baseline_agent_cli.services.keyword_matcher import (
+    KeywordMatcher,
+    KeywordScan,
+    separable_anchors,
+)
+from janus_baseline_agent_cli.services.routing_classifier import (
+    MAX_FEATURE_CHARS,
+    LocalRoutingClassifier,
+)
 from janus_baseline_agent_cli.services.vision import contains_images, count_images
 
 logger = structlog.get_logger()
@@ -35,6 +48,14 @@ ROUTING_MODELS = [
 ]
 ROUTING_MODEL = ROUTING_MODELS[0]  # Default for settings
 
+# Upper bounds (seconds) of the routing latency histogram buckets.
+ROUTING_LATENCY_BUCKETS = (0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+# Observations a model needs before its own latency sets the hedge delay.
+ROUTING_LATENCY_MIN_SAMPLES = 20
+# Counts are halved past this many observations so old latencies fade out.
+ROUTING_LATENCY_MAX_SAMPLES = 1000
+MIN_HEDGE_DELAY_SECONDS = 0.1
+
 TRIVIAL_GREETINGS = {
     "hello",
     "hi",
@@ -101,6 +122,40 @@ _SIMPLE_FACTUAL_COMPILED = [re.compile(p, re.IGNORECASE) for p in SIMPLE_FACTUAL
 URL_PATTERN = re.compile(r'https?://[^\s<>"\']+|www\.[^\s<>"\']+', re.IGNORECASE)
 
 
+class RoutingLatencyHistogram:
+    """Per-model bucketed latency histograms for routing-model calls."""
+
+    def __init__(self, buckets: tuple[float, ...] = ROUTING_LATENCY_BUCKETS) -> None:
+        self._buckets = buckets
+        self._counts: dict[str, list[int]] = {}
+
+    def observe(self, model: str, seconds: float) -> None:
+        counts = self._counts.setdefault(model, [0] * (len(self._buckets) + 1))
+        counts[bisect_left(self._buckets, seconds)] += 1
+        if sum(counts) > ROUTING_LATENCY_MAX_SAMPLES:
+            self._counts[model] = [count // 2 for count in counts]
+
+    def quantile(self, model: str, q: float) -> Optional[float]:
+        """Bucket upper bound at quantile ``q``, or None with too few samples."""
+        counts = self._counts.get(model)
+        total = sum(counts) if counts else 0
+        if not counts or total < ROUTING_LATENCY_MIN_SAMPLES:
+            return None
+        threshold = q * total
+        cumulative = 0
+        for index, count in enumerate(counts):
+            cumulative += count
+            if cumulative >= threshold:
+                return self._buckets[min(index, len(self._buckets) - 1)]
+        return self._buckets[-1]
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        labels = [f"le_{bound}" for bound in self._buckets] + ["le_inf"]
+        return {
+            model: dict(zip(labels, counts)) for model, counts in sorted(self._counts.items())
+        }
+
+
 @dataclass(frozen=True)
 class ComplexityAnalysis:
     """Analysis result for complexity detection."""
@@ -301,11 +356,92 @@ class ComplexityDetector:
         "clip",
     ]
 
+    GENERATION_VERBS = ["generate", "create", "make", "produce", "render"]
+
+    # Requests about attached images that need tools beyond vision
+    IMAGE_AGENT_TRIGGERS = [
+        "search for",
+        "find more",
+        "look up",
+        "write code",
+        "execute",
+        "run this",
+        "compare with",
+        "fetch",
+        "download",
+    ]
+
+    # Hints that a URL in the prompt is meant to be visited or called
+    URL_INTERACTION_HINTS = [
+        "test",
+        "check",
+        "visit",
+        "open",
+        "browse",
+        "verify",
+        "screenshot",
+        "load",
+        "fetch",
+        "scrape",
+        "interact",
+        "click",
+        "submit",
+        "form",
+        "login",
+        "api",
+        "endpoint",
+    ]
+
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
         self._threshold = settings.complexity_threshold
         self._routing_model = settings.llm_routing_model or ROUTING_MODEL
         self._routing_timeout = settings.llm_routing_timeout
+        self._routing_latency = RoutingLatencyHistogram()
+        self._last_scan: tuple[str, KeywordScan] | None = None
+        self._local_classifier = self._load_local_classifier(settings.local_routing_model_path)
+        self._decision_cache: RoutingDecisionCache[tuple[RoutingDecision, str]] = (
+            RoutingDecisionCache(
+                "complexity",
+                max_entries=settings.routing_cache_size,
+                ttl_seconds=settings.routing_cache_ttl,
+                similarity_threshold=settings.routing_cache_similarity,
+            )
+        )
+
+    @staticmethod
+    def _load_local_classifier(path: Optional[str]) -> Optional[LocalRoutingClassifier]:
+        if not path:
+            return None
+        try:
+            classifier = LocalRoutingClassifier.load(path)
+        except Exception as exc:
+            logger.warning("local_routing_model_load_failed", path=path, error=str(exc))
+            return None
+        logger.info(
+            "local_routing_model_loaded",
+            path=path,
+            features=len(classifier.weights),
+            classes=[decision.value for decision in classifier.classes],
+        )
+        return classifier
+
+    def _local_routing_check(
+        self, text: str, has_images: bool
+    ) -> tuple[RoutingDecision | None, str]:
+        """Classify locally; returns no decision below the confidence threshold."""
+        if self._local_classifier is None:
+            return None, "no_local_model"
+        decision, confidence = self._local_classifier.predict(text, has_images)
+        logger.info(
+            "complexity_local_classification",
+            decision=decision.value,
+            confidence=round(confidence, 3),
+            text_preview=text[:100],
+        )
+        if confidence < self._settings.local_routing_confidence:
+            return None, f"low_confidence:{confidence:.2f}"
+        return decision, f"confidence:{confidence:.2f}"
 
     def _get_last_user_message(self, messages: list[Message]) -> Optional[Message]:
         """Get the most recent user message from the list."""
@@ -383,14 +519,46 @@ class ComplexityDetector:
         (r"fass\s+.+\s+zusammen", "zusammenfassung"),
     ]
 
+    # (compiled pattern, keyword, (head, tail) literals the text must contain)
+    _SEPARABLE_VERB_RULES = [
+        (re.compile(pattern), keyword, separable_anchors(pattern))
+        for pattern, keyword in GERMAN_SEPARABLE_VERBS
+    ]
+
+    # Every keyword list above, matched in one pass over the prompt.
+    _KEYWORD_MATCHER = KeywordMatcher(
+        {
+            "complex": COMPLEX_KEYWORDS,
+            "media": MULTIMODAL_KEYWORDS,
+            "generation": GENERATION_VERBS,
+            "image_agent": IMAGE_AGENT_TRIGGERS,
+            "url_hint": URL_INTERACTION_HINTS,
+            "separable": [anchor for _, _, anchors in _SEPARABLE_VERB_RULES for anchor in anchors],
+        }
+    )
+
+    def _scan_keywords(self, text: str) -> KeywordScan:
+        """Scan ``text`` once; analysis checks several keyword groups per prompt."""
+        cached = self._last_scan
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        scan = self._KEYWORD_MATCHER.scan(text)
+        self._last_scan = (text, scan)
+        return scan
+
     def _matched_complex_keywords(self, text: str) -> list[str]:
         """Return complex keywords found in text."""
-        text_lower = text.lower()
-        matches = [keyword for keyword in self.COMPLEX_KEYWORDS if keyword in text_lower]
-
-        # Also check German separable verb patterns
-        for pattern, keyword in self.GERMAN_SEPARABLE_VERBS:
-            if re.search(pattern, text_lower):
+        scan = self._scan_keywords(text)
+        matches = [keyword for keyword in self.COMPLEX_KEYWORDS if keyword in scan["complex"]]
+
+        # German separable verb patterns only run when both parts are present
+        anchors = scan["separable"]
+        text_lower: str | None = None
+        for pattern, keyword, (head, tail) in self._SEPARABLE_VERB_RULES:
+            if head not in anchors or tail not in anchors:
+                continue
+            text_lower = text.lower() if text_lower is None else text_lower
+            if pattern.search(text_lower):
                 matches.append(keyword)
 
         return matches
@@ -405,33 +573,12 @@ class ComplexityDetector:
 
     def _is_multimodal_request(self, text: str) -> bool:
         """Check if request involves multimodal generation."""
-        text_lower = text.lower()
-        generation_verbs = ["generate", "create", "make", "produce", "render"]
-
-        for verb in generation_verbs:
-            if verb not in text_lower:
-                continue
-            for media in self.MULTIMODAL_KEYWORDS:
-                if media in text_lower:
-                    return True
-
-        return False
+        scan = self._scan_keywords(text)
+        return bool(scan["generation"] and scan["media"])
 
     def _needs_agent_for_images(self, text: str) -> bool:
         """Check if image analysis requires tools beyond vision."""
-        agent_triggers = [
-            "search for",
-            "find more",
-            "look up",
-            "write code",
-            "execute",
-            "run this",
-            "compare with",
-            "fetch",
-            "download",
-        ]
-        text_lower = text.lower()
-        return any(trigger in text_lower for trigger in agent_triggers)
+        return bool(self._scan_keywords(text)["image_agent"])
 
     def _contains_url(self, text: str) -> bool:
         """Check if text contains a URL."""
@@ -441,28 +588,7 @@ class ComplexityDetector:
         """Check if URL context suggests browser/API interaction."""
         if not self._contains_url(text):
             return False
-
-        interaction_hints = [
-            "test",
-            "check",
-            "visit",
-            "open",
-            "browse",
-            "verify",
-            "screenshot",
-            "load",
-            "fetch",
-            "scrape",
-            "interact",
-            "click",
-            "submit",
-            "form",
-            "login",
-            "api",
-            "endpoint",
-        ]
-        text_lower = text.lower()
-        return any(hint in text_lower for hint in interaction_hints)
+        return bool(self._scan_keywords(text)["url_hint"])
 
     def _flag_reasons(self, flags: GenerationFlags) -> list[str]:
         reasons: list[str] = []
@@ -718,6 +844,87 @@ class ComplexityDetector:
             )
             return None, str(exc), False
 
+    async def _timed_routing_model(
+        self, client: httpx.AsyncClient, model: str, text: str, has_images: bool
+    ) -> tuple[RoutingDecision | None, str, bool]:
+        """Call a routing model and record how long it took.
+
+        A call cancelled by a hedge still records its elapsed time, a lower
+        bound that keeps slow models from looking fast.
+        """
+        start = time.monotonic()
+        try:
+            return await self._try_routing_model(client, model, text, has_images)
+        finally:
+            self._routing_latency.observe(model, time.monotonic() - start)
+
+    def _hedge_delay(self, model: str) -> float:
+        """Seconds to wait on ``model`` before racing the next routing model."""
+        observed = self._routing_latency.quantile(
+            model, self._settings.llm_routing_hedge_quantile
+        )
+        delay = observed if observed is not None else self._settings.llm_routing_hedge_delay
+        return min(max(delay, MIN_HEDGE_DELAY_SECONDS), self._routing_timeout)
+
+    async def _hedged_routing_check(
+        self,
+        client: httpx.AsyncClient,
+        models: list[str],
+        text: str,
+        has_images: bool,
+    ) -> tuple[str, RoutingDecision | None, str] | None:
+        """Race routing models, starting the next one when the current is slow.
+
+        The primary starts immediately. The next model starts once the
+        primary has been running longer than its hedge delay (its observed
+        latency quantile) or as soon as it fails. The first tool-call
+        decision wins and the other calls are cancelled. Without one, the
+        first answered call is returned, or None if every model failed.
+        """
+        pending: dict[asyncio.Task[tuple[RoutingDecision | None, str, bool]], str] = {}
+        answered: tuple[str, RoutingDecision | None, str] | None = None
+        next_index = 0
+
+        def launch() -> None:
+            nonlocal next_index
+            model = models[next_index]
+            next_index += 1
+            task = asyncio.create_task(self._timed_routing_model(client, model, text, has_images))
+            pending[task] = model
+
+        try:
+            while True:
+                if not pending:
+                    if answered is not None or next_index >= len(models):
+                        return answered
+                    launch()
+                can_hedge = next_index < len(models)
+                delay = self._hedge_delay(models[next_index - 1]) if can_hedge else None
+                done, _ = await asyncio.wait(
+                    pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    logger.info(
+                        "llm_routing_hedged",
+                        slow_model=models[next_index - 1],
+                        hedge_model=models[next_index],
+                        delay_seconds=round(delay or 0.0, 3),
+                    )
+                    launch()
+                    continue
+                for task in done:
+                    model = pending.pop(task)
+                    decision, reason, success = task.result()
+                    if success and decision is not None:
+                        return model, decision, reason
+                    if success and answered is None:
+                        answered = model, decision, reason
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
     @log_function_call
     async def _llm_routing_check(
         self, text: str, has_images: bool
@@ -726,24 +933,45 @@ class ComplexityDetector:
         if not self._settings.openai_api_key:
             return None, "no_api_key"
 
+        cached = self._decision_cache.get(text, has_images)
+        if cached is not None:
+            logger.info(
+                "llm_routing_cache_hit",
+                decision=cached[0].value,
+                reason=cached[1],
+                text_preview=text[:100],
+            )
+            return cached
+
         # Try each model in order until one succeeds
         models_to_try = [self._routing_model] + [
             m for m in ROUTING_MODELS if m != self._routing_model
         ]
 
         async with httpx.AsyncClient(timeout=self._routing_timeout) as client:
-            for model in models_to_try:
-                decision, reason, success = await self._try_routing_model(
-                    client, model, text, has_images
-                )
-                if success:
-                    logger.info(
-                        "llm_routing_success",
-                        model=model,
-                        decision=decision.value if decision else None,
-                        reason=reason,
+            if self._settings.llm_routing_hedge:
+                result = await self._hedged_routing_check(client, models_to_try, text, has_images)
+            else:
+                result = None
+                for model in models_to_try:
+                    decision, reason, success = await self._timed_routing_model(
+                        client, model, text, has_images
                     )
-                    return decision, reason
+                    if success:
+                        result = model, decision, reason
+                        break
+
+        if result is not None:
+            model, decision, reason = result
+            logger.info(
+                "llm_routing_success",
+                model=model,
+                decision=decision.value if decision else None,
+                reason=reason,
+            )
+            if decision is not None:
+                self._decision_cache.set(text, has_images, (decision, reason))
+            return decision, reason
 
         # All models failed
         return None, "llm_check_error: all models unavailable"
@@ -795,14 +1023,22 @@ class ComplexityDetector:
         if not normalized:
             return first_pass
 
-        decision, reason = await self._llm_routing_check(text, first_pass.has_images)
-        logger.info(
-            "complexity_llm_verification",
-            decision=decision.value if decision else None,
-            reason=reason,
-            model=self._routing_model,
-            text_preview=text[:100],
-        )
+        verification = "local_classifier"
+        decision, reason = self._local_routing_check(text, first_pass.has_images)
+        if decision is None:
+            verification = "llm_verification"
+            decision, reason = await self._llm_routing_check(text, first_pass.has_images)
+            logger.info(
+                "complexity_llm_verification",
+                decision=decision.value if decision else None,
+                reason=reason,
+                model=self._routing_model,
+                text_preview=text[:100],
+                # Exactly what the local classifier featurizes, so logged
+                # decisions can train it without train/serve skew.
+                routing_text=text[:MAX_FEATURE_CHARS],
+                has_images=first_pass.has_images,
+            )
 
         if decision is None:
             logger.warning(
@@ -832,7 +1068,7 @@ class ComplexityDetector:
         )
 
         reason_override = (
-            first_pass.reason if first_pass.is_complex else f"llm_verification: {reason}"
+            first_pass.reason if first_pass.is_complex else f"{verification}: {reason}"
         )
         return self._apply_decision(first_pass, decision, reason=reason_override)
 
@@ -850,6 +1086,10 @@ class ComplexityDetector:
         analysis = self.analyze(messages, flags)
         return analysis.is_complex, analysis.reason
 
+    def routing_cache_stats(self) -> dict[str, int | float | bool | str]:
+        """Hit/miss counters of the LLM routing decision cache."""
+        return self._decision_cache.stats()
+
 
 @lru_cache
 def get_complexity_detector() -> ComplexityDetector:
@@ -0,0 +1,111 @@
+"""Local hashed n-gram classifier for routing decisions.
+
+The model is a multinomial logistic regression over hashed word and
+character n-grams. It is trained offline (``scripts/train_routing_classifier.py``)
+from logged routing-model decisions and stored as sparse JSON weights, so
+inference needs no third-party packages and takes microseconds.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from janus_baseline_agent_cli.routing import RoutingDecision
+
+DEFAULT_FEATURE_DIM = 1 << 18
+IMAGES_FEATURE = "__has_images__"
+CHAR_NGRAM = 4
+# Only the start of a prompt is featurized, as the routing model sees it.
+MAX_FEATURE_CHARS = 2000
+
+
+def _normalize(text: str) -> str:
+    cleaned = "".join(ch if ch.isalnum() else " " for ch in text.lower()[:MAX_FEATURE_CHARS])
+    return " ".join(cleaned.split())
+
+
+def extract_features(
+    text: str, has_images: bool, dim: int = DEFAULT_FEATURE_DIM
+) -> dict[int, float]:
+    """Hashed, L2-normalized word 1-2 gram and char 4-gram counts."""
+    normalized = _normalize(text)
+    words = normalized.split()
+    grams = [f"w:{word}" for word in words]
+    grams.extend(f"b:{left} {right}" for left, right in zip(words, words[1:]))
+    padded = f" {normalized} "
+    grams.extend(
+        f"c:{padded[i : i + CHAR_NGRAM]}" for i in range(len(padded) - CHAR_NGRAM + 1)
+    )
+    if has_images:
+        grams.append(IMAGES_FEATURE)
+
+    counts: dict[int, float] = {}
+    for gram in grams:
+        index = zlib.crc32(gram.encode("utf-8")) % dim
+        counts[index] = counts.get(index, 0.0) + 1.0
+    features = {index: 1.0 + math.log(count) for index, count in counts.items()}
+    norm = math.sqrt(sum(value * value for value in features.values()))
+    if norm:
+        features = {index: value / norm for index, value in features.items()}
+    return features
+
+
+@dataclass
+class LocalRoutingClassifier:
+    """Softmax classifier over hashed features with sparse per-feature weights."""
+
+    classes: list[RoutingDecision]
+    weights: dict[int, list[float]]
+    bias: list[float]
+    dim: int = DEFAULT_FEATURE_DIM
+
+    def predict_proba(self, text: str, has_images: bool) -> list[float]:
+        scores = list(self.bias)
+        for index, value in extract_features(text, has_images, self.dim).items():
+            row = self.weights.get(index)
+            if row is None:
+                continue
+            for class_index, weight in enumerate(row):
+                scores[class_index] += weight * value
+        top = max(scores)
+        exps = [math.exp(score - top) for score in scores]
+        total = sum(exps)
+        return [value / total for value in exps]
+
+    def predict(self, text: str, has_images: bool) -> tuple[RoutingDecision, float]:
+        """Return the most likely decision and its probability."""
+        probabilities = self.predict_proba(text, has_images)
+        best = max(range(len(probabilities)), key=probabilities.__getitem__)
+        return self.classes[best], probabilities[best]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "dim": self.dim,
+            "classes": [decision.value for decision in self.classes],
+            "bias": self.bias,
+            "weights": {str(index): row for index, row in self.weights.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "LocalRoutingClassifier":
+        return cls(
+            classes=[RoutingDecision(value) for value in payload["classes"]],
+            weights={
+                int(index): [float(weight) for weight in row]
+                for index, row in payload.get("weights", {}).items()
+            },
+            bias=[float(value) for value in payload["bias"]],
+            dim=int(payload.get("dim", DEFAULT_FEATURE_DIM)),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LocalRoutingClassifier":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict(), separators=(",", ":")), encoding="utf-8")
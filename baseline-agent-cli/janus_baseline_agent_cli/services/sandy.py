@@ -3,16 +3,18 @@
 import asyncio
 import base64
 import hashlib
+import importlib.util
 import json
 import mimetypes
 import re
 import shlex
 import time
 import uuid
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, AsyncGenerator, Callable, Optional
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Optional
 
 import httpx
 import structlog
@@ -35,17 +37,24 @@ from janus_baseline_agent_cli.models import (
     Usage,
 )
 from janus_baseline_agent_cli.models.debug import DebugEventType
+from janus_baseline_agent_cli.services.agent_pack import (
+    AGENT_PACK_MARKER,
+    AgentPackArchive,
+    build_agent_pack_archive,
+)
 from janus_baseline_agent_cli.services.debug import DebugEmitter
 from janus_baseline_agent_cli.services.vision import contains_images, get_image_urls
 from janus_baseline_agent_cli.services.response_processor import process_agent_response
 from janus_baseline_agent_cli.tracing import get_request_id
 from janus_baseline_agent_cli.routing import decision_from_metadata, model_for_decision
+from janus_baseline_agent_cli.sse_decoder import SSEDecoder
 
 logger = structlog.get_logger()
 
 CLAUDE_AGENT_DEFAULT_MODEL = "janus-router"
 _TOOL_RESULT_PATH_RE = re.compile(r"Full output saved to:\s*(\S+)")
 _DATA_IMAGE_URL_RE = re.compile(r"data:(image/[^;]+);base64,([A-Za-z0-9+/=\s]+)")
+_SHA256_RE = re.compile(r"[0-9a-f]{64}")
 _LONG_OPERATION_INDICATORS = {
     "git clone": "Cloning repository...",
     "npm install": "Installing dependencies...",
@@ -88,36 +97,61 @@ _AGENT_BINARY_NAMES = {
     "builtin": "builtin",
 }
 
+# The sandbox event log is tailed between these poll intervals, backing off
+# while no events arrive; one read returns at most EVENT_LOG_READ_BYTES.
+EVENT_LOG_POLL_MIN_SECONDS = 0.5
+EVENT_LOG_POLL_MAX_SECONDS = 2.0
+EVENT_LOG_READ_BYTES = 16 * 1024 * 1024
+
+# Agent API events logged in full: the first few, then every Nth.
+AGENT_EVENT_LOG_HEAD = 3
+AGENT_EVENT_LOG_EVERY = 50
+
+# Concurrent file reads when artifacts have to be transferred.
+ARTIFACT_READ_CONCURRENCY = 4
+
+_KNOWN_AGENT_BINARIES = frozenset(_AGENT_BINARY_NAMES.values()) - {"builtin"}
+
 _CLI_FALLBACK_AGENTS = {"roo-code", "cline"}
 
+# After a failed snapshot build, sandboxes are created the regular way for
+# this long before another template is attempted.
+SNAPSHOT_RETRY_SECONDS = 600.0
+
 
 def _parse_sse_events(data: str) -> list[dict[str, Any]]:
     """Parse SSE event data into a list of JSON events."""
+    decoder = SSEDecoder()
     events: list[dict[str, Any]] = []
-    current_data = ""
-
-    for line in data.split("\n"):
-        if line.startswith("data: "):
-            current_data += line[6:]
-        elif line == "" and current_data:
-            try:
-                parsed = json.loads(current_data)
-                events.append(parsed)
-            except json.JSONDecodeError:
-                pass
-            current_data = ""
-
-    # Handle any remaining data
-    if current_data:
+    for event in decoder.feed(data.encode("utf-8")) + decoder.flush():
         try:
-            parsed = json.loads(current_data)
-            events.append(parsed)
+            parsed = json.loads(event.data)
         except json.JSONDecodeError:
-            pass
-
+            continue
+        events.append(parsed)
     return events
 
 
+def _agent_event_payloads(data: str) -> list[dict[str, Any]]:
+    """Turn one agent API SSE event's data into event dicts.
+
+    Non-JSON data is surfaced as ``output`` text. Events that pack several
+    JSON documents on separate ``data:`` lines are split back up.
+    """
+    try:
+        parsed = json.loads(data)
+    except json.JSONDecodeError:
+        if "\n" not in data:
+            return [{"type": "output", "text": data}] if data.strip() else []
+        payloads: list[dict[str, Any]] = []
+        for line in data.split("\n"):
+            payloads.extend(_agent_event_payloads(line))
+        return payloads
+    if not isinstance(parsed, dict):
+        return [{"type": "output", "text": data}]
+    return [parsed]
+
+
 def _strip_ansi(text: str) -> str:
     """Strip ANSI escape codes from text."""
     text = re.sub(r"\x1b\[[0-9;]*m", "", text)
@@ -301,6 +335,23 @@ class ExecResult:
     exit_code: int
 
 
+@dataclass
+class EventLogCursor:
+    """Byte offset of the next unread line in the sandbox event log."""
+
+    offset: int = 0
+
+
+@dataclass
+class ArtifactManifestEntry:
+    """Artifact file as described by the in-sandbox manifest command."""
+
+    path: str
+    size_bytes: int | None = None
+    sha256: str | None = None
+    mime_type: str | None = None
+
+
 class SandyService:
     """Service for executing tasks in Sandy sandboxes."""
 
@@ -324,7 +375,12 @@ class SandyService:
         self._base_url = settings.sandy_base_url
         self._api_key = settings.sandy_api_key
         self._timeout = settings.sandy_agent_timeout
-        self._client_factory = client_factory or httpx.AsyncClient
+        # Injected factories (tests) get a client per call; otherwise every
+        # call shares one pooled client, see ``_session``.
+        self._client_factory = client_factory
+        self._client: httpx.AsyncClient | None = None
+        self._http_requests = 0
+        self._http_connections_opened = 0
         self._baseline_root = Path(__file__).resolve().parents[2]
         self._agent_pack_path = self._resolve_path(settings.agent_pack_path)
         self._system_prompt_path = self._resolve_path(settings.system_prompt_path)
@@ -333,17 +389,85 @@ class SandyService:
         self._artifact_ttl = settings.artifact_ttl_seconds
         self._artifact_grace_seconds = settings.artifact_grace_seconds
         self._screenshot_dir = f"{self._artifact_dir.rstrip('/')}/screenshots"
+        self._event_log_path = f"{self._screenshot_dir}/events.jsonl"
         self._baseline_agent = settings.baseline_agent.strip() if settings.baseline_agent else "aider"
+        self._agent_pack_archive: AgentPackArchive | None = None
+        # Sandbox id -> manifest hash of the agent pack known to be extracted there.
+        self._agent_pack_hashes: dict[str, str] = {}
+        # Sandboxes this process just created, known not to carry any pack yet.
+        self._fresh_sandboxes: set[str] = set()
+        # Snapshot mode: (agent-pack manifest hash, snapshot id) of the template.
+        self._snapshot: tuple[str, str] | None = None
+        self._snapshot_task: asyncio.Task[None] | None = None
+        self._snapshot_retry_at = 0.0
+        self._snapshot_sandboxes: set[str] = set()
+        # Agent binary probe results: sandbox id -> (agent-pack hash, result),
+        # and agent-pack hash -> result for sandboxes restored from a snapshot.
+        self._agent_binary_cache: dict[str, tuple[str, dict[str, str | None]]] = {}
+        self._snapshot_agent_binaries: dict[str, dict[str, str | None]] = {}
 
     @property
     def is_available(self) -> bool:
         """Check if Sandy is configured."""
         return bool(self._base_url)
 
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the client for one logical operation."""
+        if self._client_factory is not None:
+            async with self._client_factory() as client:
+                yield client
+            return
+        yield self._shared_client()
+
+    def _shared_client(self) -> httpx.AsyncClient:
+        """Long-lived pooled client to the Sandy API, created lazily.
+
+        Callers pass per-request timeouts; the client default only covers
+        calls that do not.
+        """
+        if self._client is None or self._client.is_closed:
+            http2 = self._settings.sandy_http2 and importlib.util.find_spec("h2") is not None
+            self._client = httpx.AsyncClient(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=self._settings.sandy_max_connections,
+                    max_keepalive_connections=self._settings.sandy_max_keepalive_connections,
+                ),
+                timeout=httpx.Timeout(float(self._settings.http_client_timeout)),
+                event_hooks={"request": [self._on_request]},
+            )
+        return self._client
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        self._http_requests += 1
+        request.extensions["trace"] = self._on_trace
+
+    async def _on_trace(self, event_name: str, info: dict[str, Any]) -> None:
+        # Emitted by httpcore only when a new TCP connection is opened.
+        if event_name == "connection.connect_tcp.complete":
+            self._http_connections_opened += 1
+
+    def connection_stats(self) -> dict[str, int | float]:
+        """Requests sent over the shared client and how many reused a connection."""
+        reused = max(self._http_requests - self._http_connections_opened, 0)
+        return {
+            "requests": self._http_requests,
+            "connections_opened": self._http_connections_opened,
+            "reused": reused,
+            "reuse_ratio": round(reused / self._http_requests, 3) if self._http_requests else 0.0,
+        }
+
+    async def aclose(self) -> None:
+        """Close the shared Sandy API client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     @log_function_call
     async def create_sandbox(self) -> str:
         """Create a new sandbox and return its ID."""
-        async with self._client_factory() as client:
+        async with self._session() as client:
             result = await self._create_sandbox(client)
         if not result:
             raise RuntimeError("Failed to create sandbox")
@@ -353,7 +477,7 @@ class SandyService:
     @log_function_call
     async def exec(self, sandbox_id: str, command: str) -> ExecResult:
         """Execute a command in a sandbox."""
-        async with self._client_factory() as client:
+        async with self._session() as client:
             stdout, stderr, exit_code = await self._exec_in_sandbox(
                 client, sandbox_id, command
             )
@@ -363,7 +487,7 @@ class SandyService:
     async def write_file(self, sandbox_id: str, path: str, content: str | bytes) -> bool:
         """Write a file into the sandbox."""
         data = content.encode("utf-8") if isinstance(content, str) else content
-        async with self._client_factory() as client:
+        async with self._session() as client:
             if await self._write_file(client, sandbox_id, path, data):
                 return True
             return await self._write_file_via_exec(client, sandbox_id, path, data)
@@ -371,7 +495,7 @@ class SandyService:
     @log_function_call
     async def read_file(self, sandbox_id: str, path: str) -> str:
         """Read a file from the sandbox."""
-        async with self._client_factory() as client:
+        async with self._session() as client:
             data = await self._read_file(client, sandbox_id, path)
         if data is None:
             raise FileNotFoundError(path)
@@ -380,22 +504,41 @@ class SandyService:
     @log_function_call
     async def terminate(self, sandbox_id: str) -> None:
         """Terminate a sandbox."""
-        async with self._client_factory() as client:
+        async with self._session() as client:
             await self._terminate_sandbox(client, sandbox_id)
 
     @log_function_call
-    async def check_sandbox(self, sandbox_id: str) -> bool:
+    async def check_sandbox(self, sandbox_id: str, timeout: float | None = None) -> bool:
         """Check whether a sandbox is responsive."""
-        async with self._client_factory() as client:
-            _, _, exit_code = await self._exec_in_sandbox(client, sandbox_id, "true")
+        async with self._session() as client:
+            _, _, exit_code = await self._exec_in_sandbox(
+                client, sandbox_id, "true", timeout=timeout
+            )
         return exit_code == 0
 
+    @log_function_call
+    async def check_sandboxes(
+        self, sandbox_ids: list[str], timeout: float | None = None
+    ) -> dict[str, bool]:
+        """Probe several sandboxes concurrently over one client."""
+        async with self._session() as client:
+            results = await asyncio.gather(
+                *(
+                    self._exec_in_sandbox(client, sandbox_id, "true", timeout=timeout)
+                    for sandbox_id in sandbox_ids
+                )
+            )
+        return {
+            sandbox_id: exit_code == 0
+            for sandbox_id, (_, _, exit_code) in zip(sandbox_ids, results)
+        }
+
     @log_function_call
     async def reset_sandbox(self, sandbox_id: str) -> None:
         """Reset sandbox state for reuse."""
         artifact_dir = shlex.quote(self._artifact_dir.rstrip("/"))
         command = f"rm -rf -- {artifact_dir} && mkdir -p {artifact_dir}"
-        async with self._client_factory() as client:
+        async with self._session() as client:
             await self._exec_in_sandbox(client, sandbox_id, command)
 
     @log_function_call
@@ -407,7 +550,7 @@ class SandyService:
         """Create and warm a sandbox with the agent pack bootstrapped."""
         if not self.is_available:
             return None
-        async with self._client_factory() as client:
+        async with self._session() as client:
             sandbox_info = await self._create_sandbox(client)
             if not sandbox_info:
                 return None
@@ -485,11 +628,18 @@ class SandyService:
         """Get the agent pack destination path inside the sandbox."""
         return "/workspace/agent-pack"
 
-    def _iter_agent_pack_files(self) -> list[Path]:
-        """Collect agent pack files to upload."""
-        if not self._agent_pack_path.exists():
-            return []
-        return [path for path in self._agent_pack_path.rglob("*") if path.is_file()]
+    def agent_pack_archive(self) -> Optional[AgentPackArchive]:
+        """Get the agent pack archive, building it on first use."""
+        if self._agent_pack_archive is None:
+            self._agent_pack_archive = build_agent_pack_archive(self._agent_pack_path)
+            if self._agent_pack_archive:
+                logger.info(
+                    "agent_pack_archive_built",
+                    manifest_hash=self._agent_pack_archive.short_hash,
+                    files=self._agent_pack_archive.file_count,
+                    size_bytes=len(self._agent_pack_archive.data),
+                )
+        return self._agent_pack_archive
 
     def _artifact_url_base(self, sandbox_id: str, public_url: str | None) -> str:
         """Resolve the base URL for sandbox artifacts."""
@@ -548,6 +698,9 @@ class SandyService:
             "JANUS_ARTIFACTS_DIR": self._artifact_dir,
             "JANUS_ARTIFACT_PORT": str(self._artifact_port),
             "JANUS_SCREENSHOT_DIR": self._screenshot_dir,
+            "JANUS_EVENT_LOG": self._event_log_path,
+            "JANUS_SCREENSHOT_MAX_WIDTH": str(self._settings.screenshot_max_width),
+            "JANUS_SCREENSHOT_FORMAT": self._settings.screenshot_format,
             "JANUS_VISION_MODEL": self._settings.vision_model_primary,
             "JANUS_VISION_FALLBACK": self._settings.vision_model_fallback,
             "JANUS_HAS_IMAGES": str(has_images).lower(),
@@ -1005,53 +1158,25 @@ class SandyService:
             baseline_agent_config=self._baseline_agent,
             path=self._default_path,
         )
-
-        # First, log what's available in the PATH for debugging
-        path_check_cmd = (
-            "PATH="
-            f"{shlex.quote(self._default_path)} "
-            "ls -la /root/.local/bin/ 2>/dev/null || echo 'No /root/.local/bin'; "
-            "which aider claude opencode openhands codex roo-code-cli cline 2>/dev/null "
-            "|| echo 'None found in PATH'"
-        )
-        path_stdout, path_stderr, _ = await self._exec_in_sandbox(
-            client, sandbox_id, path_check_cmd
-        )
-        logger.info(
-            "agent_path_debug",
-            path_contents=path_stdout[:500] if path_stdout else "",
-            path_errors=path_stderr[:200] if path_stderr else "",
-        )
+        binaries = {
+            candidate: self._agent_binary_name(self._normalize_agent_name(candidate))
+            for candidate in candidates
+            if candidate != "builtin"
+        }
+        found = await self._agent_binaries(client, sandbox_id, set(binaries.values()))
 
         for candidate in candidates:
             if candidate == "builtin":
                 logger.info("agent_selected", agent="builtin", reason="fallback_reached")
                 return "builtin"
-
-            binary_name = self._agent_binary_name(
-                self._normalize_agent_name(candidate)
-            )
-
-            check_cmd = f"PATH={shlex.quote(self._default_path)} command -v {shlex.quote(binary_name)}"
-            stdout, stderr, exit_code = await self._exec_in_sandbox(
-                client,
-                sandbox_id,
-                check_cmd,
-            )
-            logger.info(
-                "agent_check",
-                candidate=candidate,
-                binary_name=binary_name,
-                exit_code=exit_code,
-                found_path=stdout.strip() if stdout else "",
-                stderr=stderr.strip()[:200] if stderr else "",
-            )
-            if exit_code == 0 and stdout.strip():
+            binary_name = binaries[candidate]
+            path = found.get(binary_name)
+            if path:
                 logger.info(
                     "agent_selected",
                     agent=candidate,
                     binary_name=binary_name,
-                    path=stdout.strip(),
+                    path=path,
                     reason="found_in_path",
                 )
                 return candidate
@@ -1059,6 +1184,55 @@ class SandyService:
         logger.warning("agent_selected", agent="builtin", reason="no_candidates_found_in_path")
         return "builtin"
 
+    async def _agent_binaries(
+        self,
+        client: httpx.AsyncClient,
+        sandbox_id: str,
+        required: set[str],
+    ) -> dict[str, str | None]:
+        """Resolve agent binaries in the sandbox PATH (name -> path or None).
+
+        All known agent binaries are probed in one exec. Results are cached
+        per sandbox and agent-pack hash; sandboxes restored from a snapshot
+        share the result of the first one, so reused and snapshot sandboxes
+        need no round trip at all.
+        """
+        pack_hash = self._agent_pack_hashes.get(sandbox_id, "")
+        cached = self._agent_binary_cache.get(sandbox_id)
+        if cached is None and sandbox_id in self._snapshot_sandboxes:
+            snapshot_result = self._snapshot_agent_binaries.get(pack_hash)
+            if snapshot_result is not None:
+                cached = (pack_hash, snapshot_result)
+        if cached and cached[0] == pack_hash and required <= cached[1].keys():
+            logger.info("agent_binaries_cached", sandbox_id=sandbox_id)
+            return cached[1]
+
+        names = sorted(required | _KNOWN_AGENT_BINARIES)
+        command = (
+            f"export PATH={shlex.quote(self._default_path)}; "
+            f"for b in {' '.join(shlex.quote(name) for name in names)}; do "
+            'p=$(command -v "$b" 2>/dev/null) && printf \'%s %s\\n\' "$b" "$p"; '
+            "done; true"
+        )
+        stdout, stderr, exit_code = await self._exec_in_sandbox(client, sandbox_id, command)
+        result: dict[str, str | None] = dict.fromkeys(names)
+        for line in stdout.splitlines():
+            name, _, path = line.strip().partition(" ")
+            if name in result and path:
+                result[name] = path
+        logger.info(
+            "agent_binaries_probed",
+            sandbox_id=sandbox_id,
+            found={name: path for name, path in result.items() if path},
+            exit_code=exit_code,
+            stderr=stderr.strip()[:200] if stderr else "",
+        )
+        if exit_code == 0:
+            self._agent_binary_cache[sandbox_id] = (pack_hash, result)
+            if sandbox_id in self._snapshot_sandboxes:
+                self._snapshot_agent_binaries[pack_hash] = result
+        return result
+
     async def _write_file(
         self,
         client: httpx.AsyncClient,
@@ -1153,83 +1327,94 @@ class SandyService:
             logger.warning("sandy_files_read_error", error=str(e), path=path)
             return None
 
-    async def _list_artifact_paths(
+    async def _artifact_manifest(
         self,
         client: httpx.AsyncClient,
         sandbox_id: str,
-    ) -> list[str]:
-        """List artifact files in the sandbox."""
-        command = f"find {shlex.quote(self._artifact_dir)} -maxdepth 1 -type f"
-        stdout, _, exit_code = await self._exec_in_sandbox(client, sandbox_id, command)
-        if exit_code != 0 or not stdout:
-            return []
-        return [line.strip() for line in stdout.splitlines() if line.strip()]
+    ) -> list[ArtifactManifestEntry]:
+        """Describe artifact files (size, sha256, MIME type) with one exec.
 
-    async def _list_screenshot_metadata_paths(
-        self,
-        client: httpx.AsyncClient,
-        sandbox_id: str,
-    ) -> list[str]:
-        """List screenshot metadata files in the sandbox."""
+        Fields whose probe failed (e.g. ``sha256sum`` is missing) are left
+        unset; callers read files without a checksum instead.
+        """
         command = (
-            f"find {shlex.quote(self._screenshot_dir)} -maxdepth 1 "
-            "-type f -name '*.json' 2>/dev/null"
+            f"find {shlex.quote(self._artifact_dir)} -maxdepth 1 -type f -exec sh -c '"
+            'for f; do printf "%s\\t%s\\t%s\\t%s\\n" "$(wc -c < "$f")" '
+            '"$(sha256sum < "$f" | cut -d" " -f1)" '
+            '"$(file -b --mime-type "$f" 2>/dev/null)" "$f"; done'
+            "' _ {} +"
         )
         stdout, _, exit_code = await self._exec_in_sandbox(client, sandbox_id, command)
         if exit_code != 0 or not stdout:
             return []
-        return [line.strip() for line in stdout.splitlines() if line.strip()]
-
-    async def _load_screenshot_payload(
-        self,
-        client: httpx.AsyncClient,
-        sandbox_id: str,
-        metadata_path: str,
-    ) -> Optional[dict[str, object]]:
-        """Load screenshot metadata and image data into a payload."""
-        metadata_bytes = await self._read_file(client, sandbox_id, metadata_path)
-        if not metadata_bytes:
-            return None
-        try:
-            metadata = json.loads(metadata_bytes.decode("utf-8"))
-        except json.JSONDecodeError:
-            return None
-        if not isinstance(metadata, dict):
-            return None
-
-        image_path = f"{self._screenshot_dir.rstrip('/')}/{Path(metadata_path).stem}.png"
-        image_bytes = await self._read_file(client, sandbox_id, image_path)
-        if not image_bytes:
-            return None
-
-        return {
-            "url": str(metadata.get("url", "")),
-            "title": str(metadata.get("title", "")),
-            "timestamp": float(metadata.get("timestamp", 0.0)),
-            "image_base64": base64.b64encode(image_bytes).decode("utf-8"),
-        }
+        entries: list[ArtifactManifestEntry] = []
+        for line in stdout.splitlines():
+            parts = line.split("\t")
+            if len(parts) != 4:
+                if line.strip():
+                    entries.append(ArtifactManifestEntry(path=line.strip()))
+                continue
+            # A failed probe leaves its field empty; keep whatever parsed.
+            size, sha256, mime_type, path = (part.strip() for part in parts)
+            if not path:
+                continue
+            entries.append(
+                ArtifactManifestEntry(
+                    path=path,
+                    size_bytes=int(size) if size.isdigit() else None,
+                    sha256=sha256 if _SHA256_RE.fullmatch(sha256) else None,
+                    mime_type=mime_type or None,
+                )
+            )
+        return entries
 
     async def _collect_screenshot_events(
         self,
         client: httpx.AsyncClient,
         sandbox_id: str,
-        seen: set[str],
+        cursor: EventLogCursor,
         request_id: str,
         model: str,
     ) -> list[ChatCompletionChunk]:
-        """Collect new screenshot events from the sandbox."""
-        metadata_paths = await self._list_screenshot_metadata_paths(client, sandbox_id)
-        if not metadata_paths:
+        """Collect screenshot events appended to the sandbox event log.
+
+        The agent pack's browser helper appends one JSON line per event;
+        only bytes past ``cursor.offset`` are fetched, in a single exec.
+        """
+        command = (
+            f"tail -c +{cursor.offset + 1} {shlex.quote(self._event_log_path)} 2>/dev/null "
+            f"| head -c {EVENT_LOG_READ_BYTES}"
+        )
+        stdout, _, exit_code = await self._exec_in_sandbox(client, sandbox_id, command)
+        if exit_code != 0 or not stdout:
+            return []
+        # A trailing partial line is re-read once the writer finishes it.
+        complete, newline, _ = stdout.rpartition("\n")
+        if not newline:
+            if len(stdout.encode("utf-8")) >= EVENT_LOG_READ_BYTES:
+                # A single event larger than the read window; skip it.
+                logger.warning("sandbox_event_too_large", sandbox_id=sandbox_id)
+                cursor.offset += len(stdout.encode("utf-8"))
             return []
+        cursor.offset += len(complete.encode("utf-8")) + 1
 
         events: list[ChatCompletionChunk] = []
-        for path in sorted(metadata_paths):
-            if path in seen:
+        for line in complete.splitlines():
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
                 continue
-            payload = await self._load_screenshot_payload(client, sandbox_id, path)
-            if not payload:
+            if not isinstance(event, dict) or event.get("event") != "screenshot":
                 continue
-            seen.add(path)
+            if not event.get("image_base64"):
+                continue
+            payload = {
+                "url": str(event.get("url", "")),
+                "title": str(event.get("title", "")),
+                "timestamp": float(event.get("timestamp", 0.0)),
+                "mime_type": str(event.get("mime_type") or "image/png"),
+                "image_base64": str(event["image_base64"]),
+            }
             events.append(
                 ChatCompletionChunk(
                     id=request_id,
@@ -1317,46 +1502,52 @@ class SandyService:
         sandbox_id: str,
         public_url: str | None,
     ) -> list[Artifact]:
-        """Collect artifact descriptors from the sandbox."""
-        artifact_paths = await self._list_artifact_paths(client, sandbox_id)
-        if not artifact_paths:
+        """Collect artifact descriptors from the sandbox.
+
+        Metadata comes from the in-sandbox manifest, so files are only
+        transferred when they are inlined as data URLs (or when the manifest
+        could not describe them). Those reads run concurrently, bounded by
+        ``ARTIFACT_READ_CONCURRENCY``.
+        """
+        entries = await self._artifact_manifest(client, sandbox_id)
+        if not entries:
             return []
 
-        artifacts: list[Artifact] = []
-        artifact_base = self._artifact_url_base(sandbox_id, public_url)
+        artifact_base = self._artifact_url_base(sandbox_id, public_url).rstrip("/")
+        semaphore = asyncio.Semaphore(ARTIFACT_READ_CONCURRENCY)
 
-        for path in artifact_paths:
-            data = await self._read_file(client, sandbox_id, path)
-            if data is None:
-                continue
-            mime_type, _ = mimetypes.guess_type(path)
-            mime_type = mime_type or "application/octet-stream"
-            size_bytes = len(data)
-            sha256 = hashlib.sha256(data).hexdigest()
-            if mime_type.startswith("image/"):
-                filename = Path(path).name
-                url = f"{artifact_base.rstrip('/')}/{filename}"
+        async def build(entry: ArtifactManifestEntry) -> Artifact | None:
+            filename = Path(entry.path).name
+            mime_type, _ = mimetypes.guess_type(entry.path)
+            mime_type = mime_type or entry.mime_type or "application/octet-stream"
+            inline = not mime_type.startswith("image/") and (
+                entry.size_bytes is None or entry.size_bytes <= self._max_inline_bytes
+            )
+            data: bytes | None = None
+            if inline or entry.sha256 is None:
+                async with semaphore:
+                    data = await self._read_file(client, sandbox_id, entry.path)
+                if data is None:
+                    return None
+            size_bytes = len(data) if data is not None else entry.size_bytes or 0
+            sha256 = hashlib.sha256(data).hexdigest() if data is not None else entry.sha256
+            if data is not None and inline and size_bytes <= self._max_inline_bytes:
+                url = self._build_data_url(data, mime_type)
             else:
-                if size_bytes <= self._max_inline_bytes:
-                    url = self._build_data_url(data, mime_type)
-                else:
-                    filename = Path(path).name
-                    url = f"{artifact_base.rstrip('/')}/{filename}"
-
-            artifacts.append(
-                Artifact(
-                    id=f"artf_{uuid.uuid4().hex[:12]}",
-                    type=self._artifact_type_for(mime_type),
-                    mime_type=mime_type,
-                    display_name=Path(path).name,
-                    size_bytes=size_bytes,
-                    sha256=sha256,
-                    ttl_seconds=self._artifact_ttl,
-                    url=url,
-                )
+                url = f"{artifact_base}/{filename}"
+            return Artifact(
+                id=f"artf_{uuid.uuid4().hex[:12]}",
+                type=self._artifact_type_for(mime_type),
+                mime_type=mime_type,
+                display_name=filename,
+                size_bytes=size_bytes,
+                sha256=sha256,
+                ttl_seconds=self._artifact_ttl,
+                url=url,
             )
 
-        return artifacts
+        results = await asyncio.gather(*(build(entry) for entry in entries))
+        return [artifact for artifact in results if artifact is not None]
 
     def _format_artifact_links(self, artifacts: list[Artifact]) -> str:
         """Render artifact markdown links for responses."""
@@ -1367,32 +1558,69 @@ class SandyService:
     async def _upload_agent_pack(
         self, client: httpx.AsyncClient, sandbox_id: str
     ) -> bool:
-        """Upload the agent pack into the sandbox."""
-        files = self._iter_agent_pack_files()
-        if not files:
+        """Upload the agent pack into the sandbox.
+
+        The pack is sent as one compressed archive and extracted in-sandbox.
+        A marker file records the manifest hash, so a sandbox that already
+        holds the same pack is left untouched. Sandboxes this process just
+        created skip the marker probe, which could only miss.
+        """
+        archive = self.agent_pack_archive()
+        if archive is None:
             logger.error("agent_pack_missing", path=str(self._agent_pack_path))
             return False
+        fresh = sandbox_id in self._fresh_sandboxes
+        self._fresh_sandboxes.discard(sandbox_id)
+        if self._agent_pack_hashes.get(sandbox_id) == archive.manifest_hash:
+            return True
 
         dest_root = self._agent_pack_dest_root()
-        created_dirs: set[str] = set()
-
-        for file_path in files:
-            rel_path = file_path.relative_to(self._agent_pack_path).as_posix()
-            dest_path = f"{dest_root}/{rel_path}"
-            dest_dir = str(Path(dest_path).parent)
-            if dest_dir not in created_dirs:
-                await self._exec_in_sandbox(
-                    client, sandbox_id, f"mkdir -p {shlex.quote(dest_dir)}"
+        marker_path = f"{dest_root}/{AGENT_PACK_MARKER}"
+        if not fresh:
+            stdout, _, exit_code = await self._exec_in_sandbox(
+                client, sandbox_id, f"cat {shlex.quote(marker_path)} 2>/dev/null || true"
+            )
+            if exit_code == 0 and stdout.strip() == archive.manifest_hash:
+                logger.info(
+                    "agent_pack_upload_skipped",
+                    sandbox_id=sandbox_id,
+                    manifest_hash=archive.short_hash,
                 )
-                created_dirs.add(dest_dir)
+                self._agent_pack_hashes[sandbox_id] = archive.manifest_hash
+                return True
 
-            content = file_path.read_bytes()
-            if not await self._write_file(client, sandbox_id, dest_path, content):
-                if not await self._write_file_via_exec(
-                    client, sandbox_id, dest_path, content
-                ):
-                    return False
+        start = time.perf_counter()
+        staging_path = f"/tmp/agent-pack-{archive.short_hash}.tgz.b64"
+        encoded = base64.b64encode(archive.data)
+        if not await self._write_file(client, sandbox_id, staging_path, encoded):
+            if not await self._write_file_via_exec(client, sandbox_id, staging_path, encoded):
+                return False
 
+        staging = shlex.quote(staging_path)
+        dest = shlex.quote(dest_root)
+        command = (
+            f"mkdir -p {dest} && base64 -d {staging} | tar -xzf - -C {dest} && "
+            f"printf %s {archive.manifest_hash} > {shlex.quote(marker_path)} && "
+            f"rm -f {staging}"
+        )
+        stdout, stderr, exit_code = await self._exec_in_sandbox(client, sandbox_id, command)
+        if exit_code != 0:
+            logger.warning(
+                "agent_pack_extract_failed",
+                sandbox_id=sandbox_id,
+                stdout=stdout,
+                stderr=stderr,
+            )
+            return False
+
+        self._agent_pack_hashes[sandbox_id] = archive.manifest_hash
+        logger.info(
+            "agent_pack_uploaded",
+            sandbox_id=sandbox_id,
+            manifest_hash=archive.short_hash,
+            size_bytes=len(archive.data),
+            duration_ms=round((time.perf_counter() - start) * 1000, 2),
+        )
         return True
 
     async def _run_bootstrap(
@@ -1403,13 +1631,15 @@ class SandyService:
         request: ChatCompletionRequest | None = None,
         has_images: bool = False,
     ) -> tuple[str, str, int]:
-        """Run the agent pack bootstrap script inside the sandbox."""
-        env_parts = [
-            f"{key}={shlex.quote(str(value))}"
-            for key, value in self._build_agent_env(
-                sandbox_id, public_url, request, has_images
-            ).items()
-        ]
+        """Run the agent pack bootstrap script inside the sandbox.
+
+        Sandboxes restored from the agent-pack snapshot already carry the
+        installed tooling, so only the per-sandbox start-up steps run there.
+        """
+        env = self._build_agent_env(sandbox_id, public_url, request, has_images)
+        if sandbox_id in self._snapshot_sandboxes:
+            env["JANUS_BOOTSTRAP_SKIP_INSTALL"] = "true"
+        env_parts = [f"{key}={shlex.quote(str(value))}" for key, value in env.items()]
         command = " ".join(
             [
                 "env",
@@ -1423,7 +1653,27 @@ class SandyService:
     async def _create_sandbox(
         self, client: httpx.AsyncClient
     ) -> Optional[tuple[str, str | None]]:
-        """Create a new Sandy sandbox."""
+        """Create a new Sandy sandbox, from the agent-pack snapshot when available."""
+        snapshot = self._current_snapshot() if self._settings.sandy_snapshot_mode else None
+        if snapshot is None:
+            return await self._request_sandbox(client)
+
+        manifest_hash, snapshot_id = snapshot
+        result = await self._request_sandbox(client, snapshot_id)
+        if result is None:
+            logger.warning("sandy_snapshot_create_failed", snapshot_id=snapshot_id)
+            self._snapshot = None
+            return await self._request_sandbox(client)
+        sandbox_id = result[0]
+        self._fresh_sandboxes.discard(sandbox_id)
+        self._agent_pack_hashes[sandbox_id] = manifest_hash
+        self._snapshot_sandboxes.add(sandbox_id)
+        return result
+
+    async def _request_sandbox(
+        self, client: httpx.AsyncClient, snapshot_id: str | None = None
+    ) -> Optional[tuple[str, str | None]]:
+        """Ask Sandy for a sandbox, optionally restored from a snapshot."""
         try:
             payload: dict[str, object] = {
                 "priority": 1,  # Integer priority (1=normal)
@@ -1431,6 +1681,8 @@ class SandyService:
             }
             if self._artifact_port:
                 payload["expose_ports"] = [self._artifact_port]
+            if snapshot_id:
+                payload["snapshot_id"] = snapshot_id
             response = await client.post(
                 f"{self._base_url}/api/sandboxes",
                 json=payload,
@@ -1446,18 +1698,101 @@ class SandyService:
                 return None
             # Sandy returns url, not public_url
             public_url = data.get("url") or data.get("public_url") or data.get("sandbox_url")
+            self._fresh_sandboxes.add(str(sandbox_id))
             return str(sandbox_id), str(public_url) if public_url else None
         except Exception as e:
             logger.error("sandy_create_error", error=str(e))
             return None
 
+    def _current_snapshot(self) -> tuple[str, str] | None:
+        """Return the snapshot for the current agent pack, building one if needed.
+
+        A missing or outdated snapshot is rebuilt in the background; callers
+        fall back to regular sandboxes until it is ready.
+        """
+        archive = self.agent_pack_archive()
+        if archive is None:
+            return None
+        if self._snapshot and self._snapshot[0] == archive.manifest_hash:
+            return self._snapshot
+        building = self._snapshot_task is not None and not self._snapshot_task.done()
+        if not building and time.monotonic() >= self._snapshot_retry_at:
+            self._snapshot_task = asyncio.create_task(self._build_snapshot(archive))
+        return None
+
+    async def _build_snapshot(self, archive: AgentPackArchive) -> None:
+        """Bootstrap a template sandbox and snapshot it for the given pack."""
+        start = time.perf_counter()
+        snapshot_id: str | None = None
+        async with self._session() as client:
+            sandbox_info = await self._request_sandbox(client)
+            if sandbox_info:
+                sandbox_id, public_url = sandbox_info
+                try:
+                    snapshot_id = await self._snapshot_template(
+                        client, sandbox_id, public_url, archive
+                    )
+                except Exception as exc:
+                    logger.warning("sandy_snapshot_error", error=str(exc))
+                finally:
+                    await self._terminate_sandbox(client, sandbox_id)
+
+        if not snapshot_id:
+            self._snapshot_retry_at = time.monotonic() + SNAPSHOT_RETRY_SECONDS
+            logger.warning("sandy_snapshot_unavailable", manifest_hash=archive.short_hash)
+            return
+        self._snapshot = (archive.manifest_hash, snapshot_id)
+        logger.info(
+            "sandy_snapshot_ready",
+            snapshot_id=snapshot_id,
+            manifest_hash=archive.short_hash,
+            duration_ms=round((time.perf_counter() - start) * 1000, 2),
+        )
+
+    async def _snapshot_template(
+        self,
+        client: httpx.AsyncClient,
+        sandbox_id: str,
+        public_url: str | None,
+        archive: AgentPackArchive,
+    ) -> str | None:
+        if not await self._upload_agent_pack(client, sandbox_id):
+            return None
+        _, stderr, exit_code = await self._run_bootstrap(client, sandbox_id, public_url)
+        if exit_code != 0:
+            logger.warning(
+                "sandy_snapshot_bootstrap_failed",
+                sandbox_id=sandbox_id,
+                error=_trim_bootstrap_output(stderr),
+            )
+            return None
+        # Per-sandbox credentials are rewritten by the start-up bootstrap in
+        # every restored sandbox; keep them out of the snapshot itself.
+        await self._exec_in_sandbox(
+            client,
+            sandbox_id,
+            f"rm -f {shlex.quote(self._agent_pack_dest_root() + '/.janus_env')}",
+        )
+        response = await client.post(
+            f"{self._base_url}/api/sandboxes/{sandbox_id}/snapshot",
+            json={"name": f"janus-agent-pack-{archive.short_hash}"},
+            headers=self._get_headers(),
+            timeout=self._settings.http_client_timeout,
+        )
+        response.raise_for_status()
+        data = response.json()
+        snapshot_id = data.get("snapshotId") or data.get("snapshot_id") or data.get("id")
+        return str(snapshot_id) if snapshot_id else None
+
     async def _exec_in_sandbox(
         self,
         client: httpx.AsyncClient,
         sandbox_id: str,
         command: str,
+        timeout: float | None = None,
     ) -> tuple[str, str, int]:
         """Execute a command in a sandbox."""
+        timeout = self._timeout if timeout is None else timeout
         try:
             response = await client.post(
                 f"{self._base_url}/api/sandboxes/{sandbox_id}/exec",
@@ -1467,11 +1802,11 @@ class SandyService:
                 # making the bootstrap phase time out with "Command timed out".
                 json={
                     "command": command,
-                    "timeoutMs": max(1, int(self._timeout)) * 1000,
-                    "timeout": self._timeout,
+                    "timeoutMs": max(1, int(timeout)) * 1000,
+                    "timeout": timeout,
                 },
                 headers=self._get_headers(),
-                timeout=self._timeout,
+                timeout=timeout,
             )
             response.raise_for_status()
             data = response.json()
@@ -1493,6 +1828,10 @@ class SandyService:
         self, client: httpx.AsyncClient, sandbox_id: str
     ) -> None:
         """Terminate a sandbox."""
+        self._agent_pack_hashes.pop(sandbox_id, None)
+        self._fresh_sandboxes.discard(sandbox_id)
+        self._snapshot_sandboxes.discard(sandbox_id)
+        self._agent_binary_cache.pop(sandbox_id, None)
         try:
             await client.post(
                 f"{self._base_url}/api/sandboxes/{sandbox_id}/terminate",
@@ -1505,11 +1844,11 @@ class SandyService:
     async def _terminate_sandbox_after_delay(
         self, sandbox_id: str, delay_seconds: float
     ) -> None:
-        """Terminate a sandbox after a delay using a fresh client."""
+        """Terminate a sandbox after a delay."""
         try:
             if delay_seconds > 0:
                 await asyncio.sleep(delay_seconds)
-            async with self._client_factory() as client:
+            async with self._session() as client:
                 await self._terminate_sandbox(client, sandbox_id)
         except Exception as e:
             logger.warning("sandy_terminate_delayed_error", error=str(e))
@@ -1645,114 +1984,26 @@ class SandyService:
                     return
 
                 # Process SSE stream
-                buffer = ""
+                decoder = SSEDecoder()
                 event_count = 0
-                stop_stream = False
-                async for chunk in response.aiter_text():
-                    buffer += chunk
-                    # Process complete events (lines ending with double newline)
-                    while "\n\n" in buffer:
-                        event_end = buffer.index("\n\n")
-                        event_data = buffer[:event_end]
-                        buffer = buffer[event_end + 2:]
-
-                        for line in event_data.split("\n"):
-                            if not line.startswith("data: "):
-                                continue
-                            data = line[6:]
-                            try:
-                                parsed = json.loads(data)
-                                event_count += 1
-                                event_type = parsed.get("type", "unknown")
-                                if agent == "codex":
-                                    stdout = parsed.get("stdout")
-                                    stderr = parsed.get("stderr")
-                                    if stdout or stderr:
-                                        logger.info(
-                                            "codex_agent_io",
-                                            event_type=event_type,
-                                            stdout_preview=str(stdout)[:300] if stdout else "",
-                                            stderr_preview=str(stderr)[:300] if stderr else "",
-                                        )
-                                # Log detailed event info for debugging
-                                logger.info(
-                                    "agent_api_event",
-                                    event_count=event_count,
-                                    event_type=event_type,
-                                    event_keys=list(parsed.keys()) if isinstance(parsed, dict) else None,
-                                    event_preview=str(parsed)[:500],
-                                )
-                                logger.info(
-                                    "agent_api_sse_event",
-                                    event_count=event_count,
-                                    event_type=event_type,
-                                    event_keys=list(parsed.keys()) if isinstance(parsed, dict) else None,
-                                    event_preview=str(parsed)[:500],
-                                )
-                                if event_type == "complete":
-                                    logger.info(
-                                        "agent_api_complete",
-                                        event_count=event_count,
-                                        success=parsed.get("success"),
-                                        exit_code=parsed.get("exitCode"),
-                                        duration=parsed.get("duration"),
-                                    )
-                                    stop_stream = True
-                                yield parsed
-                            except json.JSONDecodeError:
-                                # Not JSON, yield as raw output
-                                if data.strip():
-                                    logger.debug("agent_api_raw_data", data_preview=data[:200])
-                                    yield {"type": "output", "text": data}
-
-                        if stop_stream:
-                            break
-
-                    if stop_stream:
-                        break
-
-                if stop_stream:
-                    return
-
-                # Process any remaining buffer
-                if buffer.strip():
-                    for line in buffer.split("\n"):
-                        if not line.startswith("data: "):
-                            continue
-                        data = line[6:]
-                        try:
-                            parsed = json.loads(data)
+                finished = False
+                async for raw in response.aiter_bytes():
+                    for event in decoder.feed(raw):
+                        for parsed in _agent_event_payloads(event.data):
                             event_count += 1
-                            event_type = parsed.get("type", "unknown")
-                            if agent == "codex":
-                                stdout = parsed.get("stdout")
-                                stderr = parsed.get("stderr")
-                                if stdout or stderr:
-                                    logger.info(
-                                        "codex_agent_io",
-                                        event_type=event_type,
-                                        stdout_preview=str(stdout)[:300] if stdout else "",
-                                        stderr_preview=str(stderr)[:300] if stderr else "",
-                                    )
-                            logger.info(
-                                "agent_api_sse_event",
-                                event_count=event_count,
-                                event_type=event_type,
-                                event_keys=list(parsed.keys()) if isinstance(parsed, dict) else None,
-                                event_preview=str(parsed)[:500],
-                            )
-                            if event_type == "complete":
-                                logger.info(
-                                    "agent_api_complete",
-                                    event_count=event_count,
-                                    success=parsed.get("success"),
-                                    exit_code=parsed.get("exitCode"),
-                                    duration=parsed.get("duration"),
-                                )
+                            self._log_agent_api_event(agent, parsed, event_count, event.data)
                             yield parsed
-                        except json.JSONDecodeError:
-                            if data.strip():
-                                yield {"type": "output", "text": data}
+                            if parsed.get("type") == "complete":
+                                finished = True
+                                break
+                        if finished:
+                            return
+
+                for event in decoder.flush():
+                    for parsed in _agent_event_payloads(event.data):
+                        event_count += 1
+                        self._log_agent_api_event(agent, parsed, event_count, event.data)
+                        yield parsed
 
         except httpx.TimeoutException as e:
             logger.error("agent_api_timeout", error=str(e))
@@ -1761,6 +2012,47 @@ class SandyService:
             logger.error("agent_api_exception", error=str(e))
             yield {"type": "error", "error": f"Agent execution failed: {e}"}
 
+    def _log_agent_api_event(
+        self,
+        agent: str,
+        parsed: dict[str, Any],
+        event_count: int,
+        raw: str,
+    ) -> None:
+        """Log an agent API event; routine events are sampled."""
+        event_type = parsed.get("type", "unknown")
+        if agent == "codex":
+            stdout = parsed.get("stdout")
+            stderr = parsed.get("stderr")
+            if stdout or stderr:
+                logger.info(
+                    "codex_agent_io",
+                    event_type=event_type,
+                    stdout_preview=str(stdout)[:300] if stdout else "",
+                    stderr_preview=str(stderr)[:300] if stderr else "",
+                )
+        if event_type == "complete":
+            logger.info(
+                "agent_api_complete",
+                event_count=event_count,
+                success=parsed.get("success"),
+                exit_code=parsed.get("exitCode"),
+                duration=parsed.get("duration"),
+            )
+            return
+        if (
+            event_count <= AGENT_EVENT_LOG_HEAD
+            or event_count % AGENT_EVENT_LOG_EVERY == 0
+            or event_type == "error"
+        ):
+            logger.info(
+                "agent_api_event",
+                event_count=event_count,
+                event_type=event_type,
+                event_keys=list(parsed.keys()),
+                event_preview=raw[:500],
+            )
+
     async def _run_agent_via_api_with_retry(
         self,
         client: httpx.AsyncClient,
@@ -2151,7 +2443,7 @@ class SandyService:
 
         sandbox_start = time.perf_counter()
 
-        async with self._client_factory() as client:
+        async with self._session() as client:
             sandbox_info = await self._create_sandbox(client)
             if not sandbox_info:
                 return ChatCompletionResponse(
@@ -2368,7 +2660,7 @@ class SandyService:
 
         sandbox_start = time.perf_counter()
 
-        async with self._client_factory() as client:
+        async with self._session() as client:
             sandbox_info = await self._create_sandbox(client)
 
             if not sandbox_info:
@@ -2531,8 +2823,8 @@ class SandyService:
                 agent_task = asyncio.create_task(
                     self._exec_in_sandbox(client, sandbox_id, command)
                 )
-                screenshot_seen: set[str] = set()
-                poll_interval = 0.5
+                event_cursor = EventLogCursor()
+                poll_interval = EVENT_LOG_POLL_MIN_SECONDS
 
                 while True:
                     try:
@@ -2541,14 +2833,21 @@ class SandyService:
                     except asyncio.TimeoutError:
                         pass
 
-                    for event in await self._collect_screenshot_events(
-                        client, sandbox_id, screenshot_seen, request_id, model
-                    ):
+                    events = await self._collect_screenshot_events(
+                        client, sandbox_id, event_cursor, request_id, model
+                    )
+                    for event in events:
                         yield event
+                    # Back off while the agent is not producing events.
+                    poll_interval = (
+                        EVENT_LOG_POLL_MIN_SECONDS
+                        if events
+                        else min(poll_interval * 2, EVENT_LOG_POLL_MAX_SECONDS)
+                    )
 
                 stdout, stderr, exit_code = await agent_task
                 for event in await self._collect_screenshot_events(
-                    client, sandbox_id, screenshot_seen, request_id, model
+                    client, sandbox_id, event_cursor, request_id, model
                 ):
                     yield event
 
@@ -2763,7 +3062,7 @@ class SandyService:
         recovered_output_parts: list[str] = []
         seen_tool_results: set[str] = set()
 
-        async with self._client_factory() as client:
+        async with self._session() as client:
             sandbox_info = await self._create_sandbox(client)
             if not sandbox_info:
                 if debug_emitter:
@@ -3094,7 +3393,7 @@ class SandyService:
         artifacts_present = False
         termination_scheduled = False
 
-        async with self._client_factory() as client:
+        async with self._session() as client:
             sandbox_url = self._sandbox_url(sandbox_id, public_url)
             try:
                 if not self._system_prompt_path.exists():
@@ -3404,7 +3703,7 @@ class SandyService:
         has_error = False
         exit_code = 0
 
-        async with self._client_factory() as client:
+        async with self._session() as client:
             # Create sandbox (Sandy's agent/run handles the rest)
             sandbox_info = await self._create_sandbox(client)
 
@@ -4177,7 +4476,7 @@ class SandyService:
         artifacts_present = False
         termination_scheduled = False
 
-        async with self._client_factory() as client:
+        async with self._session() as client:
             sandbox_url = self._sandbox_url(sandbox_id, public_url)
             yield ChatCompletionChunk(
                 id=request_id,
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import math
+import time
+from collections import deque
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -20,6 +23,17 @@ from janus_baseline_agent_cli.services.sandy import SandyService
 
 logger = structlog.get_logger()
 
+# Demand (acquire arrivals) is measured over this trailing window when sizing.
+DEMAND_WINDOW_SECONDS = 300.0
+# Provisioning time assumed until the first warm sandbox has been built.
+DEFAULT_PROVISION_SECONDS = 30.0
+PROVISION_EWMA_ALPHA = 0.3
+# Liveness probes run on the hot path, so they give up quickly.
+LIVENESS_PROBE_TIMEOUT = 5.0
+# An unclaimed speculative sandbox goes back to the pool after this long, so
+# a request that never reaches its claim or abandon cannot hold it.
+SPECULATIVE_LEASE_SECONDS = 60.0
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -39,6 +53,10 @@ class WarmSandbox:
     last_exit_code: int = 0
     last_artifacts: bool = False
     termination_scheduled: bool = False
+    # Monotonic time of the last successful health check (creation counts).
+    last_verified: float = 0.0
+    # Set while a request runs; still set on release means it failed mid-run.
+    run_in_progress: bool = False
 
     async def stream(
         self,
@@ -47,8 +65,7 @@ class WarmSandbox:
         baseline_agent_override: str | None = None,
     ) -> AsyncGenerator[ChatCompletionChunk, None]:
         """Stream a request using this sandbox."""
-        self.last_used = _utcnow()
-        self.request_count += 1
+        self._begin_run()
         run_state: dict[str, Any] = {}
         async for chunk in self.sandy_service.execute_via_agent_api_in_sandbox(
             sandbox_id=self.sandbox_id,
@@ -61,6 +78,7 @@ class WarmSandbox:
         ):
             yield chunk
         self._apply_run_state(run_state)
+        self.run_in_progress = False
 
     async def complete(
         self,
@@ -69,8 +87,7 @@ class WarmSandbox:
         baseline_agent_override: str | None = None,
     ) -> ChatCompletionResponse:
         """Run a non-streaming request using this sandbox."""
-        self.last_used = _utcnow()
-        self.request_count += 1
+        self._begin_run()
         run_state: dict[str, Any] = {}
         response = await self.sandy_service.complete_via_agent_api_in_sandbox(
             sandbox_id=self.sandbox_id,
@@ -82,6 +99,7 @@ class WarmSandbox:
             terminate_on_finish=False,
         )
         self._apply_run_state(run_state)
+        self.run_in_progress = False
         return response
 
     async def reset(self) -> None:
@@ -94,7 +112,17 @@ class WarmSandbox:
 
     def is_reusable(self) -> bool:
         """Return whether the sandbox is eligible for reuse."""
-        return not (self.last_error or self.last_artifacts or self.termination_scheduled)
+        return not (
+            self.last_error
+            or self.last_artifacts
+            or self.termination_scheduled
+            or self.run_in_progress
+        )
+
+    def _begin_run(self) -> None:
+        self.last_used = _utcnow()
+        self.request_count += 1
+        self.run_in_progress = True
 
     def _apply_run_state(self, run_state: dict[str, Any]) -> None:
         self.last_error = bool(run_state.get("has_error"))
@@ -104,7 +132,20 @@ class WarmSandbox:
 
 
 class WarmPoolManager:
-    """Manages a pool of pre-warmed Sandy sandboxes."""
+    """Manages a pool of pre-warmed Sandy sandboxes.
+
+    The target size follows demand: it is sized so the acquires expected
+    while a replacement sandbox is being provisioned (arrival rate times the
+    observed provisioning time) are served warm, bounded by ``min_size`` and
+    ``max_size``. With no recent demand the pool shrinks back to
+    ``min_size``. Without explicit bounds the pool stays at ``pool_size``.
+
+    Acquired sandboxes are leased: ``release`` only accepts sandboxes that
+    are currently checked out, and one whose request failed mid-run is
+    quarantined (terminated) instead of being pooled again. Pooled sandboxes
+    are re-probed on acquire once their last health check is older than
+    ``liveness_ttl_seconds``.
+    """
 
     def __init__(
         self,
@@ -114,17 +155,41 @@ class WarmPoolManager:
         max_requests: int = 10,
         maintenance_interval: int = 60,
         refill_on_acquire: bool = True,
+        min_size: int | None = None,
+        max_size: int | None = None,
+        refill_concurrency: int = 1,
+        demand_window_seconds: float = DEMAND_WINDOW_SECONDS,
+        liveness_ttl_seconds: float = 30.0,
     ) -> None:
         self.sandy = sandy_service
-        self.pool_size = max(pool_size, 0)
+        pool_size = max(pool_size, 0)
+        self.min_size = max(pool_size if min_size is None else min_size, 0)
+        self.max_size = max(pool_size if max_size is None else max_size, self.min_size)
+        self.pool_size = min(max(pool_size, self.min_size), self.max_size)
         self.max_age_seconds = max_age_seconds
         self.max_requests = max_requests
         self.maintenance_interval = maintenance_interval
         self.refill_on_acquire = refill_on_acquire
+        self.refill_concurrency = max(refill_concurrency, 1)
+        self.demand_window_seconds = demand_window_seconds
+        self.liveness_ttl_seconds = liveness_ttl_seconds
         self._pool: list[WarmSandbox] = []
+        self._leased: dict[str, WarmSandbox] = {}
         self._lock = asyncio.Lock()
         self._fill_lock = asyncio.Lock()
         self._maintenance_task: asyncio.Task[None] | None = None
+        self._background_tasks: set[asyncio.Task[None]] = set()
+        # (monotonic time, served warm) per acquire within the demand window.
+        self._arrivals: deque[tuple[float, bool]] = deque()
+        self._provision_seconds = DEFAULT_PROVISION_SECONDS
+        self.hits = 0
+        self.misses = 0
+        self._cold_start_seconds_total = 0.0
+        self._acquire_wait_seconds_total = 0.0
+        self.quarantined = 0
+        self.dead_on_acquire = 0
+        self.speculative_claimed = 0
+        self.speculative_abandoned = 0
 
     @property
     def size(self) -> int:
@@ -135,7 +200,7 @@ class WarmPoolManager:
         if not self.sandy.is_available:
             logger.info("warm_pool_disabled", reason="sandy_unavailable")
             return
-        if self.pool_size <= 0:
+        if self.max_size <= 0:
             logger.info("warm_pool_disabled", reason="pool_size_zero")
             return
         await self._fill_pool()
@@ -148,26 +213,49 @@ class WarmPoolManager:
             with suppress(asyncio.CancelledError):
                 await self._maintenance_task
             self._maintenance_task = None
+        for task in list(self._background_tasks):
+            task.cancel()
         await self._drain_pool()
 
     async def acquire(self) -> WarmSandbox | None:
         """Get a warm sandbox from the pool."""
         if not self.sandy.is_available:
             return None
+        start = time.monotonic()
+        sandbox = await self._take_pooled()
+        if sandbox is None:
+            sandbox = await self._create_warm_sandbox()
+            self._record_acquire(start, warm=False)
+            return self._lease(sandbox)
+        self._record_acquire(start, warm=True)
+        return self._lease(sandbox)
+
+    async def _take_pooled(self) -> WarmSandbox | None:
+        """Pop the first live, unexpired pooled sandbox; None once the pool is empty."""
         while True:
             async with self._lock:
                 sandbox = self._pool.pop(0) if self._pool else None
             if sandbox is None:
-                return await self._create_warm_sandbox()
+                return None
             if self._is_expired(sandbox):
                 await sandbox.terminate()
                 continue
-            if self.refill_on_acquire:
-                asyncio.create_task(self._fill_pool())
+            if not await self._verify(sandbox):
+                self.dead_on_acquire += 1
+                logger.warning("warm_sandbox_dead_on_acquire", sandbox_id=sandbox.sandbox_id)
+                await sandbox.terminate()
+                continue
             return sandbox
 
     async def release(self, sandbox: WarmSandbox, reusable: bool = True) -> None:
-        """Return sandbox to pool or terminate."""
+        """Return a leased sandbox to the pool or terminate it."""
+        if self._leased.pop(sandbox.sandbox_id, None) is not sandbox:
+            logger.warning("warm_sandbox_release_without_lease", sandbox_id=sandbox.sandbox_id)
+            return
+        if sandbox.run_in_progress:
+            self.quarantined += 1
+            logger.warning("warm_sandbox_quarantined", sandbox_id=sandbox.sandbox_id)
+            reusable = False
         if not reusable or not sandbox.is_reusable() or self._is_expired(sandbox):
             if sandbox.termination_scheduled:
                 return
@@ -182,23 +270,132 @@ class WarmPoolManager:
 
         await sandbox.terminate()
 
+    def speculate(self) -> SpeculativeAcquire | None:
+        """Start taking a warm sandbox before routing has decided it is needed.
+
+        Returns None when no warm sandbox is pooled: speculation never
+        cold-creates one, and it is not counted as demand until claimed.
+        """
+        if not self.sandy.is_available or not self._pool:
+            return None
+        return SpeculativeAcquire(self)
+
+    async def _take_speculative(self) -> WarmSandbox | None:
+        return self._lease(await self._take_pooled())
+
+    async def _return_unused(self, sandbox: WarmSandbox) -> None:
+        """Put back a leased sandbox that never ran a request, without a reset."""
+        if self._leased.pop(sandbox.sandbox_id, None) is not sandbox:
+            return
+        async with self._lock:
+            if len(self._pool) < self.pool_size:
+                self._pool.append(sandbox)
+                return
+        await sandbox.terminate()
+
+    def _lease(self, sandbox: WarmSandbox | None) -> WarmSandbox | None:
+        if sandbox is not None:
+            self._leased[sandbox.sandbox_id] = sandbox
+        return sandbox
+
+    async def _verify(self, sandbox: WarmSandbox) -> bool:
+        """Probe a pooled sandbox unless it was verified recently."""
+        now = time.monotonic()
+        if now - sandbox.last_verified <= self.liveness_ttl_seconds:
+            return True
+        if not await self.sandy.check_sandbox(
+            sandbox.sandbox_id, timeout=LIVENESS_PROBE_TIMEOUT
+        ):
+            return False
+        sandbox.last_verified = time.monotonic()
+        return True
+
+    def _record_acquire(self, start: float, warm: bool) -> None:
+        now = time.monotonic()
+        wait = now - start
+        self._acquire_wait_seconds_total += wait
+        if warm:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._cold_start_seconds_total += wait
+        self._arrivals.append((now, warm))
+        self._update_target(now)
+        if self.refill_on_acquire:
+            self._spawn(self._fill_pool())
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _arrival_rate(self, now: float) -> float:
+        """Acquires per second over the demand window."""
+        while self._arrivals and now - self._arrivals[0][0] > self.demand_window_seconds:
+            self._arrivals.popleft()
+        return len(self._arrivals) / self.demand_window_seconds
+
+    def _update_target(self, now: float | None = None) -> int:
+        """Recompute the target pool size from recent demand."""
+        now = time.monotonic() if now is None else now
+        rate = self._arrival_rate(now)
+        if not self._arrivals:
+            target = self.min_size
+        else:
+            # Expected acquires while a replacement is provisioned, plus one
+            # spare when requests recently had to wait for a cold sandbox.
+            target = math.ceil(rate * self._provision_seconds)
+            if any(not warm for _, warm in self._arrivals):
+                target += 1
+        target = min(max(target, self.min_size), self.max_size)
+        if target != self.pool_size:
+            logger.info(
+                "warm_pool_target_changed",
+                previous=self.pool_size,
+                target=target,
+                arrivals_per_minute=round(rate * 60, 2),
+                provision_seconds=round(self._provision_seconds, 2),
+            )
+            self.pool_size = target
+        return target
+
     async def _fill_pool(self) -> None:
-        """Fill pool to target size."""
+        """Fill pool to target size, preparing up to ``refill_concurrency`` at once."""
         async with self._fill_lock:
             while True:
                 async with self._lock:
                     missing = self.pool_size - len(self._pool)
                 if missing <= 0:
                     return
-                sandbox = await self._create_warm_sandbox()
-                if sandbox is None:
+                batch = await asyncio.gather(
+                    *(
+                        self._create_warm_sandbox()
+                        for _ in range(min(missing, self.refill_concurrency))
+                    )
+                )
+                for sandbox in batch:
+                    if sandbox is None:
+                        continue
+                    async with self._lock:
+                        if len(self._pool) < self.pool_size:
+                            self._pool.append(sandbox)
+                            continue
+                    await sandbox.terminate()
+                if any(sandbox is None for sandbox in batch):
                     return
-                async with self._lock:
-                    if len(self._pool) < self.pool_size:
-                        self._pool.append(sandbox)
-                    else:
-                        await sandbox.terminate()
-                        return
+
+    async def _shrink_to_target(self) -> None:
+        """Terminate pooled sandboxes beyond the current target, oldest first."""
+        async with self._lock:
+            surplus = len(self._pool) - self.pool_size
+            if surplus <= 0:
+                return
+            self._pool.sort(key=lambda sandbox: sandbox.created_at)
+            removed, self._pool = self._pool[:surplus], self._pool[surplus:]
+        logger.info("warm_pool_scaled_down", removed=len(removed), target=self.pool_size)
+        for sandbox in removed:
+            if not sandbox.termination_scheduled:
+                await sandbox.terminate()
 
     async def _maintenance_loop(self) -> None:
         """Periodic health check and refresh."""
@@ -206,16 +403,26 @@ class WarmPoolManager:
             await asyncio.sleep(self.maintenance_interval)
             await self._health_check()
             await self._expire_old_sandboxes()
+            self._update_target()
+            await self._shrink_to_target()
             await self._fill_pool()
 
     async def _health_check(self) -> None:
         """Check pool health and remove unhealthy sandboxes."""
         async with self._lock:
             sandboxes = list(self._pool)
+        if not sandboxes:
+            return
+        results = await self.sandy.check_sandboxes(
+            [sandbox.sandbox_id for sandbox in sandboxes],
+            timeout=LIVENESS_PROBE_TIMEOUT,
+        )
+        verified_at = time.monotonic()
         for sandbox in sandboxes:
-            healthy = await self.sandy.check_sandbox(sandbox.sandbox_id)
-            if healthy:
+            if results.get(sandbox.sandbox_id):
+                sandbox.last_verified = verified_at
                 continue
+            logger.warning("warm_sandbox_unhealthy", sandbox_id=sandbox.sandbox_id)
             await self._remove_sandbox(sandbox)
 
     async def _expire_old_sandboxes(self) -> None:
@@ -244,15 +451,20 @@ class WarmPoolManager:
             await sandbox.terminate()
 
     async def _create_warm_sandbox(self) -> WarmSandbox | None:
+        start = time.monotonic()
         sandbox_info = await self.sandy.prepare_warm_sandbox()
         if not sandbox_info:
             return None
+        self._provision_seconds += PROVISION_EWMA_ALPHA * (
+            time.monotonic() - start - self._provision_seconds
+        )
         sandbox_id, public_url = sandbox_info
         return WarmSandbox(
             sandbox_id=sandbox_id,
             public_url=public_url,
             created_at=_utcnow(),
             sandy_service=self.sandy,
+            last_verified=time.monotonic(),
         )
 
     def _is_expired(self, sandbox: WarmSandbox) -> bool:
@@ -264,9 +476,93 @@ class WarmPoolManager:
             return True
         return False
 
-    def status(self) -> dict[str, int | bool]:
+    def status(self) -> dict[str, int | float | bool]:
+        acquires = self.hits + self.misses
         return {
-            "enabled": self.sandy.is_available and self.pool_size > 0,
+            "enabled": self.sandy.is_available and self.max_size > 0,
             "size": len(self._pool),
             "target": self.pool_size,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / acquires, 3) if acquires else 0.0,
+            "mean_cold_start_ms": (
+                round(self._cold_start_seconds_total / self.misses * 1000, 1)
+                if self.misses
+                else 0.0
+            ),
+            "mean_acquire_wait_ms": (
+                round(self._acquire_wait_seconds_total / acquires * 1000, 1)
+                if acquires
+                else 0.0
+            ),
+            "arrivals_per_minute": round(self._arrival_rate(time.monotonic()) * 60, 2),
+            "leased": len(self._leased),
+            "quarantined": self.quarantined,
+            "dead_on_acquire": self.dead_on_acquire,
+            "speculative_claimed": self.speculative_claimed,
+            "speculative_abandoned": self.speculative_abandoned,
         }
+
+
+class SpeculativeAcquire:
+    """A warm-pool acquire started before routing has picked the agent path.
+
+    Only a pooled sandbox is taken, in the background, while memory retrieval
+    and routing proceed. ``claim`` hands it to the agent path and records the
+    acquire; ``abandon`` returns it to the pool unused, without touching the
+    demand statistics. An unsettled handle abandons itself after
+    ``SPECULATIVE_LEASE_SECONDS``. A claim after the handle was abandoned, or
+    when nothing warm was left, falls back to a regular ``acquire``.
+    """
+
+    def __init__(
+        self, pool: WarmPoolManager, lease_seconds: float = SPECULATIVE_LEASE_SECONDS
+    ) -> None:
+        self._pool = pool
+        self._task: asyncio.Task[WarmSandbox | None] = asyncio.create_task(
+            pool._take_speculative()
+        )
+        self._settled = False
+        self._expiry = asyncio.get_running_loop().call_later(lease_seconds, self.abandon)
+
+    async def claim(self) -> WarmSandbox | None:
+        """Wait for the speculative sandbox and take ownership of it."""
+        if self._settled:
+            return await self._pool.acquire()
+        self._settled = True
+        self._expiry.cancel()
+        start = time.monotonic()
+        try:
+            sandbox = await asyncio.shield(self._task)
+        except asyncio.CancelledError:
+            # The caller went away while waiting; do not leak the lease.
+            self._task.add_done_callback(self._return_result)
+            raise
+        except Exception as exc:
+            logger.warning("speculative_acquire_failed", error=str(exc))
+            sandbox = None
+        if sandbox is None:
+            return await self._pool.acquire()
+        self._pool.speculative_claimed += 1
+        self._pool._record_acquire(start, warm=True)
+        return sandbox
+
+    def abandon(self) -> None:
+        """Return the sandbox to the pool once the speculative take completes."""
+        if self._settled:
+            return
+        self._settled = True
+        self._expiry.cancel()
+        self._task.add_done_callback(self._return_result)
+
+    def _return_result(self, task: asyncio.Task[WarmSandbox | None]) -> None:
+        if task.cancelled() or task.exception() is not None:
+            return
+        sandbox = task.result()
+        if sandbox is None:
+            return
+        self._pool.speculative_abandoned += 1
+        logger.info("speculative_sandbox_returned", sandbox_id=sandbox.sandbox_id)
+        self._pool._spawn(self._pool._return_unused(sandbox))
@@ -63,9 +63,8 @@ class FakeAsyncClient:
         self.exec_timeouts.append(timeout)
 
         if "command -v" in command:
-            if "aider" in command:
-                return FakeResponse({"stdout": "/workspace/agent-pack/bin/aider\n", "stderr": "", "exit_code": 0})
-            return FakeResponse({"stdout": "", "stderr": "", "exit_code": 1})
+            stdout = "aider /workspace/agent-pack/bin/aider\n" if "aider" in command else ""
+            return FakeResponse({"stdout": stdout, "stderr": "", "exit_code": 0})
 
         if "find" in command and self.artifact_dir in command:
             paths = [path for path in self.files if path.startswith(self.artifact_dir)]
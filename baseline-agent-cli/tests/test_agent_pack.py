@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import base64
+import io
 import os
 import shlex
+import tarfile
+from dataclasses import replace
 import subprocess
 import sys
 from pathlib import Path
@@ -11,6 +15,10 @@ from pathlib import Path
 import pytest
 from janus_baseline_agent_cli.config import Settings
 from janus_baseline_agent_cli.models import ChatCompletionRequest, Message, MessageRole
+from janus_baseline_agent_cli.services.agent_pack import (
+    AGENT_PACK_MARKER,
+    build_agent_pack_archive,
+)
 from janus_baseline_agent_cli.services.sandy import SandyService
 
 BASELINE_ROOT = Path(__file__).resolve().parents[1]
@@ -184,7 +192,9 @@ async def test_agent_answers_image_question_with_docs() -> None:
     assert "https://image.chutes.ai/generate" in combined
     assert "docs/models/text-to-image.md" in combined
     assert any("bootstrap.sh" in command for command in fake_client.exec_commands)
-    assert "/workspace/agent-pack/models/text-to-image.md" in fake_client.written_files
+    assert len(fake_client.written_files) == 1
+    assert fake_client.written_files[0].endswith(".tgz.b64")
+    assert any("tar -xzf" in command for command in fake_client.exec_commands)
 
 
 @pytest.mark.asyncio
@@ -214,3 +224,142 @@ async def test_agent_writes_tts_code() -> None:
     combined = "\n".join(content_chunks)
     assert "https://chutes-kokoro.chutes.ai/speak" in combined
     assert "requests.post" in combined
+
+
+def test_agent_pack_archive_is_deterministic(tmp_path: Path) -> None:
+    """Archive bytes and manifest hash only change with the pack contents."""
+    first = build_agent_pack_archive(AGENT_PACK_ROOT)
+    second = build_agent_pack_archive(AGENT_PACK_ROOT)
+    assert first is not None and second is not None
+    assert first.data == second.data
+    assert first.manifest_hash == second.manifest_hash
+
+    with tarfile.open(fileobj=io.BytesIO(first.data), mode="r:gz") as tar:
+        names = tar.getnames()
+    assert "bootstrap.sh" in names
+    assert "models/text-to-image.md" in names
+
+    pack = tmp_path / "pack"
+    pack.mkdir()
+    (pack / "a.txt").write_text("one", encoding="utf-8")
+    before = build_agent_pack_archive(pack)
+    (pack / "a.txt").write_text("two", encoding="utf-8")
+    after = build_agent_pack_archive(pack)
+    assert before is not None and after is not None
+    assert before.manifest_hash != after.manifest_hash
+    assert build_agent_pack_archive(tmp_path / "missing") is None
+
+
+@pytest.mark.asyncio
+async def test_upload_agent_pack_single_archive_and_marker_skip() -> None:
+    """The pack is uploaded once as an archive; matching markers skip uploads."""
+    fake_client = FakeAsyncClient()
+    settings = Settings(sandy_base_url="http://sandy.test", agent_pack_path=str(AGENT_PACK_ROOT))
+    service = SandyService(settings, client_factory=lambda: fake_client)
+    archive = service.agent_pack_archive()
+    assert archive is not None
+
+    assert await service._upload_agent_pack(fake_client, "sbx_one")
+    writes = [call for call in fake_client.calls if "/files/write" in call["url"]]
+    assert len(writes) == 1
+    assert base64.b64decode(writes[0]["json"]["content"]) == archive.data
+    assert any(AGENT_PACK_MARKER in command and "tar -xzf" in command for command in fake_client.exec_commands)
+
+    # Same sandbox again: known locally, no round trips at all.
+    calls_before = len(fake_client.calls)
+    assert await service._upload_agent_pack(fake_client, "sbx_one")
+    assert len(fake_client.calls) == calls_before
+
+    # A sandbox that already carries the same marker (e.g. a restored
+    # snapshot) is only probed, never re-uploaded.
+    original_post = fake_client.post
+
+    async def post_with_marker(url: str, json=None, headers=None, timeout=None):
+        if "/exec" in url and AGENT_PACK_MARKER in (json or {}).get("command", ""):
+            fake_client.calls.append({"url": url, "json": json})
+            return FakeResponse({"stdout": archive.manifest_hash, "stderr": "", "exit_code": 0})
+        return await original_post(url, json=json, headers=headers, timeout=timeout)
+
+    fake_client.post = post_with_marker  # type: ignore[method-assign]
+    assert await service._upload_agent_pack(fake_client, "sbx_two")
+    assert len([call for call in fake_client.calls if "/files/write" in call["url"]]) == 1
+
+
+class SnapshotFakeAsyncClient(FakeAsyncClient):
+    """Fake Sandy client that hands out unique sandboxes and supports snapshots."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.created = 0
+        self.create_payloads: list[dict] = []
+
+    async def post(self, url: str, json=None, headers=None, timeout=None) -> FakeResponse:
+        if url.endswith("/api/sandboxes"):
+            self.created += 1
+            self.create_payloads.append(json or {})
+            self.calls.append({"url": url, "json": json})
+            return FakeResponse({"sandbox_id": f"sbx_{self.created}"})
+        if url.endswith("/snapshot"):
+            self.calls.append({"url": url, "json": json})
+            return FakeResponse({"snapshotId": "snap_1"})
+        return await super().post(url, json=json, headers=headers, timeout=timeout)
+
+
+@pytest.mark.asyncio
+async def test_upload_agent_pack_skips_marker_probe_for_fresh_sandbox() -> None:
+    """A sandbox this process just created costs one write and one extract."""
+    fake_client = SnapshotFakeAsyncClient()
+    settings = Settings(sandy_base_url="http://sandy.test", agent_pack_path=str(AGENT_PACK_ROOT))
+    service = SandyService(settings, client_factory=lambda: fake_client)
+
+    created = await service._create_sandbox(fake_client)
+    assert created is not None
+    assert await service._upload_agent_pack(fake_client, created[0])
+    assert not any(
+        command.startswith("cat ") and AGENT_PACK_MARKER in command
+        for command in fake_client.exec_commands
+    )
+    assert len(fake_client.exec_commands) == 1
+    assert len([call for call in fake_client.calls if "/files/write" in call["url"]]) == 1
+
+
+@pytest.mark.asyncio
+async def test_snapshot_mode_creates_sandboxes_from_template_snapshot() -> None:
+    """Snapshot mode bootstraps one template and restores later sandboxes from it."""
+    fake_client = SnapshotFakeAsyncClient()
+    settings = Settings(
+        sandy_base_url="http://sandy.test",
+        agent_pack_path=str(AGENT_PACK_ROOT),
+        sandy_snapshot_mode=True,
+    )
+    service = SandyService(settings, client_factory=lambda: fake_client)
+
+    # No snapshot yet: a regular sandbox is returned while the template builds.
+    first = await service._create_sandbox(fake_client)
+    assert first is not None
+    assert "snapshot_id" not in fake_client.create_payloads[0]
+    assert service._snapshot_task is not None
+    await service._snapshot_task
+    archive = service.agent_pack_archive()
+    assert archive is not None
+    assert service._snapshot == (archive.manifest_hash, "snap_1")
+    assert any(call["url"].endswith("/sbx_2/terminate") for call in fake_client.calls)
+
+    restored = await service._create_sandbox(fake_client)
+    assert restored is not None
+    sandbox_id, public_url = restored
+    assert fake_client.create_payloads[-1]["snapshot_id"] == "snap_1"
+
+    calls_before = len(fake_client.calls)
+    assert await service._upload_agent_pack(fake_client, sandbox_id)
+    assert len(fake_client.calls) == calls_before
+
+    await service._run_bootstrap(fake_client, sandbox_id, public_url)
+    assert "JANUS_BOOTSTRAP_SKIP_INSTALL=true" in fake_client.exec_commands[-1]
+
+    # A changed agent pack invalidates the snapshot and triggers a rebuild.
+    service._agent_pack_archive = replace(archive, manifest_hash="0" * 64)
+    await service._create_sandbox(fake_client)
+    assert "snapshot_id" not in fake_client.create_payloads[-1]
+    await service._snapshot_task
+    assert service._snapshot == ("0" * 64, "snap_1")
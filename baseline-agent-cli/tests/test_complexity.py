@@ -218,3 +218,109 @@ async def test_metadata_routing_decision_override() -> None:
     assert result.decision == RoutingDecision.AGENT_KIMI
     assert result.is_complex is True
     assert result.reason == "routing_metadata"
+
+
+@pytest.mark.asyncio
+async def test_llm_routing_hedges_slow_primary(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A slow primary routing model is raced by the fallback and cancelled."""
+    import asyncio
+
+    from janus_baseline_agent_cli.services.complexity import ROUTING_MODELS
+
+    settings = Settings(
+        openai_api_key="test",
+        llm_routing_model=ROUTING_MODELS[0],
+        llm_routing_hedge_delay=0.1,
+    )
+    detector = ComplexityDetector(settings)
+    cancelled: list[str] = []
+
+    async def fake_try(client, model: str, text: str, has_images: bool):
+        if model == ROUTING_MODELS[0]:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(model)
+                raise
+        return RoutingDecision.AGENT_KIMI, "llm_decision", True
+
+    monkeypatch.setattr(detector, "_try_routing_model", fake_try)
+
+    decision, reason = await asyncio.wait_for(
+        detector._llm_routing_check("scrape this site for prices", False), timeout=1.0
+    )
+    assert decision == RoutingDecision.AGENT_KIMI
+    assert reason == "llm_decision"
+    assert cancelled == [ROUTING_MODELS[0]]
+
+
+def test_routing_latency_quantile_sets_hedge_delay() -> None:
+    from janus_baseline_agent_cli.services.complexity import ROUTING_MODELS
+
+    settings = Settings(openai_api_key="test", llm_routing_hedge_delay=1.0)
+    detector = ComplexityDetector(settings)
+    model = ROUTING_MODELS[0]
+    assert detector._hedge_delay(model) == 1.0
+
+    for _ in range(18):
+        detector._routing_latency.observe(model, 0.15)
+    for _ in range(2):
+        detector._routing_latency.observe(model, 2.5)
+    assert detector._hedge_delay(model) == 0.2
+
+
+def _confident_local_model(prompt: str, decision: RoutingDecision):
+    from janus_baseline_agent_cli.services.routing_classifier import (
+        LocalRoutingClassifier,
+        extract_features,
+    )
+
+    classes = list(RoutingDecision)
+    row = [8.0 if cls == decision else 0.0 for cls in classes]
+    return LocalRoutingClassifier(
+        classes=classes,
+        weights={index: row for index in extract_features(prompt, False)},
+        bias=[0.0] * len(classes),
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_classifier_skips_llm_when_confident(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    prompt = "compare these two vacation options for me please"
+    model_path = tmp_path / "routing.json"
+    _confident_local_model(prompt, RoutingDecision.AGENT_NEMOTRON).save(model_path)
+    detector = ComplexityDetector(
+        Settings(openai_api_key="test", local_routing_model_path=str(model_path))
+    )
+
+    async def fail_llm_check(text: str, has_images: bool) -> tuple[RoutingDecision, str]:
+        raise AssertionError("LLM check should be skipped for confident local decisions")
+
+    monkeypatch.setattr(detector, "_llm_routing_check", fail_llm_check)
+    result = await detector.analyze_async([Message(role=MessageRole.USER, content=prompt)])
+    assert result.decision == RoutingDecision.AGENT_NEMOTRON
+    assert result.reason.startswith("local_classifier")
+
+
+@pytest.mark.asyncio
+async def test_local_classifier_escalates_below_threshold(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    detector = ComplexityDetector(Settings(openai_api_key="test"))
+    detector._local_classifier = _confident_local_model(
+        "something else entirely", RoutingDecision.AGENT_KIMI
+    )
+    calls: list[str] = []
+
+    async def fake_llm_check(text: str, has_images: bool) -> tuple[RoutingDecision, str]:
+        calls.append(text)
+        return RoutingDecision.FAST_NEMOTRON, "llm_decision"
+
+    monkeypatch.setattr(detector, "_llm_routing_check", fake_llm_check)
+    prompt = "what's the weather like today"
+    result = await detector.analyze_async([Message(role=MessageRole.USER, content=prompt)])
+    assert calls == [prompt]
+    assert result.decision == RoutingDecision.FAST_NEMOTRON
+    assert result.reason == "llm_verification: llm_decision"
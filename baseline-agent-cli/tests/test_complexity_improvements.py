@@ -123,6 +123,12 @@ class TestMultilingualKeywords:
         assert analysis.is_complex
         assert "herunterladen" in analysis.keywords_matched
 
+    def test_german_separable_verbs_need_head_before_tail(
+        self, detector: ComplexityDetector
+    ) -> None:
+        assert "herunterladen" in detector._matched_complex_keywords("LADE es HERUNTER")
+        assert "herunterladen" not in detector._matched_complex_keywords("herunter und lade")
+
     def test_git_repository_keywords(self, detector: ComplexityDetector) -> None:
         messages = [
             Message(
@@ -20,3 +20,4 @@ def test_health_check(client: TestClient) -> None:
     assert isinstance(data["warm_pool"]["enabled"], bool)
     assert isinstance(data["warm_pool"]["size"], int)
     assert isinstance(data["warm_pool"]["target"], int)
+    assert data["routing_cache"]["name"] == "complexity"
@@ -164,3 +164,92 @@ def test_openai_tool_calls_convert_to_anthropic_tool_use() -> None:
     tool_block = next(block for block in content_blocks if block.get("type") == "tool_use")
     assert tool_block["name"] == "Bash"
     assert tool_block["input"]["command"] == "ls"
+
+
+@pytest.mark.asyncio
+async def test_classifier_memoizes_decisions() -> None:
+    from janus_baseline_agent_cli.router.classifier import RoutingDecisionClassifier
+
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(
+            200,
+            json={
+                "choices": [
+                    {
+                        "message": {
+                            "tool_calls": [
+                                {
+                                    "function": {
+                                        "name": "select_routing_decision",
+                                        "arguments": '{"decision": "agent_kimi", "confidence": 0.8}',
+                                    }
+                                }
+                            ]
+                        }
+                    }
+                ]
+            },
+        )
+
+    classifier = RoutingDecisionClassifier("test", "http://example.com")
+    classifier.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    messages = [{"role": "user", "content": "Build me a small web scraper for news headlines"}]
+
+    first = await classifier.classify(messages)
+    second = await classifier.classify(messages)
+    await classifier.close()
+
+    assert first == second == (RoutingDecision.AGENT_KIMI, 0.8)
+    assert calls == 1
+    assert classifier.cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_router_metrics_report_the_classifier_cache() -> None:
+    from janus_baseline_agent_cli.router.classifier import RoutingDecisionClassifier
+    from janus_baseline_agent_cli.routing_cache import RoutingDecisionCache
+
+    classifier = RoutingDecisionClassifier("test", "http://example.com")
+    classifier.cache.set("hello", False, (RoutingDecision.FAST_QWEN, 0.9))
+    # Another cache with the same name must not replace the reported one.
+    RoutingDecisionCache("classifier").set("other", False, (RoutingDecision.FAST_QWEN, 0.9))
+    router_server.classifier = classifier
+    router_server.metrics = RoutingMetrics()
+    try:
+        payload = await router_server.get_metrics()
+    finally:
+        await classifier.close()
+
+    assert payload["decision_cache"] == classifier.cache.stats()
+    assert payload["decision_cache"]["size"] == 1
+
+
+def test_routing_metrics_are_bounded_and_exported() -> None:
+    now = [1000.0]
+    metrics = RoutingMetrics(clock=lambda: now[0])
+    for value in range(1, 10_001):
+        metrics.record_request("fast_qwen", "model-a", float(value) / 10)
+    metrics.record_upstream_latency("model-a", 250.0)
+    metrics.record_error("model-b")
+
+    latency = metrics.classification_latency
+    assert len(latency._buckets) < 500
+    assert metrics.avg_classification_time_ms == pytest.approx(500.05)
+    assert latency.quantile(0.5) == pytest.approx(500, rel=0.03)
+    assert latency.quantile(0.99) == pytest.approx(990, rel=0.03)
+
+    payload = metrics.to_dict()
+    assert payload["request_rate_by_model"]["model-a"] == pytest.approx(10_000 / 60)
+    assert payload["upstream_latency_by_model"]["model-a"]["p50_ms"] == pytest.approx(250, rel=0.03)
+    now[0] += 61
+    assert metrics.to_dict()["request_rate_by_model"]["model-a"] == 0.0
+
+    text = metrics.to_prometheus()
+    assert 'janus_router_model_requests_total{model="model-a"} 10000' in text
+    assert 'janus_router_model_errors_total{model="model-b"} 1' in text
+    assert "janus_router_classification_seconds_count 10000" in text
+    assert 'janus_router_upstream_seconds{model="model-a",quantile="0.5"}' in text
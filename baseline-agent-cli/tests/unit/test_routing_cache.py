@@ -0,0 +1,73 @@
+"""Tests for the routing decision cache."""
+
+from janus_baseline_agent_cli.routing import RoutingDecision
+from janus_baseline_agent_cli.routing_cache import RoutingDecisionCache, normalize_prompt
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_exact_hits_use_normalized_prompt_and_image_flag() -> None:
+    cache: RoutingDecisionCache[RoutingDecision] = RoutingDecisionCache("test-exact")
+    cache.set("Write a Python script, please!", False, RoutingDecision.AGENT_KIMI)
+
+    assert cache.get("  write a PYTHON   script,\nplease!", False) == RoutingDecision.AGENT_KIMI
+    assert cache.get("Write a Python script, please!", True) is None
+
+    stats = cache.stats()
+    assert stats["name"] == "test-exact"
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_normalization_keeps_digits_and_operators_distinct() -> None:
+    assert normalize_prompt("What is 2+2?") != normalize_prompt("What is 22?")
+    assert normalize_prompt("run rm -rf ./build") != normalize_prompt("run rm rf build")
+
+    cache: RoutingDecisionCache[str] = RoutingDecisionCache("test-operators")
+    cache.set("What is 2+2?", False, "fast")
+    assert cache.get("what is 22?", False) is None
+
+
+def test_entries_expire_and_lru_evicts() -> None:
+    clock = FakeClock()
+    cache: RoutingDecisionCache[str] = RoutingDecisionCache(
+        "test-expiry", max_entries=2, ttl_seconds=10, clock=clock
+    )
+    cache.set("first prompt", False, "a")
+    cache.set("second prompt", False, "b")
+    assert cache.get("first prompt", False) == "a"
+    cache.set("third prompt", False, "c")  # evicts "second prompt", the least recent
+
+    assert cache.get("second prompt", False) is None
+    assert cache.get("first prompt", False) == "a"
+
+    clock.now = 11
+    assert cache.get("third prompt", False) is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["expirations"] == 1
+
+
+def test_near_duplicates_hit_only_when_enabled() -> None:
+    prompt = "Clone the repository at github.com/example/project and run its test suite"
+    retry = "Clone the repository at github.com/example/project and run its tests suite"
+    unrelated = "Summarize the plot of a famous novel about a whale in three sentences"
+
+    exact_only: RoutingDecisionCache[str] = RoutingDecisionCache("test-exact-only")
+    exact_only.set(prompt, False, "agent")
+    assert exact_only.get(retry, False) is None
+
+    cache: RoutingDecisionCache[str] = RoutingDecisionCache(
+        "test-near", similarity_threshold=0.7
+    )
+    cache.set(prompt, False, "agent")
+    assert cache.get(retry, False) == "agent"
+    assert cache.get(retry, True) is None
+    assert cache.get(unrelated, False) is None
+    assert cache.stats()["near_hits"] == 1
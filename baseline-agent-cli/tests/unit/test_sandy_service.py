@@ -1,5 +1,9 @@
 """Unit tests for Sandy service helpers."""
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 
 from janus_baseline_agent_cli.config import Settings
@@ -117,3 +121,234 @@ def test_build_agent_prompt_passes_through_plain_chitchat() -> None:
     wrapped = service._build_agent_prompt("how does rayleigh scattering work", None)
     assert "Generation Instructions" not in wrapped
     assert wrapped == "how does rayleigh scattering work"
+
+
+class _ExecHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({"stdout": "", "stderr": "", "exit_code": 0}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_shared_client_reuses_connections() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ExecHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        settings = Settings(
+            sandy_base_url=f"http://127.0.0.1:{server.server_port}",
+            sandy_http2=False,
+        )
+        service = SandyService(settings)
+        for _ in range(3):
+            assert await service.check_sandbox("sandbox-1")
+        assert await service.check_sandboxes(["sandbox-1", "sandbox-2"]) == {
+            "sandbox-1": True,
+            "sandbox-2": True,
+        }
+
+        stats = service.connection_stats()
+        assert stats["requests"] == 5
+        assert 1 <= stats["connections_opened"] <= 2
+        assert stats["reused"] == 5 - stats["connections_opened"]
+
+        await service.aclose()
+        assert service._client is None
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_select_agent_probes_binaries_once_per_sandbox(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = SandyService(Settings(baseline_agent="claude-code"))
+    commands: list[str] = []
+
+    async def fake_exec(client, sandbox_id: str, command: str, timeout=None):
+        commands.append(command)
+        return "aider /root/.local/bin/aider\ncodex /usr/local/bin/codex\n", "", 0
+
+    monkeypatch.setattr(service, "_exec_in_sandbox", fake_exec)
+
+    assert await service._select_agent(None, "sbx-1") == "codex"
+    assert await service._select_agent(None, "sbx-1", "aider") == "aider"
+    assert len(commands) == 1
+    assert "command -v" in commands[0]
+
+    # Sandboxes restored from the same snapshot reuse the probe result.
+    for sandbox_id in ("sbx-2", "sbx-3"):
+        service._agent_pack_hashes[sandbox_id] = "pack"
+        service._snapshot_sandboxes.add(sandbox_id)
+    assert await service._select_agent(None, "sbx-2") == "codex"
+    assert await service._select_agent(None, "sbx-3") == "codex"
+    assert len(commands) == 2
+
+    # A different agent pack in the same sandbox is probed again.
+    service._agent_pack_hashes["sbx-1"] = "new-pack"
+    assert await service._select_agent(None, "sbx-1") == "codex"
+    assert len(commands) == 3
+
+
+@pytest.mark.asyncio
+async def test_collect_artifacts_reads_only_inlined_files(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = SandyService(Settings(sandy_base_url="http://sandy.test"))
+    big_hash = "a" * 64
+    manifest = "\n".join(
+        [
+            f"2048\t{big_hash}\timage/png\t/workspace/artifacts/chart.png",
+            f"{10 * 1024 * 1024}\t{big_hash}\tapplication/zip\t/workspace/artifacts/site.zip",
+            f"5\t{'b' * 64}\t\t/workspace/artifacts/notes.txt",
+        ]
+    )
+    reads: list[str] = []
+
+    async def fake_exec(client, sandbox_id: str, command: str, timeout=None):
+        assert "sha256sum" in command
+        return manifest + "\n", "", 0
+
+    async def fake_read(client, sandbox_id: str, path: str):
+        reads.append(path)
+        return b"hello"
+
+    monkeypatch.setattr(service, "_exec_in_sandbox", fake_exec)
+    monkeypatch.setattr(service, "_read_file", fake_read)
+
+    artifacts = await service._collect_artifacts(None, "sbx-1", "http://sandbox.test")
+
+    assert reads == ["/workspace/artifacts/notes.txt"]
+    by_name = {artifact.display_name: artifact for artifact in artifacts}
+    assert by_name["chart.png"].size_bytes == 2048
+    assert by_name["chart.png"].sha256 == big_hash
+    assert by_name["site.zip"].url.endswith("/site.zip")
+    assert by_name["notes.txt"].url == "data:text/plain;base64,aGVsbG8="
+
+
+@pytest.mark.asyncio
+async def test_artifact_manifest_keeps_fields_that_parsed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = SandyService(Settings(sandy_base_url="http://sandy.test"))
+    # sha256sum is missing in the sandbox, so every checksum field is empty.
+    manifest = "\n".join(
+        [
+            "12\t\ttext/csv\t/workspace/artifacts/data.csv",
+            "\t\t\t/workspace/artifacts/odd.bin",
+        ]
+    )
+
+    async def fake_exec(client, sandbox_id: str, command: str, timeout=None):
+        return manifest + "\n", "", 0
+
+    monkeypatch.setattr(service, "_exec_in_sandbox", fake_exec)
+    entries = await service._artifact_manifest(None, "sbx-1")
+
+    assert [(e.path, e.size_bytes, e.sha256, e.mime_type) for e in entries] == [
+        ("/workspace/artifacts/data.csv", 12, None, "text/csv"),
+        ("/workspace/artifacts/odd.bin", None, None, None),
+    ]
+
+    reads: list[str] = []
+
+    async def fake_read(client, sandbox_id: str, path: str):
+        reads.append(path)
+        return b"a,b"
+
+    monkeypatch.setattr(service, "_read_file", fake_read)
+    artifacts = await service._collect_artifacts(None, "sbx-1", "http://sandbox.test")
+    assert reads == ["/workspace/artifacts/data.csv", "/workspace/artifacts/odd.bin"]
+    assert {artifact.display_name for artifact in artifacts} == {"data.csv", "odd.bin"}
+
+
+@pytest.mark.asyncio
+async def test_screenshot_events_tail_event_log(monkeypatch: pytest.MonkeyPatch) -> None:
+    from janus_baseline_agent_cli.services.sandy import EventLogCursor
+
+    service = SandyService(Settings())
+    first = json.dumps(
+        {"event": "screenshot", "url": "https://a.test", "title": "A", "timestamp": 1.0,
+         "mime_type": "image/webp", "image_base64": "d2VicA=="}
+    )
+    second = json.dumps(
+        {"event": "screenshot", "url": "https://b.test", "title": "B", "timestamp": 2.0,
+         "image_base64": "cG5n"}
+    )
+    log = f"{first}\n{second}\n"
+    partial_len = 10
+    offsets: list[int] = []
+
+    async def fake_exec(client, sandbox_id: str, command: str, timeout=None):
+        offset = int(command.split("tail -c +", 1)[1].split()[0]) - 1
+        offsets.append(offset)
+        # The second event is still being written during the first poll.
+        visible = log if len(offsets) > 1 else log[: len(first) + 1 + partial_len]
+        return visible[offset:], "", 0
+
+    monkeypatch.setattr(service, "_exec_in_sandbox", fake_exec)
+    cursor = EventLogCursor()
+
+    events = await service._collect_screenshot_events(None, "sbx", cursor, "req", "model")
+    assert [event.choices[0].delta.janus["payload"]["url"] for event in events] == [
+        "https://a.test"
+    ]
+    assert events[0].choices[0].delta.janus["payload"]["mime_type"] == "image/webp"
+    assert cursor.offset == len(first) + 1
+
+    events = await service._collect_screenshot_events(None, "sbx", cursor, "req", "model")
+    payload = events[0].choices[0].delta.janus["payload"]
+    assert payload["url"] == "https://b.test"
+    assert payload["mime_type"] == "image/png"
+    assert cursor.offset == len(log)
+    assert offsets == [0, len(first) + 1]
+
+    assert await service._collect_screenshot_events(None, "sbx", cursor, "req", "model") == []
+
+
+@pytest.mark.asyncio
+async def test_run_agent_via_api_decodes_chunked_sse() -> None:
+    import httpx
+
+    body = (
+        b'data: {"type": "status", "message": "starting"}\n\n'
+        b'data: {"type": "agent-output",\ndata:  "text": "hi"}\n\n'
+        b"data: plain text\n\n"
+        b'data: {"type": "complete", "success": true}\n\n'
+        b'data: {"type": "status", "message": "ignored"}\n\n'
+    )
+
+    async def chunks():
+        for index in range(0, len(body), 7):
+            yield body[index : index + 7]
+
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=chunks())
+    )
+    service = SandyService(Settings(sandy_base_url="http://sandy.test"))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        events = [
+            event
+            async for event in service._run_agent_via_api(
+                client, "sbx-1", "claude-code", "model", "prompt"
+            )
+        ]
+
+    assert events == [
+        {"type": "status", "message": "starting"},
+        {"type": "agent-output", "text": "hi"},
+        {"type": "output", "text": "plain text"},
+        {"type": "complete", "success": True},
+    ]
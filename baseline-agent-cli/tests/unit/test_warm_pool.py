@@ -4,7 +4,19 @@ import asyncio
 import time
 
 import pytest
+from fastapi import Response
 
+from janus_baseline_agent_cli import main as main_module
+from janus_baseline_agent_cli.models import (
+    AssistantMessage,
+    ChatCompletionRequest,
+    ChatCompletionResponse,
+    Choice,
+    Message,
+    MessageRole,
+)
+from janus_baseline_agent_cli.routing import RoutingDecision
+from janus_baseline_agent_cli.services import warm_pool as warm_pool_module
 from janus_baseline_agent_cli.services.warm_pool import WarmPoolManager
 
 
@@ -14,17 +26,36 @@ class FakeSandyService:
         self._counter = 0
         self.terminated: list[str] = []
         self.reset_calls: list[str] = []
+        self.prepare_delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.dead: set[str] = set()
+        self.checked: list[str] = []
+        self.batch_checks: list[list[str]] = []
 
     @property
     def is_available(self) -> bool:
         return self._available
 
     async def prepare_warm_sandbox(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.prepare_delay)
+        finally:
+            self.in_flight -= 1
         self._counter += 1
         return f"sandbox-{self._counter}", None
 
-    async def check_sandbox(self, sandbox_id: str) -> bool:
-        return True
+    async def check_sandbox(self, sandbox_id: str, timeout: float | None = None) -> bool:
+        self.checked.append(sandbox_id)
+        return sandbox_id not in self.dead
+
+    async def check_sandboxes(
+        self, sandbox_ids: list[str], timeout: float | None = None
+    ) -> dict[str, bool]:
+        self.batch_checks.append(list(sandbox_ids))
+        return {sandbox_id: sandbox_id not in self.dead for sandbox_id in sandbox_ids}
 
     async def terminate(self, sandbox_id: str) -> None:
         self.terminated.append(sandbox_id)
@@ -108,3 +139,302 @@ async def test_warm_pool_refill_on_acquire() -> None:
     assert pool.size == 2
 
     await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_scales_with_demand(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(warm_pool_module, "PROVISION_EWMA_ALPHA", 0.0)
+    sandy = FakeSandyService()
+    pool = WarmPoolManager(
+        sandy,
+        pool_size=1,
+        min_size=1,
+        max_size=4,
+        maintenance_interval=3600,
+        refill_on_acquire=False,
+        demand_window_seconds=60,
+    )
+    await pool.start()
+    assert pool.size == 1
+
+    # 6 acquires/minute with 30s provisioning -> 3 needed, +1 after a cold start.
+    for _ in range(6):
+        assert await pool.acquire() is not None
+    assert pool.pool_size == 4
+
+    status = pool.status()
+    assert status["target"] == 4
+    assert status["hits"] == 1
+    assert status["misses"] == 5
+    assert status["hit_rate"] == pytest.approx(1 / 6, abs=0.001)
+    assert status["arrivals_per_minute"] == 6.0
+
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_refills_in_parallel() -> None:
+    sandy = FakeSandyService()
+    sandy.prepare_delay = 0.05
+    pool = WarmPoolManager(
+        sandy,
+        pool_size=4,
+        maintenance_interval=3600,
+        refill_concurrency=2,
+    )
+    await pool.start()
+
+    assert pool.size == 4
+    assert sandy.max_in_flight == 2
+
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_scales_down_when_idle() -> None:
+    sandy = FakeSandyService()
+    pool = WarmPoolManager(
+        sandy,
+        pool_size=3,
+        min_size=1,
+        max_size=3,
+        maintenance_interval=3600,
+        refill_on_acquire=False,
+    )
+    await pool.start()
+    assert pool.size == 3
+
+    # No acquires within the demand window: shrink to the minimum.
+    assert pool._update_target() == 1
+    await pool._shrink_to_target()
+    assert pool.size == 1
+    assert sandy.terminated == ["sandbox-1", "sandbox-2"]
+
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_acquire_probes_stale_sandboxes_only() -> None:
+    sandy = FakeSandyService()
+    pool = WarmPoolManager(
+        sandy,
+        pool_size=2,
+        maintenance_interval=3600,
+        refill_on_acquire=False,
+        liveness_ttl_seconds=30,
+    )
+    await pool.start()
+
+    # Freshly created sandboxes count as verified.
+    sandbox = await pool.acquire()
+    assert sandbox is not None
+    assert sandy.checked == []
+    await pool.release(sandbox)
+
+    for pooled in pool._pool:
+        pooled.last_verified -= 60
+    sandy.dead.add("sandbox-2")
+    sandbox = await pool.acquire()
+    assert sandbox is not None
+    assert sandbox.sandbox_id == "sandbox-1"
+    assert sandy.checked == ["sandbox-2", "sandbox-1"]
+    assert "sandbox-2" in sandy.terminated
+    assert pool.status()["dead_on_acquire"] == 1
+
+    await pool.release(sandbox)
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_health_check_probes_pool_in_one_batch() -> None:
+    sandy = FakeSandyService()
+    pool = WarmPoolManager(
+        sandy,
+        pool_size=3,
+        maintenance_interval=3600,
+        refill_on_acquire=False,
+    )
+    await pool.start()
+    sandy.dead.add("sandbox-2")
+
+    await pool._health_check()
+
+    assert sandy.batch_checks == [["sandbox-1", "sandbox-2", "sandbox-3"]]
+    assert [sandbox.sandbox_id for sandbox in pool._pool] == ["sandbox-1", "sandbox-3"]
+    assert sandy.terminated == ["sandbox-2"]
+
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_release_quarantines_sandbox_that_failed_mid_run() -> None:
+    sandy = FakeSandyService()
+    pool = WarmPoolManager(
+        sandy,
+        pool_size=1,
+        maintenance_interval=3600,
+        refill_on_acquire=False,
+    )
+    await pool.start()
+
+    sandbox = await pool.acquire()
+    assert sandbox is not None
+    sandbox._begin_run()  # the request raised before the run finished
+
+    await pool.release(sandbox, reusable=True)
+    assert pool.size == 0
+    assert sandy.terminated == [sandbox.sandbox_id]
+    assert pool.status()["quarantined"] == 1
+
+    # A second release of the same lease is ignored.
+    await pool.release(sandbox, reusable=True)
+    assert pool.size == 0
+    assert sandy.terminated == [sandbox.sandbox_id]
+
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_speculative_acquire_claim_and_abandon() -> None:
+    sandy = FakeSandyService()
+    pool = WarmPoolManager(
+        sandy,
+        pool_size=1,
+        maintenance_interval=3600,
+        refill_on_acquire=False,
+    )
+    await pool.start()
+
+    # Routing picked the fast path: the sandbox goes back unused, without a
+    # reset, and the abandoned speculation is not counted as demand.
+    speculative = pool.speculate()
+    assert speculative is not None
+    speculative.abandon()
+    while pool.speculative_abandoned == 0:
+        await asyncio.sleep(0.01)
+    await _wait_for_pool_size(pool, 1)
+    assert sandy.reset_calls == []
+    status = pool.status()
+    assert status["leased"] == 0
+    assert status["hits"] == status["misses"] == 0
+    assert status["arrivals_per_minute"] == 0
+
+    # Routing picked the agent path: the claim gets the same warm sandbox.
+    speculative = pool.speculate()
+    sandbox = await speculative.claim()
+    assert sandbox is not None and sandbox.sandbox_id == "sandbox-1"
+    speculative.abandon()  # no-op once claimed
+    await asyncio.sleep(0)
+    assert pool.size == 0
+    assert pool.status()["hits"] == 1
+
+    # Nothing warm is pooled: no speculation, so nothing is cold-created.
+    assert pool.speculate() is None
+    assert sandy._counter == 1
+
+    await pool.release(sandbox)
+    status = pool.status()
+    assert status["speculative_claimed"] == 1
+    assert status["speculative_abandoned"] == 1
+
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_unsettled_speculation_expires_and_claim_falls_back() -> None:
+    sandy = FakeSandyService()
+    pool = WarmPoolManager(
+        sandy,
+        pool_size=1,
+        maintenance_interval=3600,
+        refill_on_acquire=False,
+    )
+    await pool.start()
+
+    # A streaming response Starlette never iterates never claims or abandons.
+    speculative = warm_pool_module.SpeculativeAcquire(pool, lease_seconds=0.01)
+    while pool.speculative_abandoned == 0:
+        await asyncio.sleep(0.01)
+    await _wait_for_pool_size(pool, 1)
+    assert pool.status()["leased"] == 0
+
+    sandbox = await speculative.claim()
+    assert sandbox is not None and sandbox.sandbox_id == "sandbox-1"
+    assert pool.status()["speculative_claimed"] == 0
+
+    await pool.release(sandbox)
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_fast_path_decision_returns_speculative_sandbox(monkeypatch) -> None:
+    sandy = FakeSandyService()
+    pool = WarmPoolManager(
+        sandy,
+        pool_size=1,
+        maintenance_interval=3600,
+        refill_on_acquire=False,
+    )
+    await pool.start()
+
+    class FastAnalysis:
+        keywords_matched: list[str] = []
+        multimodal_detected = False
+        has_images = False
+        image_count = 0
+        text_preview = ""
+
+        def __init__(self, is_complex: bool, decision: RoutingDecision) -> None:
+            self.is_complex = is_complex
+            self.reason = "test"
+            self.decision = decision
+
+    class Detector:
+        def analyze(self, messages, flags=None):
+            # The cheap first pass predicts the agent path...
+            return FastAnalysis(True, RoutingDecision.AGENT_KIMI)
+
+        async def analyze_async(self, messages, flags=None, metadata=None):
+            # ...but routing settles on the fast path.
+            return FastAnalysis(False, RoutingDecision.FAST_QWEN)
+
+    class LLM:
+        async def complete(self, request):
+            return ChatCompletionResponse(
+                id="test",
+                model=request.model,
+                choices=[Choice(message=AssistantMessage(content="Hi"))],
+            )
+
+    monkeypatch.setattr(main_module, "warm_pool", pool)
+    monkeypatch.setattr(main_module.settings, "warm_pool_speculative_acquire", True)
+    monkeypatch.setattr(main_module.settings, "use_sandy_agent_api", True)
+    monkeypatch.setattr(main_module.settings, "always_use_agent", False)
+    monkeypatch.setattr(main_module.settings, "enable_memory_feature", False)
+
+    result = await main_module.chat_completions(
+        ChatCompletionRequest(
+            model="test",
+            messages=[Message(role=MessageRole.USER, content="Search the web for news")],
+        ),
+        Response(),
+        complexity_detector=Detector(),
+        llm_service=LLM(),
+        sandy_service=sandy,
+        memory_service=None,
+        authorization=None,
+        debug_request_id_header=None,
+        baseline_agent_header=None,
+        correlation_id_header=None,
+    )
+
+    assert result.choices[0].message.content == "Hi"
+    while pool.speculative_abandoned == 0:
+        await asyncio.sleep(0.01)
+    await _wait_for_pool_size(pool, 1)
+    status = pool.status()
+    assert status["leased"] == 0
+    assert status["speculative_claimed"] == 0
+    assert sandy.reset_calls == []
+
+    await pool.stop()
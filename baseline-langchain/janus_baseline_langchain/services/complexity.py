@@ -12,6 +12,11 @@ import structlog
 
 from janus_baseline_langchain.config import Settings, get_settings
 from janus_baseline_langchain.models import GenerationFlags, Message, MessageContent
+from janus_baseline_langchain.services.keyword_matcher import (
+    KeywordMatcher,
+    KeywordScan,
+    separable_anchors,
+)
 from janus_baseline_langchain.services.vision import contains_images, count_images
 from janus_baseline_langchain.services.robust import robust_parse_tool_call
 
@@ -305,11 +310,64 @@ class ComplexityDetector:
         (r"fass\s+.+\s+zusammen", "zusammenfassung"),
     ]
 
+    GENERATION_VERBS = ["generate", "create", "make", "produce", "render"]
+
+    IMAGE_AGENT_TRIGGERS = [
+        "search for",
+        "find more",
+        "look up",
+        "write code",
+        "execute",
+        "run this",
+        "compare with",
+        "fetch",
+        "download",
+    ]
+
+    URL_INTERACTION_HINTS = [
+        "test",
+        "check",
+        "visit",
+        "open",
+        "browse",
+        "verify",
+        "screenshot",
+        "load",
+        "fetch",
+        "scrape",
+        "interact",
+        "click",
+        "submit",
+        "form",
+        "login",
+        "api",
+        "endpoint",
+    ]
+
+    # (compiled pattern, keyword, (head, tail) literals the text must contain)
+    _SEPARABLE_VERB_RULES = [
+        (re.compile(pattern), keyword, separable_anchors(pattern))
+        for pattern, keyword in GERMAN_SEPARABLE_VERBS
+    ]
+
+    # Every keyword list above, matched in one pass over the prompt.
+    _KEYWORD_MATCHER = KeywordMatcher(
+        {
+            "complex": COMPLEX_KEYWORDS,
+            "media": MULTIMODAL_KEYWORDS,
+            "generation": GENERATION_VERBS,
+            "image_agent": IMAGE_AGENT_TRIGGERS,
+            "url_hint": URL_INTERACTION_HINTS,
+            "separable": [anchor for _, _, anchors in _SEPARABLE_VERB_RULES for anchor in anchors],
+        }
+    )
+
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
         self._threshold = settings.complexity_threshold
         self._routing_model = settings.llm_routing_model
         self._routing_timeout = settings.llm_routing_timeout
+        self._last_scan: tuple[str, KeywordScan] | None = None
 
     def _get_last_user_message(self, messages: list[Message]) -> Optional[Message]:
         for msg in reversed(messages):
@@ -370,11 +428,25 @@ class ComplexityDetector:
         words = len(text.split())
         return int(words * 1.3)
 
+    def _scan_keywords(self, text: str) -> KeywordScan:
+        # Analysis checks several keyword groups per prompt; scan it once.
+        cached = self._last_scan
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        scan = self._KEYWORD_MATCHER.scan(text)
+        self._last_scan = (text, scan)
+        return scan
+
     def _matched_complex_keywords(self, text: str) -> list[str]:
-        text_lower = text.lower()
-        matches = [keyword for keyword in self.COMPLEX_KEYWORDS if keyword in text_lower]
-        for pattern, keyword in self.GERMAN_SEPARABLE_VERBS:
-            if re.search(pattern, text_lower):
+        scan = self._scan_keywords(text)
+        matches = [keyword for keyword in self.COMPLEX_KEYWORDS if keyword in scan["complex"]]
+        anchors = scan["separable"]
+        text_lower: str | None = None
+        for pattern, keyword, (head, tail) in self._SEPARABLE_VERB_RULES:
+            if head not in anchors or tail not in anchors:
+                continue
+            text_lower = text.lower() if text_lower is None else text_lower
+            if pattern.search(text_lower):
                 matches.append(keyword)
         return matches
 
@@ -385,31 +457,11 @@ class ComplexityDetector:
         return "```" in text
 
     def _is_multimodal_request(self, text: str) -> bool:
-        text_lower = text.lower()
-        generation_verbs = ["generate", "create", "make", "produce", "render"]
-
-        for verb in generation_verbs:
-            if verb not in text_lower:
-                continue
-            for media in self.MULTIMODAL_KEYWORDS:
-                if media in text_lower:
-                    return True
-        return False
+        scan = self._scan_keywords(text)
+        return bool(scan["generation"] and scan["media"])
 
     def _needs_agent_for_images(self, text: str) -> bool:
-        agent_triggers = [
-            "search for",
-            "find more",
-            "look up",
-            "write code",
-            "execute",
-            "run this",
-            "compare with",
-            "fetch",
-            "download",
-        ]
-        text_lower = text.lower()
-        return any(trigger in text_lower for trigger in agent_triggers)
+        return bool(self._scan_keywords(text)["image_agent"])
 
     def _contains_url(self, text: str) -> bool:
         return bool(URL_PATTERN.search(text))
@@ -417,28 +469,7 @@ class ComplexityDetector:
     def _url_suggests_interaction(self, text: str) -> bool:
         if not self._contains_url(text):
             return False
-
-        interaction_hints = [
-            "test",
-            "check",
-            "visit",
-            "open",
-            "browse",
-            "verify",
-            "screenshot",
-            "load",
-            "fetch",
-            "scrape",
-            "interact",
-            "click",
-            "submit",
-            "form",
-            "login",
-            "api",
-            "endpoint",
-        ]
-        text_lower = text.lower()
-        return any(hint in text_lower for hint in interaction_hints)
+        return bool(self._scan_keywords(text)["url_hint"])
 
     def _flag_reasons(self, flags: GenerationFlags) -> list[str]:
         reasons: list[str] = []
@@ -0,0 +1,103 @@
+"""Single-pass multi-keyword matching for complexity analysis.
+
+Shared by baseline-agent-cli and baseline-langchain, which are built and
+deployed separately. The canonical copy is
+baseline-agent-cli/janus_baseline_agent_cli/services/keyword_matcher.py; edit it
+there and run ``python scripts/sync_shared_modules.py`` to update the vendored
+copy (a test fails while the copies differ).
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from typing import Iterable, Mapping
+
+KeywordScan = dict[str, frozenset[str]]
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over named groups of lowercase keywords.
+
+    ``scan`` walks the lowercased text once and reports, per group, every
+    keyword that occurs as a substring, matching the result of separate
+    ``keyword in text.lower()`` checks for each keyword.
+    """
+
+    def __init__(self, groups: Mapping[str, Iterable[str]]) -> None:
+        self._groups = {name: frozenset(keywords) for name, keywords in groups.items()}
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Keywords ending at each state, including those reached via failure links.
+        self._output: list[frozenset[str]] = [frozenset()]
+        for keywords in self._groups.values():
+            for keyword in keywords:
+                self._add(keyword)
+        self._build_failure_links()
+        self._keyword_groups: dict[str, tuple[str, ...]] = {}
+        for name, keywords in self._groups.items():
+            for keyword in keywords:
+                self._keyword_groups[keyword] = self._keyword_groups.get(keyword, ()) + (name,)
+
+    def _add(self, keyword: str) -> None:
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(frozenset())
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state] = self._output[state] | {keyword}
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links, then fold them into a full transition table.
+
+        ``self._delta[state]`` holds every transition out of ``state`` (its
+        own plus those inherited through failure links), so scanning is one
+        dict lookup per character; characters absent from it lead to the root.
+        """
+        self._delta: list[dict[str, int]] = [dict(self._goto[0])]
+        self._delta.extend({} for _ in range(len(self._goto) - 1))
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            self._delta[state] = {**self._delta[self._fail[state]], **self._goto[state]}
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = (
+                    self._output[next_state] | self._output[self._fail[next_state]]
+                )
+
+    def scan(self, text: str) -> KeywordScan:
+        """Return the keywords of each group that occur in ``text``."""
+        delta, output = self._delta, self._output
+        found: set[str] = set()
+        state = 0
+        for char in text.lower():
+            state = delta[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        by_group: dict[str, set[str]] = {name: set() for name in self._groups}
+        for keyword in found:
+            for name in self._keyword_groups[keyword]:
+                by_group[name].add(keyword)
+        return {name: frozenset(keywords) for name, keywords in by_group.items()}
+
+
+def separable_anchors(pattern: str) -> tuple[str, str]:
+    """Literal head and tail of a ``head\\s+.+\\s+tail`` pattern.
+
+    A pattern can only match when both occur in the text, so the regex is
+    skipped unless the keyword scan found them.
+    """
+    head = re.match(r"[^\\(\[.]+", pattern)
+    tail = pattern.rsplit(r"\s+", 1)[-1]
+    return (head.group(0) if head else ""), tail
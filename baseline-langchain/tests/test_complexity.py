@@ -60,3 +60,13 @@ def test_complexity_url_interaction(detector: ComplexityDetector) -> None:
     analysis = detector.analyze([_message("Check https://example.com and verify it")])
     assert analysis.is_complex
     assert analysis.reason == "url_interaction"
+
+
+def test_complexity_german_separable_verb_needs_both_parts(
+    detector: ComplexityDetector,
+) -> None:
+    analysis = detector.analyze([_message("Lade das Repo von GitHub herunter")])
+    assert analysis.is_complex
+    assert "herunterladen" in analysis.keywords_matched
+
+    assert "herunterladen" not in detector._matched_complex_keywords("herunter und lade")
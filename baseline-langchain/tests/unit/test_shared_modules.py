@@ -0,0 +1,27 @@
+"""Check that vendored shared modules match their canonical source."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SYNC_SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "sync_shared_modules.py"
+
+pytestmark = pytest.mark.skipif(
+    not SYNC_SCRIPT.exists(), reason="repository root not available"
+)
+
+
+def _load_sync_script():
+    spec = importlib.util.spec_from_file_location("sync_shared_modules", SYNC_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_vendored_modules_match_their_source() -> None:
+    stale = _load_sync_script().stale_copies()
+    assert stale == [], (
+        f"vendored copies out of sync: {stale}; "
+        "run `python scripts/sync_shared_modules.py`"
+    )
@@ -26,6 +26,13 @@ class Settings(BaseSettings):
     request_timeout: int = Field(default=300, description="Request timeout in seconds")
     max_request_size: int = Field(default=10_485_760, description="Max request size in bytes (10MB)")
     keep_alive_interval: float = Field(default=1.5, description="SSE keep-alive interval in seconds")
+    sse_passthrough: bool = Field(
+        default=True,
+        description=(
+            "Forward competitor SSE chunks verbatim instead of re-framing each line "
+            "(line mode is always used when the log level is DEBUG)"
+        ),
+    )
     deep_research_timeout: int = Field(
         default=1200,
         description="Deep research request timeout in seconds",
@@ -63,6 +70,32 @@ class Settings(BaseSettings):
         ),
     )
 
+    competitor_warm_keeper_interval: float = Field(
+        default=600.0,
+        description=(
+            "Seconds of competitor inactivity before the gateway pings its /health "
+            "to keep it from idling down (0 disables)"
+        ),
+    )
+
+    # Upstream connection pooling (shared clients owned by CompetitorRegistry)
+    upstream_max_connections: int = Field(
+        default=100,
+        description="Max pooled connections per upstream client",
+    )
+    upstream_max_keepalive_connections: int = Field(
+        default=20,
+        description="Max idle keep-alive connections per upstream client",
+    )
+    upstream_keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle upstream connection is kept open",
+    )
+    upstream_http2: bool = Field(
+        default=True,
+        description="Negotiate HTTP/2 with upstreams that support it",
+    )
+
     # Sandy settings
     sandy_base_url: Optional[str] = Field(default=None, description="Sandy API base URL")
     sandy_api_key: Optional[str] = Field(default=None, description="Sandy API key")
@@ -94,6 +127,18 @@ class Settings(BaseSettings):
         description="SearXNG API URL for web search fallback",
         validation_alias=AliasChoices("SEARXNG_API_URL", "JANUS_SEARXNG_API_URL"),
     )
+    web_search_cache_ttl: float = Field(
+        default=600.0,
+        description="Seconds to cache web search results (0 disables caching)",
+    )
+    web_search_negative_ttl: float = Field(
+        default=30.0,
+        description="Seconds to cache web search provider failures",
+    )
+    web_search_cache_size: int = Field(
+        default=1024,
+        description="Maximum number of cached web search queries",
+    )
     firecrawl_api_key: Optional[str] = Field(
         default=None,
         description="Firecrawl API key",
@@ -135,9 +180,31 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("SCORING_SERVICE_URL", "JANUS_SCORING_SERVICE_URL"),
     )
 
+    # File attachment extraction
+    file_extraction_workers: int = Field(
+        default=2,
+        description="Worker processes used to extract text from document attachments",
+    )
+    file_extraction_timeout: float = Field(
+        default=30.0,
+        description="Per-attachment extraction timeout in seconds",
+    )
+    file_extraction_cache_size: int = Field(
+        default=128,
+        description="Extracted attachments kept in the content-hash LRU cache",
+    )
+
     # Artifact storage
     artifact_storage_path: str = Field(default="/tmp/janus_artifacts", description="Local artifact storage path")
     artifact_ttl_seconds: int = Field(default=3600, description="Artifact TTL in seconds")
+    artifact_max_bytes: int = Field(
+        default=2_147_483_648,
+        description="Artifact storage budget in bytes; least recently used artifacts are evicted",
+    )
+    artifact_cleanup_interval: float = Field(
+        default=300.0,
+        description="Seconds between background sweeps for expired artifacts",
+    )
 
     # Logging
     log_level: str = Field(default="INFO", description="Log level")
@@ -1,5 +1,7 @@
 """Janus Gateway - FastAPI application entry point."""
 
+import asyncio
+import contextlib
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -14,6 +16,7 @@ from janus_gateway.middleware.pre_release_password import PreReleasePasswordMidd
 from janus_gateway.routers import (
     artifacts_router,
     chat_router,
+    competitors_router,
     debug_router,
     health_router,
     logs_router,
@@ -27,6 +30,8 @@ from janus_gateway.routers import (
     research_router,
     tts_router,
 )
+from janus_gateway.services import get_artifact_store, get_competitor_registry
+from janus_gateway.services.message_processor import shutdown_extraction_pool
 
 settings = get_settings()
 
@@ -95,9 +100,28 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         debug=settings.debug,
     )
     log_service_health_status()
+    artifact_cleanup = asyncio.create_task(
+        get_artifact_store().run_cleanup_loop(settings.artifact_cleanup_interval)
+    )
+    background_tasks = [artifact_cleanup]
+    if settings.competitor_warm_keeper_interval > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                get_competitor_registry().run_warm_keeper(settings.competitor_warm_keeper_interval)
+            )
+        )
     yield
     # Shutdown
     logger.info("gateway_stopping")
+    for task in background_tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    # Closed stores are dropped from the cache so a restarted app reopens it.
+    get_artifact_store().close()
+    get_artifact_store.cache_clear()
+    await get_competitor_registry().aclose()
+    shutdown_extraction_pool()
 
 
 # Create FastAPI app
@@ -144,6 +168,7 @@ app.add_middleware(
 app.include_router(health_router)
 app.include_router(chat_router)
 app.include_router(models_router)
+app.include_router(competitors_router)
 app.include_router(artifacts_router)
 app.include_router(debug_router)
 app.include_router(logs_router)
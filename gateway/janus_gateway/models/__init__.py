@@ -30,6 +30,8 @@ from .janus import (
     JanusEvent,
     JanusEventType,
     CompetitorInfo,
+    CompetitorStats,
+    CompetitorStatsResponse,
     HealthResponse,
     ModelInfo,
     ModelsResponse,
@@ -73,6 +75,8 @@ __all__ = [
     "JanusEvent",
     "JanusEventType",
     "CompetitorInfo",
+    "CompetitorStats",
+    "CompetitorStatsResponse",
     "HealthResponse",
     "ModelInfo",
     "ModelsResponse",
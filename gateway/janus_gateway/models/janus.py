@@ -57,6 +57,28 @@ class CompetitorInfo(BaseModel):
     is_baseline: bool = False
 
 
+class CompetitorStats(BaseModel):
+    """Observed health of a competitor."""
+
+    id: str
+    url: str
+    warm: bool
+    ttft_ewma_ms: Optional[float] = None
+    completion_ewma_ms: Optional[float] = None
+    error_rate: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    last_seen_warm: Optional[datetime] = None
+    last_error: Optional[str] = None
+
+
+class CompetitorStatsResponse(BaseModel):
+    """Response for /v1/competitors/stats endpoint."""
+
+    object: str = "list"
+    data: list[CompetitorStats]
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
 
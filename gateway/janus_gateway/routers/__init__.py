@@ -3,6 +3,7 @@
 from .health import router as health_router
 from .chat import router as chat_router
 from .models import router as models_router
+from .competitors import router as competitors_router
 from .artifacts import router as artifacts_router
 from .transcription import router as transcription_router
 from .research import router as research_router
@@ -19,6 +20,7 @@ __all__ = [
     "health_router",
     "chat_router",
     "models_router",
+    "competitors_router",
     "artifacts_router",
     "transcription_router",
     "research_router",
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict, deque
+from collections import deque
 from datetime import datetime, timedelta, timezone
+import json
 import time
-from typing import Deque, Optional
+from typing import AsyncGenerator, Deque, Optional, Union
 
 import httpx
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from janus_gateway.config import Settings, get_settings
+from janus_gateway.middleware.logging import get_correlation_id, get_request_id
 from janus_gateway.models import (
     ArenaCompletionResponse,
     ArenaResponseMessage,
@@ -22,8 +25,10 @@ from janus_gateway.models import (
     ChatCompletionResponse,
     Message,
 )
+from janus_gateway.routers.chat import generate_completion_id, stream_from_competitor
 from janus_gateway.services import ArenaPromptStore, ArenaService, MessageProcessor, get_competitor_registry
 from janus_gateway.services.competitor_registry import CompetitorRegistry
+from janus_gateway.services.expiring_map import ExpiringMap
 
 
 router = APIRouter(tags=["arena"])
@@ -31,11 +36,16 @@ logger = structlog.get_logger()
 message_processor = MessageProcessor()
 prompt_store = ArenaPromptStore()
 
-_vote_history: dict[str, Deque[float]] = defaultdict(deque)
 _VOTE_WINDOW_SECONDS = 60 * 60
 _VOTE_LIMIT = 50
+_VOTE_HISTORY_MAX_CLIENTS = 50_000
+# Keys idle for a full window have nothing left to rate-limit and expire.
+_vote_history: ExpiringMap[str, Deque[float]] = ExpiringMap(
+    ttl_seconds=_VOTE_WINDOW_SECONDS, max_size=_VOTE_HISTORY_MAX_CLIENTS
+)
 _MIN_VIEW_SECONDS = 5
 _MIN_SESSION_AGE_SECONDS = 60 * 60
+_ARENA_SIDES = ("a", "b")
 
 
 def _get_prompt_text(messages: list[Message]) -> str:
@@ -71,12 +81,15 @@ def _extract_content(response: ChatCompletionResponse) -> str:
 
 def _check_rate_limit(key: str) -> None:
     now = time.monotonic()
-    history = _vote_history[key]
+    history = _vote_history.get(key)
+    if history is None:
+        history = deque(maxlen=_VOTE_LIMIT)
     while history and now - history[0] > _VOTE_WINDOW_SECONDS:
         history.popleft()
     if len(history) >= _VOTE_LIMIT:
         raise HTTPException(status_code=429, detail="Too many votes, slow down.")
     history.append(now)
+    _vote_history.set(key, history)
 
 
 def _session_age_seconds(created_at: int) -> Optional[float]:
@@ -107,33 +120,128 @@ async def _fetch_competitor(
     return ChatCompletionResponse(**payload)
 
 
+def _tag_arena_event(side: str, event: str) -> Optional[str]:
+    """Re-frame one competitor SSE event as a side-tagged arena event.
+
+    Comments and per-side ``[DONE]`` markers are dropped (the multiplexer
+    emits its own keep-alives and completion events), and the model name is
+    removed so the comparison stays blind until the vote.
+    """
+    if not event.startswith("data:"):
+        return None
+    data = event[5:].strip()
+    if not data or data == "[DONE]":
+        return None
+    try:
+        payload = json.loads(data)
+    except json.JSONDecodeError:
+        logger.warning("arena_stream_invalid_chunk", side=side, preview=data[:100])
+        return None
+    if not isinstance(payload, dict):
+        return None
+    payload.pop("model", None)
+    payload["side"] = side
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+async def _stream_arena(
+    registry: CompetitorRegistry,
+    requests: dict[str, ChatCompletionRequest],
+    prompt_id: str,
+    completion_id: str,
+    settings: Settings,
+) -> AsyncGenerator[str, None]:
+    """Multiplex both competitor streams into one SSE stream.
+
+    Each side is read by its own task through ``stream_from_competitor``, so
+    the pooled per-competitor clients, cold-start retries and health tracking
+    all apply; deltas are forwarded as soon as either side produces them.
+    """
+    # Line mode frames every upstream event on its own, which is what the
+    # re-tagging below needs; passthrough chunks may split events.
+    line_settings = settings.model_copy(update={"sse_passthrough": False})
+    correlation_id = get_correlation_id()
+    queue: asyncio.Queue[tuple[str, Optional[str]]] = asyncio.Queue()
+
+    async def pump(side: str) -> None:
+        side_request = requests[side]
+        competitor = registry.get(side_request.model)
+        try:
+            if competitor is None:
+                return
+            async for event in stream_from_competitor(
+                registry.get_client(competitor.id),
+                competitor.url,
+                side_request,
+                f"{completion_id}-{side}",
+                line_settings,
+                correlation_id=correlation_id,
+                health=registry.health(competitor.id),
+            ):
+                tagged = _tag_arena_event(side, event)
+                if tagged:
+                    await queue.put((side, tagged))
+        finally:
+            await queue.put((side, None))
+
+    yield f"data: {json.dumps({'object': 'arena.prompt', 'prompt_id': prompt_id})}\n\n"
+    tasks = [asyncio.create_task(pump(side)) for side in _ARENA_SIDES]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            try:
+                side, event = await asyncio.wait_for(
+                    queue.get(), timeout=settings.keep_alive_interval
+                )
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if event is None:
+                remaining -= 1
+                done_event = {"object": "arena.side.done", "side": side}
+                yield f"data: {json.dumps(done_event)}\n\n"
+                continue
+            yield event
+        yield "data: [DONE]\n\n"
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 @router.post("/v1/chat/completions/arena", response_model=ArenaCompletionResponse)
 async def arena_chat(
     request: ChatCompletionRequest,
     registry: CompetitorRegistry = Depends(get_competitor_registry),
     settings: Settings = Depends(get_settings),
-) -> ArenaCompletionResponse:
+) -> Union[ArenaCompletionResponse, StreamingResponse]:
+    """Run one prompt against two anonymous competitors.
+
+    With ``stream: true`` both competitors are streamed concurrently and
+    multiplexed into a single SSE stream whose chunks carry ``side: "a"``
+    or ``side: "b"``; otherwise both full responses are returned together.
+    """
     arena_service = ArenaService(registry)
     try:
         model_a, model_b = arena_service.get_arena_pair()
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    processed_messages = [
-        message_processor.process_message(message) for message in request.messages
-    ]
+    processed_messages = await message_processor.process_messages(request.messages)
     prompt_text = _get_prompt_text(processed_messages)
+    stream = request.stream
     processed_request = request.model_copy(
-        update={"messages": processed_messages, "stream": False}
+        update={"messages": processed_messages, "stream": stream}
     )
 
-    request_a = processed_request.model_copy(update={"model": model_a, "stream": False})
-    request_b = processed_request.model_copy(update={"model": model_b, "stream": False})
+    request_a = processed_request.model_copy(update={"model": model_a})
+    request_b = processed_request.model_copy(update={"model": model_b})
 
     logger.info(
         "arena_request",
         model_a=model_a,
         model_b=model_b,
+        stream=stream,
         message_count=len(processed_messages),
     )
 
@@ -142,12 +250,34 @@ async def arena_chat(
     if not competitor_a or not competitor_b:
         raise HTTPException(status_code=400, detail="Arena models unavailable")
 
-    async with httpx.AsyncClient() as client:
-        response_a, response_b = await asyncio.gather(
-            _fetch_competitor(client, competitor_a.url, request_a, settings),
-            _fetch_competitor(client, competitor_b.url, request_b, settings),
+    if stream:
+        prompt_record = prompt_store.create(
+            prompt=prompt_text,
+            model_a=model_a,
+            model_b=model_b,
+            user_id=request.user_id,
+        )
+        return StreamingResponse(
+            _stream_arena(
+                registry,
+                {"a": request_a, "b": request_b},
+                prompt_record.prompt_id,
+                get_request_id() or generate_completion_id(),
+                settings,
+            ),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
         )
 
+    response_a, response_b = await asyncio.gather(
+        _fetch_competitor(
+            registry.get_client(competitor_a.id), competitor_a.url, request_a, settings
+        ),
+        _fetch_competitor(
+            registry.get_client(competitor_b.id), competitor_b.url, request_b, settings
+        ),
+    )
+
     prompt_record = prompt_store.create(
         prompt=prompt_text,
         model_a=model_a,
@@ -166,6 +296,7 @@ async def arena_chat(
 async def submit_vote(
     vote: ArenaVoteRequest,
     request: Request,
+    registry: CompetitorRegistry = Depends(get_competitor_registry),
     settings: Settings = Depends(get_settings),
 ) -> ArenaVoteResponse:
     prompt = prompt_store.get(vote.prompt_id)
@@ -196,13 +327,14 @@ async def submit_vote(
     }
 
     scoring_url = settings.scoring_service_url.rstrip("/")
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.post(f"{scoring_url}/api/arena/vote", json=payload)
-        if response.status_code == 409:
-            raise HTTPException(status_code=409, detail="Vote already recorded")
-        if response.status_code >= 400:
-            detail = response.text if response.text else "Scoring service error"
-            raise HTTPException(status_code=502, detail=detail)
+    response = await registry.get_client().post(
+        f"{scoring_url}/api/arena/vote", json=payload, timeout=10.0
+    )
+    if response.status_code == 409:
+        raise HTTPException(status_code=409, detail="Vote already recorded")
+    if response.status_code >= 400:
+        detail = response.text if response.text else "Scoring service error"
+        raise HTTPException(status_code=502, detail=detail)
 
     prompt_store.mark_voted(prompt.prompt_id)
     return ArenaVoteResponse(
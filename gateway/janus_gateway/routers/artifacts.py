@@ -1,7 +1,9 @@
 """Artifact retrieval endpoint."""
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import FileResponse
 
 from janus_gateway.services import ArtifactStore, get_artifact_store
 
@@ -12,21 +14,25 @@ router = APIRouter(prefix="/v1", tags=["artifacts"])
 async def get_artifact(
     artifact_id: str,
     store: ArtifactStore = Depends(get_artifact_store),
-) -> Response:
-    """Retrieve an artifact by ID."""
-    artifact = store.get(artifact_id)
+) -> FileResponse:
+    """Retrieve an artifact by ID.
+
+    Data is streamed from disk, and HTTP range requests are honoured so
+    audio and video players can seek without downloading the whole file.
+    """
+    # One indexed lookup (and one access-time write), kept off the event loop.
+    artifact, file_path = await asyncio.to_thread(store.get_with_path, artifact_id)
     if not artifact:
         raise HTTPException(status_code=404, detail="Artifact not found")
 
-    data = store.get_data(artifact_id)
-    if not data:
+    if not file_path:
         raise HTTPException(status_code=404, detail="Artifact data not found")
 
-    return Response(
-        content=data,
+    return FileResponse(
+        file_path,
         media_type=artifact.mime_type,
+        filename=artifact.display_name,
         headers={
-            "Content-Disposition": f'attachment; filename="{artifact.display_name}"',
             "X-Artifact-Id": artifact.id,
             "X-Artifact-Size": str(artifact.size_bytes),
         },
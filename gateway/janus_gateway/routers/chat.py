@@ -2,6 +2,7 @@
 
 import asyncio
 import contextlib
+import re
 import time
 import uuid
 from typing import AsyncGenerator, Union, cast
@@ -22,6 +23,14 @@ COLD_START_FAST_RESPONSE_SECONDS = 5.0
 COLD_START_MAX_ATTEMPTS = 6
 COLD_START_INITIAL_BACKOFF_SECONDS = 2.0
 COLD_START_MAX_BACKOFF_SECONDS = 15.0
+
+# Passthrough mode forwards upstream text chunks verbatim. Only the
+# terminating `data: [DONE]` line has to be recognised; JSON payloads never
+# contain a literal newline, so a newline-anchored match cannot fire on a
+# "[DONE]" that merely appears inside message content.
+SSE_DONE_PATTERN = re.compile(r"\ndata: ?\[DONE\][ \t]*(?:\r?\n|$)")
+SSE_TAIL_CHARS = 64
+SSE_EVENT_BOUNDARIES = ("\n\n", "\r\n\r\n")
 from fastapi import APIRouter, Depends, Request, Response
 from fastapi.responses import StreamingResponse
 
@@ -45,7 +54,9 @@ from janus_gateway.models import (
     Usage,
 )
 from janus_gateway.services import CompetitorRegistry, MessageProcessor, get_competitor_registry
+from janus_gateway.services.competitor_registry import CompetitorHealth
 from janus_gateway.services.debug_registry import DebugRequestRegistry, get_debug_registry
+from janus_gateway.services.sse_decoder import SSEDecoder, SSEEvent
 
 router = APIRouter(prefix="/v1", tags=["chat"])
 logger = structlog.get_logger()
@@ -72,11 +83,17 @@ async def stream_from_competitor(
     baseline_agent: str | None = None,
     correlation_id: str | None = None,
     trace_request_id: str | None = None,
+    health: CompetitorHealth | None = None,
 ) -> AsyncGenerator[str, None]:
-    """Stream responses from a competitor, adding keep-alives."""
+    """Stream responses from a competitor, adding keep-alives.
+
+    When ``health`` is given, time-to-first-chunk and failures are recorded
+    on it for the competitor registry's routing and stats.
+    """
     keep_alive_interval = settings.keep_alive_interval
     done_sent = False
     chunk_count = 0
+    first_chunk_seen = False
     start_time = time.time()
 
     # Prepare request for competitor (exclude janus-specific fields)
@@ -135,6 +152,8 @@ async def stream_from_competitor(
                 attempt=attempt,
             )
             if response.status_code == 200:
+                if health:
+                    health.mark_warm()
                 break
 
             error_body = await response.aread()
@@ -155,6 +174,8 @@ async def stream_from_competitor(
             stream_ctx = None
 
             if not is_wake_up_signal:
+                if health:
+                    health.record_error(f"HTTP {cold_start_final_status}")
                 logger.error(
                     "baseline_error",
                     status_code=cold_start_final_status,
@@ -189,6 +210,8 @@ async def stream_from_competitor(
             backoff = min(backoff * 2, COLD_START_MAX_BACKOFF_SECONDS)
 
         if response is None or stream_ctx is None:
+            if health:
+                health.record_error(f"cold start exhausted (HTTP {cold_start_final_status})")
             logger.error(
                 "baseline_cold_start_exhausted",
                 status_code=cold_start_final_status,
@@ -214,14 +237,25 @@ async def stream_from_competitor(
             return
 
         try:
-
+            # Without debug logging there is nothing to classify, so the
+            # upstream stream is forwarded chunk-by-chunk instead of being
+            # split into lines and re-framed.
+            passthrough = settings.sse_passthrough and settings.log_level.upper() != "DEBUG"
             line_queue: asyncio.Queue[object] = asyncio.Queue()
             done_sentinel = object()
 
             async def read_lines() -> None:
                 try:
-                    async for line in response.aiter_lines():
-                        await line_queue.put(line)
+                    if passthrough:
+                        async for text in response.aiter_text():
+                            await line_queue.put(text)
+                    else:
+                        decoder = SSEDecoder(include_comments=True)
+                        async for raw in response.aiter_bytes():
+                            for event in decoder.feed(raw):
+                                await line_queue.put(event)
+                        for event in decoder.flush():
+                            await line_queue.put(event)
                 except asyncio.CancelledError:
                     raise
                 except Exception as exc:
@@ -230,6 +264,9 @@ async def stream_from_competitor(
                     await line_queue.put(done_sentinel)
 
             reader_task = asyncio.create_task(read_lines())
+            # Trailing characters of the forwarded stream, used to find event
+            # boundaries and a [DONE] marker split across chunks.
+            tail = "\n\n"
             try:
                 while True:
                     try:
@@ -237,48 +274,83 @@ async def stream_from_competitor(
                             line_queue.get(), timeout=keep_alive_interval
                         )
                     except asyncio.TimeoutError:
+                        if passthrough and not tail.endswith(SSE_EVENT_BOUNDARIES):
+                            # Upstream paused mid-event; a comment here would
+                            # corrupt the event being forwarded.
+                            continue
                         yield ": ping\n\n"
                         continue
 
                     if item is done_sentinel:
+                        if passthrough and not tail.endswith(SSE_EVENT_BOUNDARIES):
+                            # Terminate a dangling event before our own [DONE].
+                            yield "\n\n"
                         break
                     if isinstance(item, Exception):
                         raise item
 
-                    line = cast(str, item)
-                    if line.startswith("data:") or line.startswith(":"):
+                    if passthrough:
+                        chunk = cast(str, item)
+                        if not chunk:
+                            continue
                         chunk_count += 1
-                        # Determine chunk type for logging
-                        chunk_type = "ping" if line.startswith(":") else "data"
-                        if line.startswith("data:"):
-                            data_content = line[5:].strip()
-                            if data_content == "[DONE]":
-                                chunk_type = "done"
-                            elif '"reasoning_content"' in data_content:
-                                chunk_type = "reasoning"
-                            elif '"content"' in data_content:
-                                chunk_type = "content"
-                            elif '"artifact"' in data_content:
-                                chunk_type = "artifact"
-
-                        # Log every Nth chunk to avoid log bloat (or important events)
-                        if chunk_count <= 3 or chunk_count % 50 == 0 or chunk_type in ("done", "artifact"):
-                            logger.debug(
-                                "sse_chunk_forwarded",
-                                chunk_type=chunk_type,
-                                chunk_number=chunk_count,
-                                chunk_preview=line[:100] if len(line) > 100 else line,
-                            )
-
-                        yield f"{line}\n\n"
-                        if line.startswith("data:") and line[5:].strip() == "[DONE]":
+                        if not first_chunk_seen and "data:" in chunk:
+                            first_chunk_seen = True
+                            if health:
+                                health.record_success(time.time() - start_time)
+                        yield chunk
+                        window = tail + chunk
+                        tail = window[-SSE_TAIL_CHARS:]
+                        if SSE_DONE_PATTERN.search(window):
                             done_sent = True
                             logger.info(
                                 "sse_stream_complete",
                                 total_chunks=chunk_count,
                                 duration_ms=round((time.time() - start_time) * 1000, 2),
+                                passthrough=True,
                             )
                             break
+                        continue
+
+                    event = cast(SSEEvent, item)
+                    chunk_count += 1
+                    # Determine chunk type for logging
+                    chunk_type = "ping" if event.comment is not None else "data"
+                    data_content = event.data.strip()
+                    if chunk_type == "data":
+                        if data_content == "[DONE]":
+                            chunk_type = "done"
+                        elif '"reasoning_content"' in data_content:
+                            chunk_type = "reasoning"
+                        elif '"content"' in data_content:
+                            chunk_type = "content"
+                        elif '"artifact"' in data_content:
+                            chunk_type = "artifact"
+
+                    if chunk_type != "ping" and not first_chunk_seen:
+                        first_chunk_seen = True
+                        if health:
+                            health.record_success(time.time() - start_time)
+
+                    encoded = event.encode()
+                    # Log every Nth chunk to avoid log bloat (or important events)
+                    if chunk_count <= 3 or chunk_count % 50 == 0 or chunk_type in ("done", "artifact"):
+                        logger.debug(
+                            "sse_chunk_forwarded",
+                            chunk_type=chunk_type,
+                            chunk_number=chunk_count,
+                            chunk_preview=encoded[:100],
+                        )
+
+                    yield encoded
+                    if chunk_type == "done":
+                        done_sent = True
+                        logger.info(
+                            "sse_stream_complete",
+                            total_chunks=chunk_count,
+                            duration_ms=round((time.time() - start_time) * 1000, 2),
+                        )
+                        break
             finally:
                 if not reader_task.done():
                     reader_task.cancel()
@@ -292,6 +364,8 @@ async def stream_from_competitor(
 
     except httpx.TimeoutException:
         logger.error("competitor_timeout", url=competitor_url)
+        if health:
+            health.record_error("timeout")
         error_chunk = ChatCompletionChunk(
             id=completion_id,
             model=request.model,
@@ -307,6 +381,8 @@ async def stream_from_competitor(
         return
     except httpx.RequestError as e:
         logger.error("competitor_request_error", error=str(e))
+        if health:
+            health.record_error(str(e) or type(e).__name__)
         error_chunk = ChatCompletionChunk(
             id=completion_id,
             model=request.model,
@@ -429,9 +505,7 @@ async def chat_completions(
         message_preview=message_preview,
     )
 
-    processed_messages = [
-        message_processor.process_message(message) for message in request.messages
-    ]
+    processed_messages = await message_processor.process_messages(request.messages)
     processed_request = request.model_copy(update={"messages": processed_messages})
 
     # Resolve competitor: explicit competitor_id overrides model-based selection.
@@ -465,19 +539,19 @@ async def chat_completions(
         # Streaming response
         if competitor:
             async def stream_with_logging() -> AsyncGenerator[str, None]:
-                async with httpx.AsyncClient() as client:
-                    async for chunk in stream_from_competitor(
-                        client,
-                        competitor.url,
-                        processed_request,
-                        request_id,
-                        settings,
-                        debug_request_id,
-                        baseline_agent,
-                        correlation_id,
-                        request_id,
-                    ):
-                        yield chunk
+                async for chunk in stream_from_competitor(
+                    registry.get_client(competitor.id),
+                    competitor.url,
+                    processed_request,
+                    request_id,
+                    settings,
+                    debug_request_id,
+                    baseline_agent,
+                    correlation_id,
+                    request_id,
+                    health=registry.health(competitor.id),
+                ):
+                    yield chunk
                 logger.info(
                     "chat_completion_complete",
                     completion_id=request_id,
@@ -518,36 +592,39 @@ async def chat_completions(
     else:
         # Non-streaming response
         if competitor:
-            async with httpx.AsyncClient() as client:
-                try:
-                    fwd_headers: dict[str, str] = {}
-                    if debug_request_id:
-                        fwd_headers["X-Debug-Request-Id"] = debug_request_id
-                    if baseline_agent:
-                        fwd_headers["X-Baseline-Agent"] = baseline_agent
-                    if request_id:
-                        fwd_headers[REQUEST_ID_HEADER] = request_id
-                    competitor_response = await client.post(
-                        f"{competitor.url}/v1/chat/completions",
-                        json=processed_request.model_dump(
-                            exclude_none=True,
-                            exclude={"competitor_id"},
-                        ),
-                        timeout=settings.request_timeout,
-                        headers=fwd_headers or None,
-                    )
-                    competitor_response.raise_for_status()
-                    data = competitor_response.json()
-                    # Override the ID
-                    data["id"] = request_id
-                    return ChatCompletionResponse(**data)
-                except httpx.RequestError as e:
-                    logger.warning(
-                        "competitor_unavailable_fallback_mock",
-                        error=str(e),
-                        competitor_id=competitor.id,
-                    )
-                    # Fall through to mock response
+            client = registry.get_client(competitor.id)
+            try:
+                fwd_headers: dict[str, str] = {}
+                if debug_request_id:
+                    fwd_headers["X-Debug-Request-Id"] = debug_request_id
+                if baseline_agent:
+                    fwd_headers["X-Baseline-Agent"] = baseline_agent
+                if request_id:
+                    fwd_headers[REQUEST_ID_HEADER] = request_id
+                upstream_start = time.time()
+                competitor_response = await client.post(
+                    f"{competitor.url}/v1/chat/completions",
+                    json=processed_request.model_dump(
+                        exclude_none=True,
+                        exclude={"competitor_id"},
+                    ),
+                    timeout=settings.request_timeout,
+                    headers=fwd_headers or None,
+                )
+                competitor_response.raise_for_status()
+                registry.health(competitor.id).record_completion(time.time() - upstream_start)
+                data = competitor_response.json()
+                # Override the ID
+                data["id"] = request_id
+                return ChatCompletionResponse(**data)
+            except httpx.RequestError as e:
+                registry.health(competitor.id).record_error(str(e) or type(e).__name__)
+                logger.warning(
+                    "competitor_unavailable_fallback_mock",
+                    error=str(e),
+                    competitor_id=competitor.id,
+                )
+                # Fall through to mock response
 
         # Mock non-streaming response (no competitor or competitor unavailable)
         # Note: use_mock is always True here since competitor success returns early
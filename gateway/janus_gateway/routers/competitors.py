@@ -0,0 +1,19 @@
+"""Competitor health statistics endpoint."""
+
+from fastapi import APIRouter, Depends
+
+from janus_gateway.config import Settings, get_settings
+from janus_gateway.models import CompetitorStatsResponse
+from janus_gateway.services import CompetitorRegistry, get_competitor_registry
+
+router = APIRouter(prefix="/v1", tags=["competitors"])
+
+
+@router.get("/competitors/stats", response_model=CompetitorStatsResponse)
+async def competitor_stats(
+    registry: CompetitorRegistry = Depends(get_competitor_registry),
+    settings: Settings = Depends(get_settings),
+) -> CompetitorStatsResponse:
+    """Report TTFT, error rate and warm state observed for each competitor."""
+    idle_seconds = settings.competitor_warm_keeper_interval or 15 * 60
+    return CompetitorStatsResponse(data=registry.stats(idle_seconds))
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, AsyncGenerator, Iterator
+from typing import Any, AsyncGenerator
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -13,6 +16,7 @@ from fastapi.responses import StreamingResponse
 from janus_gateway.config import Settings, get_settings
 from janus_gateway.services import CompetitorRegistry, get_competitor_registry
 from janus_gateway.services.debug_registry import DebugRequestRegistry, get_debug_registry
+from janus_gateway.services.log_index import LogIndex
 
 router = APIRouter(prefix="/api/debug", tags=["debug"])
 
@@ -28,41 +32,10 @@ LOG_FILES = {
 }
 
 
-def _iter_log_entries() -> Iterator[tuple[str, dict[str, Any] | str]]:
-    for service_name, path in LOG_FILES.items():
-        if not path.exists():
-            continue
-        with path.open("r", encoding="utf-8", errors="replace") as handle:
-            for line in handle:
-                trimmed = line.strip()
-                if not trimmed:
-                    continue
-                try:
-                    payload = json.loads(trimmed)
-                except json.JSONDecodeError:
-                    payload = trimmed
-                yield service_name, payload
-
-
-def _match_log_filters(
-    payload: dict[str, Any] | str,
-    request_id: str | None,
-    service: str | None,
-    level: str | None,
-    service_name: str,
-) -> bool:
-    raw = payload if isinstance(payload, str) else json.dumps(payload, separators=(",", ":"))
-    if request_id and request_id not in raw:
-        return False
-    if level:
-        level_value = payload.get("level") if isinstance(payload, dict) else None
-        if level_value != level and level not in raw:
-            return False
-    if service:
-        service_value = payload.get("service") if isinstance(payload, dict) else None
-        if service_value != service and service_name != service and service not in raw:
-            return False
-    return True
+@lru_cache
+def get_log_index() -> LogIndex:
+    """Get the shared index over the local log files."""
+    return LogIndex(LOG_FILES)
 
 
 def _collect_logs(
@@ -71,19 +44,9 @@ def _collect_logs(
     level: str | None,
     limit: int,
 ) -> list[dict[str, Any]]:
-    results: list[dict[str, Any]] = []
-    for service_name, payload in _iter_log_entries():
-        if not _match_log_filters(payload, request_id, service, level, service_name):
-            continue
-        if isinstance(payload, dict):
-            entry = dict(payload)
-            entry.setdefault("service", service_name)
-        else:
-            entry = {"message": payload, "service": service_name}
-        results.append(entry)
-        if len(results) >= limit:
-            break
-    return results
+    index = get_log_index()
+    index.refresh()
+    return index.query(request_id=request_id, service=service, level=level, limit=limit)
 
 
 @router.get("/stream/{request_id}")
@@ -145,9 +108,10 @@ async def search_logs(
     """
     Search logs across services.
 
-    For local dev, this scans local log files when present.
+    For local dev, this queries an incremental index over the local log
+    files when present.
     """
-    logs = _collect_logs(request_id, service, level, limit)
+    logs = await asyncio.to_thread(_collect_logs, request_id, service, level, limit)
     return {
         "logs": logs,
         "filters_applied": {
@@ -159,10 +123,41 @@ async def search_logs(
     }
 
 
+@router.get("/logs/follow")
+async def follow_logs(
+    request_id: str | None = Query(default=None),
+    service: str | None = Query(default=None),
+    level: str | None = Query(default=None),
+    settings: Settings = Depends(get_settings),
+) -> StreamingResponse:
+    """Stream newly written log entries matching the filters as SSE."""
+
+    async def event_stream() -> AsyncGenerator[str, None]:
+        last_sent = time.monotonic()
+        async for entries in get_log_index().follow(request_id, service, level):
+            for entry in entries:
+                yield f"data: {json.dumps(entry, default=str)}\n\n"
+            now = time.monotonic()
+            if entries:
+                last_sent = now
+            elif now - last_sent >= settings.keep_alive_interval:
+                last_sent = now
+                yield ": ping\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+        },
+    )
+
+
 @router.get("/trace/{request_id}")
 async def get_request_trace(request_id: str) -> dict[str, Any]:
     """Return a summarized trace for a request ID."""
-    logs = _collect_logs(request_id, None, None, 200)
+    logs = await asyncio.to_thread(_collect_logs, request_id, None, None, 200)
     trace: list[dict[str, Any]] = []
     for entry in logs:
         trace.append(
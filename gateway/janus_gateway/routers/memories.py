@@ -7,6 +7,7 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
 from janus_gateway.config import get_settings
+from janus_gateway.services import get_competitor_registry
 
 router = APIRouter(prefix="/api/memories", tags=["memories"])
 
@@ -35,37 +36,40 @@ async def list_memories(
     offset: int = Query(0, ge=0),
 ) -> dict[str, Any]:
     """List all memories for a user."""
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get(
-            f"{_memory_base_url()}/memories/list",
-            params={"user_id": user_id, "limit": limit, "offset": offset},
-        )
-        await _raise_for_status(response)
-        return cast(dict[str, Any], response.json())
+    client = get_competitor_registry().get_client()
+    response = await client.get(
+        f"{_memory_base_url()}/memories/list",
+        params={"user_id": user_id, "limit": limit, "offset": offset},
+        timeout=15.0,
+    )
+    await _raise_for_status(response)
+    return cast(dict[str, Any], response.json())
 
 
 @router.patch("/{memory_id}")
 async def update_memory(memory_id: str, body: MemoryUpdateRequest) -> dict[str, Any]:
     """Update a memory."""
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.patch(
-            f"{_memory_base_url()}/memories/{memory_id}",
-            json=body.model_dump(exclude_none=True),
-        )
-        await _raise_for_status(response)
-        return cast(dict[str, Any], response.json())
+    client = get_competitor_registry().get_client()
+    response = await client.patch(
+        f"{_memory_base_url()}/memories/{memory_id}",
+        json=body.model_dump(exclude_none=True),
+        timeout=15.0,
+    )
+    await _raise_for_status(response)
+    return cast(dict[str, Any], response.json())
 
 
 @router.delete("/clear")
 async def clear_memories(user_id: str = Query(...)) -> dict[str, Any]:
     """Clear all memories for a user."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.delete(
-            f"{_memory_base_url()}/memories/clear",
-            params={"user_id": user_id},
-        )
-        await _raise_for_status(response)
-        return cast(dict[str, Any], response.json())
+    client = get_competitor_registry().get_client()
+    response = await client.delete(
+        f"{_memory_base_url()}/memories/clear",
+        params={"user_id": user_id},
+        timeout=30.0,
+    )
+    await _raise_for_status(response)
+    return cast(dict[str, Any], response.json())
 
 
 @router.delete("/{memory_id}")
@@ -74,10 +78,11 @@ async def delete_memory(
     user_id: str = Query(...),
 ) -> dict[str, Any]:
     """Delete a memory."""
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.delete(
-            f"{_memory_base_url()}/memories/{memory_id}",
-            params={"user_id": user_id},
-        )
-        await _raise_for_status(response)
-        return cast(dict[str, Any], response.json())
+    client = get_competitor_registry().get_client()
+    response = await client.delete(
+        f"{_memory_base_url()}/memories/{memory_id}",
+        params={"user_id": user_id},
+        timeout=15.0,
+    )
+    await _raise_for_status(response)
+    return cast(dict[str, Any], response.json())
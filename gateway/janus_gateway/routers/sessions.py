@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 
 from janus_gateway.config import Settings, get_settings
+from janus_gateway.services import CompetitorRegistry, get_competitor_registry
 
 router = APIRouter(prefix="/api/sessions", tags=["sessions"])
 
@@ -55,68 +56,76 @@ async def _raise_for_status(response: httpx.Response) -> None:
 @router.get("")
 async def list_sessions(
     request: Request,
+    registry: CompetitorRegistry = Depends(get_competitor_registry),
     settings: Settings = Depends(get_settings),
 ) -> dict[str, Any]:
     """List all browser sessions for the authenticated user."""
-    async with httpx.AsyncClient(timeout=SESSION_TIMEOUT) as client:
-        response = await client.get(
-            f"{_session_base_url(settings)}/sessions",
-            headers=_get_auth_header(request),
-        )
-        await _raise_for_status(response)
-        return cast(dict[str, Any], response.json())
+    client = registry.get_client()
+    response = await client.get(
+        f"{_session_base_url(settings)}/sessions",
+        headers=_get_auth_header(request),
+        timeout=SESSION_TIMEOUT,
+    )
+    await _raise_for_status(response)
+    return cast(dict[str, Any], response.json())
 
 
 @router.post("")
 async def create_session(
     body: SessionCreateRequest,
     request: Request,
+    registry: CompetitorRegistry = Depends(get_competitor_registry),
     settings: Settings = Depends(get_settings),
 ) -> dict[str, Any]:
     """Create a new browser session."""
-    async with httpx.AsyncClient(timeout=SESSION_TIMEOUT) as client:
-        response = await client.post(
-            f"{_session_base_url(settings)}/sessions",
-            json=body.model_dump(exclude_none=True),
-            headers={
-                **_get_auth_header(request),
-                "Content-Type": "application/json",
-            },
-        )
-        await _raise_for_status(response)
-        return cast(dict[str, Any], response.json())
+    client = registry.get_client()
+    response = await client.post(
+        f"{_session_base_url(settings)}/sessions",
+        json=body.model_dump(exclude_none=True),
+        headers={
+            **_get_auth_header(request),
+            "Content-Type": "application/json",
+        },
+        timeout=SESSION_TIMEOUT,
+    )
+    await _raise_for_status(response)
+    return cast(dict[str, Any], response.json())
 
 
 @router.get("/{session_id}")
 async def get_session(
     session_id: str,
     request: Request,
+    registry: CompetitorRegistry = Depends(get_competitor_registry),
     settings: Settings = Depends(get_settings),
 ) -> dict[str, Any]:
     """Get session details (without storage state)."""
-    async with httpx.AsyncClient(timeout=SESSION_TIMEOUT) as client:
-        response = await client.get(
-            f"{_session_base_url(settings)}/sessions/{session_id}",
-            headers=_get_auth_header(request),
-        )
-        await _raise_for_status(response)
-        return cast(dict[str, Any], response.json())
+    client = registry.get_client()
+    response = await client.get(
+        f"{_session_base_url(settings)}/sessions/{session_id}",
+        headers=_get_auth_header(request),
+        timeout=SESSION_TIMEOUT,
+    )
+    await _raise_for_status(response)
+    return cast(dict[str, Any], response.json())
 
 
 @router.get("/{session_id}/state")
 async def get_session_state(
     session_id: str,
     request: Request,
+    registry: CompetitorRegistry = Depends(get_competitor_registry),
     settings: Settings = Depends(get_settings),
 ) -> dict[str, Any]:
     """Get the decrypted storage state for a session."""
-    async with httpx.AsyncClient(timeout=SESSION_TIMEOUT) as client:
-        response = await client.get(
-            f"{_session_base_url(settings)}/sessions/{session_id}/state",
-            headers=_get_auth_header(request),
-        )
-        await _raise_for_status(response)
-        return cast(dict[str, Any], response.json())
+    client = registry.get_client()
+    response = await client.get(
+        f"{_session_base_url(settings)}/sessions/{session_id}/state",
+        headers=_get_auth_header(request),
+        timeout=SESSION_TIMEOUT,
+    )
+    await _raise_for_status(response)
+    return cast(dict[str, Any], response.json())
 
 
 @router.put("/{session_id}")
@@ -124,33 +133,37 @@ async def update_session(
     session_id: str,
     body: SessionUpdateRequest,
     request: Request,
+    registry: CompetitorRegistry = Depends(get_competitor_registry),
     settings: Settings = Depends(get_settings),
 ) -> dict[str, Any]:
     """Update a session's metadata or storage state."""
-    async with httpx.AsyncClient(timeout=SESSION_TIMEOUT) as client:
-        response = await client.put(
-            f"{_session_base_url(settings)}/sessions/{session_id}",
-            json=body.model_dump(exclude_none=True),
-            headers={
-                **_get_auth_header(request),
-                "Content-Type": "application/json",
-            },
-        )
-        await _raise_for_status(response)
-        return cast(dict[str, Any], response.json())
+    client = registry.get_client()
+    response = await client.put(
+        f"{_session_base_url(settings)}/sessions/{session_id}",
+        json=body.model_dump(exclude_none=True),
+        headers={
+            **_get_auth_header(request),
+            "Content-Type": "application/json",
+        },
+        timeout=SESSION_TIMEOUT,
+    )
+    await _raise_for_status(response)
+    return cast(dict[str, Any], response.json())
 
 
 @router.delete("/{session_id}")
 async def delete_session(
     session_id: str,
     request: Request,
+    registry: CompetitorRegistry = Depends(get_competitor_registry),
     settings: Settings = Depends(get_settings),
 ) -> dict[str, Any]:
     """Delete a session."""
-    async with httpx.AsyncClient(timeout=SESSION_TIMEOUT) as client:
-        response = await client.delete(
-            f"{_session_base_url(settings)}/sessions/{session_id}",
-            headers=_get_auth_header(request),
-        )
-        await _raise_for_status(response)
-        return cast(dict[str, Any], response.json())
+    client = registry.get_client()
+    response = await client.delete(
+        f"{_session_base_url(settings)}/sessions/{session_id}",
+        headers=_get_auth_header(request),
+        timeout=SESSION_TIMEOUT,
+    )
+    await _raise_for_status(response)
+    return cast(dict[str, Any], response.json())
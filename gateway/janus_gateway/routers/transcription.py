@@ -8,6 +8,7 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 
 from janus_gateway.config import get_settings
+from janus_gateway.services import get_competitor_registry
 
 logger = structlog.get_logger(__name__)
 
@@ -85,11 +86,11 @@ async def transcription_health() -> TranscriptionHealthResponse:
 
     # Quick ping to verify endpoint (optional, can be slow)
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            # Just check if endpoint responds (OPTIONS or HEAD)
-            response = await client.options(whisper_endpoint)
-            # Any response (even 405) means endpoint is reachable
-            reachable = response.status_code < 500
+        client = get_competitor_registry().get_client()
+        # Just check if endpoint responds (OPTIONS or HEAD)
+        response = await client.options(whisper_endpoint, timeout=5.0)
+        # Any response (even 405) means endpoint is reachable
+        reachable = response.status_code < 500
     except Exception as e:
         logger.warning("transcription_endpoint_unreachable", error=str(e))
         return TranscriptionHealthResponse(
@@ -138,117 +139,118 @@ async def transcribe_audio(request: TranscriptionRequest) -> TranscriptionRespon
             ),
         )
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            logger.info("transcription_request_sent", endpoint=whisper_endpoint)
-
-            payload = {"audio_b64": request.audio_b64}
-            if request.language:
-                payload["language"] = request.language
-
-            response = await client.post(
-                whisper_endpoint,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {api_key}",
-                },
-                json=payload,
-            )
+    client = get_competitor_registry().get_client()
+    try:
+        logger.info("transcription_request_sent", endpoint=whisper_endpoint)
+
+        payload = {"audio_b64": request.audio_b64}
+        if request.language:
+            payload["language"] = request.language
+
+        response = await client.post(
+            whisper_endpoint,
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {api_key}",
+            },
+            json=payload,
+            timeout=60.0,
+        )
+
+        logger.info("transcription_response", status_code=response.status_code)
 
-            logger.info("transcription_response", status_code=response.status_code)
-
-            if response.status_code == 401:
-                logger.error("transcription_invalid_api_key")
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail=create_error_response(
-                        error="Voice transcription authentication failed",
-                        code="INVALID_API_KEY",
-                        recoverable=False,
-                        suggestion="Please type your message instead",
-                    ),
-                )
-
-            if response.status_code == 429:
-                logger.warning("transcription_rate_limited")
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail=create_error_response(
-                        error="Too many transcription requests",
-                        code="RATE_LIMITED",
-                        recoverable=True,
-                        suggestion="Please wait a moment and try again",
-                    ),
-                )
-
-            if response.status_code != 200:
-                logger.error(
-                    "transcription_failed",
-                    status_code=response.status_code,
-                    response_text=response.text,
-                )
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=create_error_response(
-                        error=f"Transcription failed: {response.text}",
-                        code="UPSTREAM_ERROR",
-                        recoverable=True,
-                        suggestion="Please try again",
-                    ),
-                )
-
-            result = response.json()
-            text = ""
-            language: Optional[str] = None
-            duration: Optional[float] = None
-
-            if isinstance(result, list):
-                text = " ".join(
-                    segment.get("text", "").strip()
-                    for segment in result
-                    if isinstance(segment, dict) and segment.get("text")
-                ).strip()
-            elif isinstance(result, dict):
-                text = result.get("text") or result.get("transcription") or ""
-                language = result.get("language")
-                duration = result.get("duration")
-            else:
-                logger.warning(
-                    "transcription_unexpected_response",
-                    response_type=type(result).__name__,
-                )
-
-            if not text:
-                logger.warning("transcription_empty_text")
-
-            logger.info("transcription_successful", char_count=len(text))
-
-            return TranscriptionResponse(
-                text=text,
-                language=language,
-                duration=duration,
+        if response.status_code == 401:
+            logger.error("transcription_invalid_api_key")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=create_error_response(
+                    error="Voice transcription authentication failed",
+                    code="INVALID_API_KEY",
+                    recoverable=False,
+                    suggestion="Please type your message instead",
+                ),
             )
 
-        except httpx.TimeoutException as exc:
-            logger.error("transcription_timeout", error=str(exc))
+        if response.status_code == 429:
+            logger.warning("transcription_rate_limited")
             raise HTTPException(
-                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail=create_error_response(
-                    error="Transcription timed out",
-                    code="TIMEOUT",
+                    error="Too many transcription requests",
+                    code="RATE_LIMITED",
                     recoverable=True,
-                    suggestion="Please try a shorter recording",
+                    suggestion="Please wait a moment and try again",
                 ),
-            ) from exc
+            )
 
-        except httpx.RequestError as exc:
-            logger.error("transcription_request_error", error=str(exc))
+        if response.status_code != 200:
+            logger.error(
+                "transcription_failed",
+                status_code=response.status_code,
+                response_text=response.text,
+            )
             raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
+                status_code=response.status_code,
                 detail=create_error_response(
-                    error="Could not reach transcription service",
-                    code="SERVICE_UNREACHABLE",
+                    error=f"Transcription failed: {response.text}",
+                    code="UPSTREAM_ERROR",
                     recoverable=True,
-                    suggestion="Please try again in a moment",
+                    suggestion="Please try again",
                 ),
-            ) from exc
+            )
+
+        result = response.json()
+        text = ""
+        language: Optional[str] = None
+        duration: Optional[float] = None
+
+        if isinstance(result, list):
+            text = " ".join(
+                segment.get("text", "").strip()
+                for segment in result
+                if isinstance(segment, dict) and segment.get("text")
+            ).strip()
+        elif isinstance(result, dict):
+            text = result.get("text") or result.get("transcription") or ""
+            language = result.get("language")
+            duration = result.get("duration")
+        else:
+            logger.warning(
+                "transcription_unexpected_response",
+                response_type=type(result).__name__,
+            )
+
+        if not text:
+            logger.warning("transcription_empty_text")
+
+        logger.info("transcription_successful", char_count=len(text))
+
+        return TranscriptionResponse(
+            text=text,
+            language=language,
+            duration=duration,
+        )
+
+    except httpx.TimeoutException as exc:
+        logger.error("transcription_timeout", error=str(exc))
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=create_error_response(
+                error="Transcription timed out",
+                code="TIMEOUT",
+                recoverable=True,
+                suggestion="Please try a shorter recording",
+            ),
+        ) from exc
+
+    except httpx.RequestError as exc:
+        logger.error("transcription_request_error", error=str(exc))
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=create_error_response(
+                error="Could not reach transcription service",
+                code="SERVICE_UNREACHABLE",
+                recoverable=True,
+                suggestion="Please try again in a moment",
+            ),
+        ) from exc
@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel, Field
 
 from janus_gateway.config import get_settings
+from janus_gateway.services import get_competitor_registry
 
 router = APIRouter(prefix="/api", tags=["tts"])
 
@@ -30,31 +31,32 @@ async def generate_tts(request: TTSRequest) -> Response:
     if not api_key:
         raise HTTPException(status_code=503, detail="TTS service not configured")
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                TTS_ENDPOINT,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {api_key}",
-                },
-                json={
-                    "text": request.text,
-                    "voice": request.voice,
-                    "speed": request.speed,
-                },
+    client = get_competitor_registry().get_client()
+    try:
+        response = await client.post(
+            TTS_ENDPOINT,
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {api_key}",
+            },
+            json={
+                "text": request.text,
+                "voice": request.voice,
+                "speed": request.speed,
+            },
+            timeout=60.0,
+        )
+
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"TTS failed: {response.text}",
             )
 
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"TTS failed: {response.text}",
-                )
+        content_type = response.headers.get("content-type", "audio/wav")
+        return Response(content=response.content, media_type=content_type)
 
-            content_type = response.headers.get("content-type", "audio/wav")
-            return Response(content=response.content, media_type=content_type)
-
-        except httpx.TimeoutException as exc:
-            raise HTTPException(status_code=504, detail="TTS timed out") from exc
-        except httpx.RequestError as exc:
-            raise HTTPException(status_code=502, detail=f"TTS service error: {exc}") from exc
+    except httpx.TimeoutException as exc:
+        raise HTTPException(status_code=504, detail="TTS timed out") from exc
+    except httpx.RequestError as exc:
+        raise HTTPException(status_code=502, detail=f"TTS service error: {exc}") from exc
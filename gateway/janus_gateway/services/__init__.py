@@ -6,6 +6,7 @@ from .artifact_store import ArtifactStore, get_artifact_store
 from .file_extractor import FileExtractor
 from .message_processor import MessageProcessor
 from .arena import ArenaService, ArenaPromptStore, hash_prompt
+from .expiring_map import ExpiringMap
 from .streaming import (
     StreamChunk,
     create_done_marker,
@@ -25,6 +26,7 @@ __all__ = [
     "ArenaService",
     "ArenaPromptStore",
     "hash_prompt",
+    "ExpiringMap",
     "StreamChunk",
     "format_sse_chunk",
     "parse_sse_line",
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 import hashlib
 import random
 from typing import Optional
 from uuid import uuid4
 
 from janus_gateway.services.competitor_registry import CompetitorRegistry
+from janus_gateway.services.expiring_map import ExpiringMap
 
 
 def hash_prompt(prompt: str) -> str:
@@ -32,22 +33,12 @@ class ArenaPrompt:
 class ArenaPromptStore:
     """In-memory store for arena prompt assignments."""
 
-    def __init__(self, ttl_seconds: int = 3600) -> None:
-        self._ttl = timedelta(seconds=ttl_seconds)
-        self._prompts: dict[str, ArenaPrompt] = {}
-
-    def _prune(self) -> None:
-        now = datetime.now(timezone.utc)
-        expired = [
-            prompt_id
-            for prompt_id, prompt in self._prompts.items()
-            if now - prompt.created_at > self._ttl
-        ]
-        for prompt_id in expired:
-            self._prompts.pop(prompt_id, None)
+    def __init__(self, ttl_seconds: int = 3600, max_prompts: int = 10_000) -> None:
+        self._prompts: ExpiringMap[str, ArenaPrompt] = ExpiringMap(
+            ttl_seconds=ttl_seconds, max_size=max_prompts
+        )
 
     def create(self, prompt: str, model_a: str, model_b: str, user_id: Optional[str]) -> ArenaPrompt:
-        self._prune()
         prompt_id = f"arena-{uuid4().hex[:16]}"
         prompt_hash = hash_prompt(prompt)
         record = ArenaPrompt(
@@ -59,11 +50,10 @@ class ArenaPromptStore:
             created_at=datetime.now(timezone.utc),
             user_id=user_id,
         )
-        self._prompts[prompt_id] = record
+        self._prompts.set(prompt_id, record)
         return record
 
     def get(self, prompt_id: str) -> Optional[ArenaPrompt]:
-        self._prune()
         return self._prompts.get(prompt_id)
 
     def mark_voted(self, prompt_id: str) -> None:
@@ -79,7 +69,10 @@ class ArenaService:
         self._registry = registry
 
     def list_models(self, exclude: Optional[str] = None) -> list[str]:
-        models = [competitor.id for competitor in self._registry.list_all()]
+        min_count = 3 if exclude else 2
+        models = [
+            competitor.id for competitor in self._registry.list_healthy(min_count=min_count)
+        ]
         if exclude:
             models = [model for model in models if model != exclude]
         return models
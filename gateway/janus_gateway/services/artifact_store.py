@@ -1,18 +1,51 @@
 """Artifact storage service."""
 
+import asyncio
 import base64
 import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
 import uuid
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import structlog
+
 from janus_gateway.config import get_settings
 from janus_gateway.models import Artifact, ArtifactType
 
 DATA_URL_MAX_BYTES = 1_000_000
 
+logger = structlog.get_logger()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    size_bytes INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    id TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL REFERENCES blobs(sha256),
+    type TEXT NOT NULL,
+    mime_type TEXT NOT NULL,
+    display_name TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    ttl_seconds INTEGER NOT NULL,
+    url TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_expires_at ON artifacts(expires_at);
+CREATE INDEX IF NOT EXISTS idx_artifacts_last_access ON artifacts(last_access);
+CREATE INDEX IF NOT EXISTS idx_artifacts_sha256 ON artifacts(sha256);
+"""
+
 
 def build_data_url(data: bytes, mime_type: str, max_bytes: int = DATA_URL_MAX_BYTES) -> Optional[str]:
     """Return a base64 data URL for small artifacts."""
@@ -23,13 +56,39 @@ def build_data_url(data: bytes, mime_type: str, max_bytes: int = DATA_URL_MAX_BY
 
 
 class ArtifactStore:
-    """Local artifact storage service."""
+    """Local artifact storage service.
 
-    def __init__(self, storage_path: str, ttl_seconds: int = 3600) -> None:
+    Metadata lives in a SQLite index next to the data so it survives
+    restarts and is shared by every worker using the same storage path.
+    Payloads are stored once per sha256 under ``blobs/`` and referenced by
+    any number of artifact IDs. Expired artifacts are removed through the
+    ``expires_at`` index, and when ``max_bytes`` is exceeded the least
+    recently accessed artifacts are evicted first.
+    """
+
+    def __init__(
+        self,
+        storage_path: str,
+        ttl_seconds: int = 3600,
+        max_bytes: Optional[int] = None,
+    ) -> None:
         self._storage_path = Path(storage_path)
-        self._storage_path.mkdir(parents=True, exist_ok=True)
+        self._blob_path = self._storage_path / "blobs"
+        self._blob_path.mkdir(parents=True, exist_ok=True)
         self._ttl_seconds = ttl_seconds
-        self._artifacts: dict[str, Artifact] = {}
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self._storage_path / "index.sqlite3",
+            timeout=10.0,
+            check_same_thread=False,
+        )
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def _blob_file(self, sha256_hash: str) -> Path:
+        return self._blob_path / sha256_hash[:2] / sha256_hash
 
     def store(
         self,
@@ -42,10 +101,7 @@ class ArtifactStore:
         """Store artifact data and return descriptor."""
         artifact_id = f"artf_{uuid.uuid4().hex[:12]}"
         sha256_hash = hashlib.sha256(data).hexdigest()
-
-        # Write to disk
-        file_path = self._storage_path / artifact_id
-        file_path.write_bytes(data)
+        now = time.time()
 
         # Create descriptor
         artifact = Artifact(
@@ -55,57 +111,188 @@ class ArtifactStore:
             display_name=display_name,
             size_bytes=len(data),
             sha256=sha256_hash,
-            created_at=datetime.now(),
+            created_at=datetime.fromtimestamp(now),
             ttl_seconds=self._ttl_seconds,
             url=f"{gateway_base_url}/v1/artifacts/{artifact_id}",
         )
 
-        self._artifacts[artifact_id] = artifact
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR IGNORE INTO blobs (sha256, size_bytes) VALUES (?, ?)",
+                (sha256_hash, len(data)),
+            )
+            # Content-addressed write, done while holding the index write lock
+            # so a concurrent delete cannot remove the blob underneath us.
+            blob_file = self._blob_file(sha256_hash)
+            if not blob_file.exists():
+                blob_file.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=blob_file.parent, prefix=".tmp-")
+                with os.fdopen(fd, "wb") as tmp_file:
+                    tmp_file.write(data)
+                os.replace(tmp_name, blob_file)
+            self._db.execute(
+                "INSERT INTO artifacts (id, sha256, type, mime_type, display_name, size_bytes,"
+                " created_at, expires_at, last_access, ttl_seconds, url)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    artifact_id,
+                    sha256_hash,
+                    artifact_type.value,
+                    mime_type,
+                    display_name,
+                    len(data),
+                    now,
+                    now + self._ttl_seconds,
+                    now,
+                    self._ttl_seconds,
+                    artifact.url,
+                ),
+            )
+            self._evict_over_budget(keep_id=artifact_id)
         return artifact
 
     def get(self, artifact_id: str) -> Optional[Artifact]:
         """Get artifact metadata by ID."""
-        artifact = self._artifacts.get(artifact_id)
-        if artifact:
-            # Check TTL
-            age = (datetime.now() - artifact.created_at).total_seconds()
-            if age > artifact.ttl_seconds:
-                self.delete(artifact_id)
+        row = self._touch(artifact_id)
+        return self._to_artifact(row) if row is not None else None
+
+    def get_with_path(self, artifact_id: str) -> tuple[Optional[Artifact], Optional[Path]]:
+        """Get artifact metadata and the on-disk path of its data in one lookup.
+
+        The path is None when the artifact exists but its blob is missing.
+        """
+        row = self._touch(artifact_id)
+        if row is None:
+            return None, None
+        file_path = self._blob_file(row["sha256"])
+        return self._to_artifact(row), file_path if file_path.exists() else None
+
+    def get_path(self, artifact_id: str) -> Optional[Path]:
+        """Get the on-disk path of an artifact's data for streaming responses."""
+        return self.get_with_path(artifact_id)[1]
+
+    def _touch(self, artifact_id: str) -> Optional[sqlite3.Row]:
+        """Fetch a live artifact row and record the access for LRU eviction."""
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT * FROM artifacts WHERE id = ?", (artifact_id,)
+            ).fetchone()
+            if row is None:
                 return None
-        return artifact
+            if row["expires_at"] <= now:
+                self._delete_locked(artifact_id)
+                return None
+            self._db.execute(
+                "UPDATE artifacts SET last_access = ? WHERE id = ?", (now, artifact_id)
+            )
+        return row
+
+    @staticmethod
+    def _to_artifact(row: sqlite3.Row) -> Artifact:
+        return Artifact(
+            id=row["id"],
+            type=ArtifactType(row["type"]),
+            mime_type=row["mime_type"],
+            display_name=row["display_name"],
+            size_bytes=row["size_bytes"],
+            sha256=row["sha256"],
+            created_at=datetime.fromtimestamp(row["created_at"]),
+            ttl_seconds=row["ttl_seconds"],
+            url=row["url"],
+        )
 
     def get_data(self, artifact_id: str) -> Optional[bytes]:
         """Get artifact data by ID."""
-        artifact = self.get(artifact_id)
-        if artifact:
-            file_path = self._storage_path / artifact_id
-            if file_path.exists():
-                return file_path.read_bytes()
-        return None
+        file_path = self.get_path(artifact_id)
+        return file_path.read_bytes() if file_path else None
 
     def delete(self, artifact_id: str) -> bool:
         """Delete an artifact."""
-        if artifact_id in self._artifacts:
-            del self._artifacts[artifact_id]
-            file_path = self._storage_path / artifact_id
-            if file_path.exists():
-                file_path.unlink()
-            return True
-        return False
+        with self._lock, self._db:
+            return self._delete_locked(artifact_id) is not None
+
+    def _delete_locked(self, artifact_id: str) -> Optional[int]:
+        """Delete an artifact row; returns bytes freed, or None if it was missing."""
+        row = self._db.execute(
+            "SELECT sha256 FROM artifacts WHERE id = ?", (artifact_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._db.execute("DELETE FROM artifacts WHERE id = ?", (artifact_id,))
+        return self._release_blob(row["sha256"])
+
+    def _release_blob(self, sha256_hash: str) -> int:
+        """Remove a blob once no artifact references it; returns bytes freed."""
+        still_used = self._db.execute(
+            "SELECT 1 FROM artifacts WHERE sha256 = ? LIMIT 1", (sha256_hash,)
+        ).fetchone()
+        if still_used:
+            return 0
+        blob = self._db.execute(
+            "SELECT size_bytes FROM blobs WHERE sha256 = ?", (sha256_hash,)
+        ).fetchone()
+        self._db.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256_hash,))
+        self._blob_file(sha256_hash).unlink(missing_ok=True)
+        return int(blob["size_bytes"]) if blob else 0
+
+    def total_bytes(self) -> int:
+        """Total bytes of stored (deduplicated) payloads."""
+        with self._lock:
+            return self._total_bytes_locked()
+
+    def _total_bytes_locked(self) -> int:
+        row = self._db.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM blobs").fetchone()
+        return int(row[0])
+
+    def _evict_over_budget(self, keep_id: str) -> None:
+        """Evict least recently accessed artifacts until under ``max_bytes``."""
+        if self._max_bytes is None:
+            return
+        total = self._total_bytes_locked()
+        evicted = 0
+        while total > self._max_bytes:
+            batch = self._db.execute(
+                "SELECT id FROM artifacts WHERE id != ? ORDER BY last_access LIMIT 64",
+                (keep_id,),
+            ).fetchall()
+            if not batch:
+                break
+            for row in batch:
+                total -= self._delete_locked(row["id"]) or 0
+                evicted += 1
+                if total <= self._max_bytes:
+                    break
+        if evicted:
+            logger.info("artifact_store_evicted", count=evicted, total_bytes=total)
 
     def cleanup_expired(self) -> int:
         """Remove expired artifacts. Returns count of removed artifacts."""
-        now = datetime.now()
-        expired = []
-        for artifact_id, artifact in self._artifacts.items():
-            age = (now - artifact.created_at).total_seconds()
-            if age > artifact.ttl_seconds:
-                expired.append(artifact_id)
+        now = time.time()
+        with self._lock, self._db:
+            expired = self._db.execute(
+                "SELECT id FROM artifacts WHERE expires_at <= ?", (now,)
+            ).fetchall()
+            for row in expired:
+                self._delete_locked(row["id"])
+        return len(expired)
 
-        for artifact_id in expired:
-            self.delete(artifact_id)
+    async def run_cleanup_loop(self, interval_seconds: float) -> None:
+        """Periodically remove expired artifacts until cancelled."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                removed = await asyncio.to_thread(self.cleanup_expired)
+            except Exception as exc:
+                logger.warning("artifact_cleanup_failed", error=str(exc))
+                continue
+            if removed:
+                logger.info("artifact_cleanup", removed=removed)
 
-        return len(expired)
+    def close(self) -> None:
+        """Close the metadata index."""
+        with self._lock:
+            self._db.close()
 
 
 @lru_cache
@@ -115,4 +302,5 @@ def get_artifact_store() -> ArtifactStore:
     return ArtifactStore(
         storage_path=settings.artifact_storage_path,
         ttl_seconds=settings.artifact_ttl_seconds,
+        max_bytes=settings.artifact_max_bytes,
     )
@@ -1,10 +1,81 @@
 """Competitor registry service."""
 
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
 from functools import lru_cache
 from typing import Optional
 
+import httpx
+import structlog
+
 from janus_gateway.config import get_settings
-from janus_gateway.models import CompetitorInfo
+from janus_gateway.models import CompetitorInfo, CompetitorStats
+
+logger = structlog.get_logger()
+
+# Weight of the newest sample in the TTFT and error-rate moving averages.
+HEALTH_EWMA_ALPHA = 0.2
+# Competitors failing more often than this are skipped when there is a choice.
+UNHEALTHY_ERROR_RATE = 0.5
+WARM_KEEPER_PING_TIMEOUT_SECONDS = 60.0
+
+
+@dataclass
+class CompetitorHealth:
+    """Rolling health state for one competitor."""
+
+    ttft_ewma_ms: Optional[float] = None
+    completion_ewma_ms: Optional[float] = None
+    error_rate: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    last_seen_warm: Optional[float] = None
+    last_error: Optional[str] = None
+
+    def mark_warm(self) -> None:
+        """Record that the competitor answered without a cold start."""
+        self.last_seen_warm = time.time()
+
+    def record_success(self, ttft_seconds: float) -> None:
+        """Record a streamed request that produced its first token after ``ttft_seconds``."""
+        self.ttft_ewma_ms = _ewma(self.ttft_ewma_ms, ttft_seconds * 1000)
+        self._record_ok()
+
+    def record_completion(self, latency_seconds: float) -> None:
+        """Record a non-streaming request that returned its full body after ``latency_seconds``.
+
+        Kept apart from TTFT: a full completion is not comparable to a first chunk.
+        """
+        self.completion_ewma_ms = _ewma(self.completion_ewma_ms, latency_seconds * 1000)
+        self._record_ok()
+
+    def _record_ok(self) -> None:
+        self.requests += 1
+        self.error_rate *= 1 - HEALTH_EWMA_ALPHA
+        self.mark_warm()
+
+    def record_error(self, error: str) -> None:
+        """Record a failed request."""
+        self.requests += 1
+        self.errors += 1
+        self.error_rate = HEALTH_EWMA_ALPHA + (1 - HEALTH_EWMA_ALPHA) * self.error_rate
+        self.last_error = error
+
+    def is_warm(self, idle_seconds: float) -> bool:
+        """Whether the competitor answered within the last ``idle_seconds``."""
+        return self.last_seen_warm is not None and time.time() - self.last_seen_warm < idle_seconds
+
+    @property
+    def healthy(self) -> bool:
+        return self.error_rate < UNHEALTHY_ERROR_RATE
+
+
+def _ewma(current: Optional[float], sample: float) -> float:
+    if current is None:
+        return sample
+    return HEALTH_EWMA_ALPHA * sample + (1 - HEALTH_EWMA_ALPHA) * current
 
 
 class CompetitorRegistry:
@@ -14,11 +85,23 @@ class CompetitorRegistry:
         self,
         baseline_url: Optional[str] = None,
         baseline_langchain_url: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
     ) -> None:
         self._competitors: dict[str, CompetitorInfo] = {}
         self._default_id: Optional[str] = None
         self._baseline_url = baseline_url
         self._baseline_langchain_url = baseline_langchain_url
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._health: dict[str, CompetitorHealth] = {}
         self._initialize_default_competitors()
 
     def _initialize_default_competitors(self) -> None:
@@ -98,7 +181,11 @@ class CompetitorRegistry:
             self._default_id = competitor.id
 
     def unregister(self, competitor_id: str) -> bool:
-        """Unregister a competitor."""
+        """Unregister a competitor.
+
+        The competitor's pooled client is left for :meth:`aclose` so that
+        in-flight streams are not cut off.
+        """
         if competitor_id in self._competitors:
             del self._competitors[competitor_id]
             if self._default_id == competitor_id:
@@ -129,6 +216,132 @@ class CompetitorRegistry:
             return self.get(competitor_id)
         return self.get_default()
 
+    def health(self, competitor_id: str) -> CompetitorHealth:
+        """Get (creating on first use) the health state for a competitor."""
+        health = self._health.get(competitor_id)
+        if health is None:
+            health = self._health[competitor_id] = CompetitorHealth()
+        return health
+
+    def list_healthy(self, min_count: int = 1) -> list[CompetitorInfo]:
+        """List enabled competitors, dropping failing ones if enough healthy remain.
+
+        Results are ordered by observed time-to-first-token, with competitors
+        that have no samples yet placed last.
+        """
+        competitors = self.list_all()
+        healthy = [c for c in competitors if self.health(c.id).healthy]
+        candidates = healthy if len(healthy) >= min_count else competitors
+        return sorted(
+            candidates,
+            key=lambda c: (
+                self.health(c.id).ttft_ewma_ms is None,
+                self.health(c.id).ttft_ewma_ms or 0.0,
+            ),
+        )
+
+    def stats(self, idle_seconds: float) -> list[CompetitorStats]:
+        """Snapshot health for all registered competitors."""
+        results: list[CompetitorStats] = []
+        for competitor in self.list_all(enabled_only=False):
+            health = self.health(competitor.id)
+            results.append(
+                CompetitorStats(
+                    id=competitor.id,
+                    url=competitor.url,
+                    warm=health.is_warm(idle_seconds),
+                    ttft_ewma_ms=(
+                        round(health.ttft_ewma_ms, 2) if health.ttft_ewma_ms is not None else None
+                    ),
+                    completion_ewma_ms=(
+                        round(health.completion_ewma_ms, 2)
+                        if health.completion_ewma_ms is not None
+                        else None
+                    ),
+                    error_rate=round(health.error_rate, 4),
+                    requests=health.requests,
+                    errors=health.errors,
+                    last_seen_warm=(
+                        datetime.fromtimestamp(health.last_seen_warm)
+                        if health.last_seen_warm is not None
+                        else None
+                    ),
+                    last_error=health.last_error,
+                )
+            )
+        return results
+
+    async def ping(self, competitor: CompetitorInfo) -> bool:
+        """Hit a competitor's /health endpoint; returns True if it answered warm."""
+        try:
+            response = await self.get_client(competitor.id).get(
+                f"{competitor.url}/health", timeout=WARM_KEEPER_PING_TIMEOUT_SECONDS
+            )
+        except httpx.HTTPError as exc:
+            logger.warning("competitor_ping_failed", competitor_id=competitor.id, error=str(exc))
+            return False
+        if response.status_code != 200:
+            # Render answers 429 while it boots a sleeping service; the
+            # request itself is what wakes it up.
+            logger.info(
+                "competitor_ping_not_ready",
+                competitor_id=competitor.id,
+                status_code=response.status_code,
+            )
+            return False
+        self.health(competitor.id).mark_warm()
+        return True
+
+    async def run_warm_keeper(self, idle_seconds: float) -> None:
+        """Ping competitors that have been idle for ``idle_seconds`` until cancelled.
+
+        Render's free tier spins services down after ~15 minutes without
+        traffic; pinging before that keeps the first user request after a
+        quiet period from paying the cold start.
+        """
+        check_interval = max(idle_seconds / 4, 1.0)
+        while True:
+            try:
+                idle = [
+                    competitor
+                    for competitor in self.list_all()
+                    if not self.health(competitor.id).is_warm(idle_seconds)
+                ]
+                if idle:
+                    await asyncio.gather(*(self.ping(competitor) for competitor in idle))
+            except Exception:
+                # One bad round must not end warm-keeping for the process.
+                logger.exception("competitor_warm_keeper_error")
+            await asyncio.sleep(check_interval)
+
+    def get_client(self, competitor_id: Optional[str] = None) -> httpx.AsyncClient:
+        """Get the pooled upstream client for a competitor.
+
+        Each competitor gets its own connection pool so a slow or cold
+        upstream cannot starve the others. Calls without a competitor ID
+        share a general-purpose pool used by the gateway's service proxies
+        (memories, sessions, TTS, transcription). Clients are created lazily
+        and live until :meth:`aclose` is called from the app lifespan.
+        Callers pass per-request timeouts explicitly.
+        """
+        key = competitor_id or ""
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self._http2,
+                limits=self._limits,
+                timeout=httpx.Timeout(30.0),
+            )
+            self._clients[key] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close all pooled upstream clients."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
 
 @lru_cache
 def get_competitor_registry() -> CompetitorRegistry:
@@ -137,4 +350,8 @@ def get_competitor_registry() -> CompetitorRegistry:
     return CompetitorRegistry(
         baseline_url=settings.baseline_url,
         baseline_langchain_url=settings.baseline_langchain_url,
+        max_connections=settings.upstream_max_connections,
+        max_keepalive_connections=settings.upstream_max_keepalive_connections,
+        keepalive_expiry=settings.upstream_keepalive_expiry,
+        http2=settings.upstream_http2,
     )
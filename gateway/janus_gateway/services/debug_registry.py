@@ -6,6 +6,8 @@ import time
 from dataclasses import dataclass
 from functools import lru_cache
 
+from janus_gateway.services.expiring_map import ExpiringMap
+
 
 @dataclass
 class DebugRequestInfo:
@@ -14,33 +16,23 @@ class DebugRequestInfo:
 
 
 class DebugRequestRegistry:
-    def __init__(self, ttl_seconds: int = 600) -> None:
-        self._ttl_seconds = ttl_seconds
-        self._requests: dict[str, DebugRequestInfo] = {}
+    def __init__(self, ttl_seconds: int = 600, max_requests: int = 10_000) -> None:
+        self._requests: ExpiringMap[str, DebugRequestInfo] = ExpiringMap(
+            ttl_seconds=ttl_seconds, max_size=max_requests
+        )
 
     def register(self, request_id: str, baseline_id: str) -> None:
-        self._requests[request_id] = DebugRequestInfo(
-            baseline_id=baseline_id,
-            created_at=time.time(),
+        self._requests.set(
+            request_id,
+            DebugRequestInfo(baseline_id=baseline_id, created_at=time.time()),
         )
 
     def resolve(self, request_id: str) -> str | None:
-        self._cleanup()
         info = self._requests.get(request_id)
         return info.baseline_id if info else None
 
     def discard(self, request_id: str) -> None:
-        self._requests.pop(request_id, None)
-
-    def _cleanup(self) -> None:
-        now = time.time()
-        expired = [
-            key
-            for key, info in self._requests.items()
-            if now - info.created_at > self._ttl_seconds
-        ]
-        for key in expired:
-            self._requests.pop(key, None)
+        self._requests.pop(request_id)
 
 
 @lru_cache
@@ -0,0 +1,102 @@
+"""Size-bounded mapping whose entries expire after a TTL."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from typing import Callable, Generic, Optional, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class ExpiringMap(Generic[K, V]):
+    """Dict-like store with per-entry expiry and a maximum size.
+
+    Expiry times are kept in a min-heap next to the dict, so purging only
+    touches entries that have actually expired (O(log n) each) instead of
+    scanning every key. Re-setting a key leaves its old heap entry behind;
+    such stale entries are skipped when popped and the heap is rebuilt once
+    they outnumber live ones. When ``max_size`` is reached the entry closest
+    to expiry is evicted first.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_size: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: dict[K, tuple[float, V]] = {}
+        self._heap: list[tuple[float, int, K]] = []
+        self._counter = itertools.count()
+
+    def set(self, key: K, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """Insert or replace ``key``, restarting its TTL."""
+        now = self._clock()
+        self.purge(now)
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = now + ttl
+        if key not in self._entries and self._max_size is not None:
+            while len(self._entries) >= self._max_size and self._pop_earliest():
+                pass
+        self._entries[key] = (expires_at, value)
+        heapq.heappush(self._heap, (expires_at, next(self._counter), key))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._compact()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Return the live value for ``key`` or ``default``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= self._clock():
+            del self._entries[key]
+            return default
+        return entry[1]
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Remove ``key`` and return its value if it was still live."""
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[0] <= self._clock():
+            return default
+        return entry[1]
+
+    def purge(self, now: Optional[float] = None) -> int:
+        """Drop expired entries; returns how many were removed."""
+        now = self._clock() if now is None else now
+        removed = 0
+        while self._heap and self._heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == expires_at:
+                del self._entries[key]
+                removed += 1
+        return removed
+
+    def _pop_earliest(self) -> bool:
+        while self._heap:
+            expires_at, _, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == expires_at:
+                del self._entries[key]
+                return True
+        return False
+
+    def _compact(self) -> None:
+        self._heap = [
+            (expires_at, next(self._counter), key)
+            for key, (expires_at, _) in self._entries.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._entries.get(key)  # type: ignore[arg-type]
+        return entry is not None and entry[0] > self._clock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
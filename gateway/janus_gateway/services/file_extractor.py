@@ -2,8 +2,10 @@
 
 import base64
 import io
+from contextlib import closing
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional
 
 import fitz  # PyMuPDF
 from docx import Document
@@ -11,22 +13,54 @@ import openpyxl
 from pptx import Presentation
 
 
+@dataclass
+class ExtractionResult:
+    """Extracted text plus how many document sections were read."""
+
+    text: str
+    unit: str = ""
+    extracted: int = 0
+    total: int = 0
+
+    @property
+    def summary(self) -> str:
+        """Short "<unit> read/total" note, empty for plain-text files."""
+        if not self.unit:
+            return ""
+        return f"{self.unit} {self.extracted}/{self.total}"
+
+
 class FileExtractor:
     """Extract text content from various file formats."""
 
     MAX_TEXT_LENGTH = 100_000
 
+    def requires_parsing(self, mime_type: str, filename: str) -> bool:
+        """Return True when extraction needs a document parser (CPU-heavy)."""
+        return not self._is_text_like(mime_type, Path(filename).suffix.lower())
+
     def extract(self, content: str, mime_type: str, filename: str) -> str:
         """Extract text from file content."""
+        return self.extract_document(content, mime_type, filename).text
+
+    def extract_document(self, content: str, mime_type: str, filename: str) -> ExtractionResult:
+        """Extract text from file content along with how much of it was read.
+
+        Documents are read section by section (pages, paragraphs, sheets or
+        slides) and reading stops once ``MAX_TEXT_LENGTH`` characters have
+        been collected. PDFs and spreadsheets are loaded lazily, so large ones
+        are never parsed in full; Word and PowerPoint files are parsed whole
+        by their libraries and only the text collection stops early.
+        """
         extension = Path(filename).suffix.lower()
 
         if self._is_text_like(mime_type, extension):
             text = self._decode_text_content(content)
-            return self._sanitize_text(text)
+            return ExtractionResult(self._sanitize_text(text))
 
         data = self._decode_binary_content(content)
         if data is None:
-            return self._sanitize_text(content)
+            return ExtractionResult(self._sanitize_text(content))
 
         if mime_type == "application/pdf" or extension == ".pdf":
             return self._extract_pdf(data)
@@ -46,7 +80,7 @@ class FileExtractor:
         ] or extension in [".pptx", ".ppt"]:
             return self._extract_pptx(data)
 
-        return f"[Unsupported file format: {filename}]"
+        return ExtractionResult(f"[Unsupported file format: {filename}]")
 
     def _is_text_like(self, mime_type: str, extension: str) -> bool:
         if mime_type.startswith("text/"):
@@ -89,55 +123,94 @@ class FileExtractor:
         cleaned = text.replace("\x00", "")
         return cleaned[: self.MAX_TEXT_LENGTH]
 
-    def _extract_pdf(self, data: bytes) -> str:
-        text_parts: list[str] = []
+    def _collect(self, sections: Iterator[str], unit: str, total: int) -> ExtractionResult:
+        """Join sections until the character budget is spent, then stop reading."""
+        parts: list[str] = []
+        length = 0
+        visited = 0
+        with closing(sections):
+            for section in sections:
+                visited += 1
+                if section:
+                    parts.append(section)
+                    length += len(section) + 2
+                if length >= self.MAX_TEXT_LENGTH:
+                    break
+        return ExtractionResult(
+            text=self._sanitize_text("\n\n".join(parts)),
+            unit=unit,
+            extracted=visited,
+            total=total,
+        )
+
+    def _extract_pdf(self, data: bytes) -> ExtractionResult:
         try:
             with fitz.open(stream=data, filetype="pdf") as doc:
-                for i, page in enumerate(doc):
-                    text = page.get_text()
-                    if text.strip():
-                        text_parts.append(f"--- Page {i + 1} ---\n{text}")
+                return self._collect(self._iter_pdf_pages(doc), "pages", doc.page_count)
         except Exception as exc:
-            return f"[Failed to extract PDF: {exc}]"
-        return self._sanitize_text("\n\n".join(text_parts))
+            return ExtractionResult(f"[Failed to extract PDF: {exc}]")
 
-    def _extract_docx(self, data: bytes) -> str:
+    @staticmethod
+    def _iter_pdf_pages(doc: fitz.Document) -> Iterator[str]:
+        for i, page in enumerate(doc):
+            text = page.get_text()
+            yield f"--- Page {i + 1} ---\n{text}" if text.strip() else ""
+
+    def _extract_docx(self, data: bytes) -> ExtractionResult:
         try:
             doc = Document(io.BytesIO(data))
-            paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+            paragraphs = doc.paragraphs
+            return self._collect(
+                (p.text if p.text.strip() else "" for p in paragraphs),
+                "paragraphs",
+                len(paragraphs),
+            )
         except Exception as exc:
-            return f"[Failed to extract Word document: {exc}]"
-        return self._sanitize_text("\n\n".join(paragraphs))
+            return ExtractionResult(f"[Failed to extract Word document: {exc}]")
 
-    def _extract_xlsx(self, data: bytes) -> str:
-        text_parts: list[str] = []
+    def _extract_xlsx(self, data: bytes) -> ExtractionResult:
         try:
             wb = openpyxl.load_workbook(io.BytesIO(data), read_only=True)
-            for sheet_name in wb.sheetnames:
-                sheet = wb[sheet_name]
-                rows: list[str] = []
-                for row in sheet.iter_rows(values_only=True):
-                    row_text = "\t".join(str(cell) if cell is not None else "" for cell in row)
-                    if row_text.strip():
-                        rows.append(row_text)
-                if rows:
-                    text_parts.append(f"--- Sheet: {sheet_name} ---\n" + "\n".join(rows))
-            wb.close()
+            try:
+                return self._collect(self._iter_xlsx_sheets(wb), "sheets", len(wb.sheetnames))
+            finally:
+                wb.close()
         except Exception as exc:
-            return f"[Failed to extract spreadsheet: {exc}]"
-        return self._sanitize_text("\n\n".join(text_parts))
-
-    def _extract_pptx(self, data: bytes) -> str:
-        text_parts: list[str] = []
+            return ExtractionResult(f"[Failed to extract spreadsheet: {exc}]")
+
+    def _iter_xlsx_sheets(self, wb: Any) -> Iterator[str]:
+        for sheet_name in wb.sheetnames:
+            sheet = wb[sheet_name]
+            rows: list[str] = []
+            length = 0
+            for row in sheet.iter_rows(values_only=True):
+                row_text = "\t".join(str(cell) if cell is not None else "" for cell in row)
+                if row_text.strip():
+                    rows.append(row_text)
+                    length += len(row_text) + 1
+                    # A single sheet can exhaust the budget; stop reading rows.
+                    if length >= self.MAX_TEXT_LENGTH:
+                        break
+            yield f"--- Sheet: {sheet_name} ---\n" + "\n".join(rows) if rows else ""
+
+    def _extract_pptx(self, data: bytes) -> ExtractionResult:
         try:
             prs = Presentation(io.BytesIO(data))
-            for i, slide in enumerate(prs.slides):
-                slide_text: list[str] = []
-                for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text.strip():
-                        slide_text.append(shape.text)
-                if slide_text:
-                    text_parts.append(f"--- Slide {i + 1} ---\n" + "\n".join(slide_text))
+            return self._collect(self._iter_pptx_slides(prs), "slides", len(prs.slides))
         except Exception as exc:
-            return f"[Failed to extract presentation: {exc}]"
-        return self._sanitize_text("\n\n".join(text_parts))
+            return ExtractionResult(f"[Failed to extract presentation: {exc}]")
+
+    @staticmethod
+    def _iter_pptx_slides(prs: Any) -> Iterator[str]:
+        for i, slide in enumerate(prs.slides):
+            slide_text = [
+                shape.text
+                for shape in slide.shapes
+                if hasattr(shape, "text") and shape.text.strip()
+            ]
+            yield f"--- Slide {i + 1} ---\n" + "\n".join(slide_text) if slide_text else ""
+
+
+def extract_file(content: str, mime_type: str, filename: str) -> ExtractionResult:
+    """Extract a file; module-level so it can run in a process pool."""
+    return FileExtractor().extract_document(content, mime_type, filename)
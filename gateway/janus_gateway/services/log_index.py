@@ -0,0 +1,258 @@
+"""Incremental index over local service log files for debug queries."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncGenerator, Optional, Sequence
+
+# Identifier fields worth indexing; a ``request_id`` query matches any of them
+# so trace lookups keep working whichever ID the caller has at hand.
+ID_FIELDS = ("request_id", "correlation_id", "debug_request_id", "trace_request_id", "completion_id")
+# IDs embedded in plain-text lines (chatcmpl-..., corr-..., debug-..., req-...).
+_TEXT_ID_PATTERN = re.compile(r"\b[A-Za-z]+[-_][0-9A-Za-z_-]{8,}\b")
+_READ_CHUNK_BYTES = 1 << 20
+
+
+@dataclass
+class _LogFile:
+    service: str
+    path: Path
+    offset: int = 0
+    inode: Optional[int] = None
+
+
+class LogIndex:
+    """Tail-following offset index over JSON-lines log files.
+
+    Each refresh parses only the bytes appended since the previous one and
+    records the line's byte offset in posting lists keyed by ID, level and
+    service. Queries intersect those lists and read back only the matching
+    lines. A truncated or replaced (rotated) file triggers a full rebuild.
+    """
+
+    def __init__(self, files: dict[str, Path]) -> None:
+        self._files = [_LogFile(service, path) for service, path in files.items()]
+        self._lock = threading.Lock()
+        self.generation = -1
+        self._reset()
+
+    def _reset(self) -> None:
+        self.generation += 1
+        for log_file in self._files:
+            log_file.offset = 0
+            log_file.inode = None
+        # Line sequence number -> (file slot, byte offset).
+        self._line_file = array("H")
+        self._line_offset = array("q")
+        self._by_id: dict[str, array] = {}
+        self._by_level: dict[str, array] = {}
+        self._by_service: dict[str, array] = {}
+
+    @property
+    def line_count(self) -> int:
+        return len(self._line_offset)
+
+    def refresh(self) -> int:
+        """Index lines appended since the last refresh; returns lines added."""
+        with self._lock:
+            before = self.line_count
+            for slot, log_file in enumerate(self._files):
+                if self._rotated(log_file):
+                    self._reset()
+                    before = 0
+                    break
+            for slot, log_file in enumerate(self._files):
+                self._index_file(slot, log_file)
+            return self.line_count - before
+
+    def _rotated(self, log_file: _LogFile) -> bool:
+        try:
+            stat = log_file.path.stat()
+        except FileNotFoundError:
+            return log_file.offset > 0
+        if log_file.inode is not None and stat.st_ino != log_file.inode:
+            return True
+        return stat.st_size < log_file.offset
+
+    def _index_file(self, slot: int, log_file: _LogFile) -> None:
+        try:
+            handle = log_file.path.open("rb")
+        except FileNotFoundError:
+            return
+        with handle:
+            log_file.inode = os.fstat(handle.fileno()).st_ino
+            handle.seek(log_file.offset)
+            offset = log_file.offset
+            pending = b""
+            while True:
+                chunk = handle.read(_READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                data = pending + chunk
+                start = 0
+                while True:
+                    end = data.find(b"\n", start)
+                    if end == -1:
+                        break
+                    self._index_line(slot, offset + start, data[start:end])
+                    start = end + 1
+                offset += start
+                pending = data[start:]
+            # A partial trailing line is picked up once it is terminated.
+            log_file.offset = offset
+
+    def _index_line(self, slot: int, offset: int, raw: bytes) -> None:
+        text = raw.decode("utf-8", errors="replace").strip()
+        if not text:
+            return
+        seq = self.line_count
+        self._line_file.append(slot)
+        self._line_offset.append(offset)
+        service = self._files[slot].service
+        _post(self._by_service, service, seq)
+
+        payload = _parse(text)
+        if isinstance(payload, dict):
+            for field in ID_FIELDS:
+                value = payload.get(field)
+                if isinstance(value, str) and value:
+                    _post(self._by_id, value, seq)
+            level = payload.get("level")
+            if isinstance(level, str):
+                _post(self._by_level, level.lower(), seq)
+            payload_service = payload.get("service")
+            if isinstance(payload_service, str) and payload_service != service:
+                _post(self._by_service, payload_service, seq)
+        else:
+            for value in set(_TEXT_ID_PATTERN.findall(text)):
+                _post(self._by_id, value, seq)
+
+    def query(
+        self,
+        request_id: Optional[str] = None,
+        service: Optional[str] = None,
+        level: Optional[str] = None,
+        limit: int = 100,
+        after: int = 0,
+        end: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """Return matching entries in index order with ``after <= seq < end``.
+
+        ``end`` defaults to the current line count; followers pass the bound
+        they observed so lines indexed by a concurrent refresh are left for
+        their next poll.
+        """
+        with self._lock:
+            postings: list[Sequence[int]] = []
+            if request_id:
+                postings.append(self._by_id.get(request_id, ()))
+            if level:
+                postings.append(self._by_level.get(level.lower(), ()))
+            if service:
+                postings.append(self._by_service.get(service, ()))
+            upper = self.line_count if end is None else min(end, self.line_count)
+            seqs = _intersect(postings, after, upper, limit)
+            locations = [(self._line_file[seq], self._line_offset[seq]) for seq in seqs]
+        return self._read_entries(locations)
+
+    def _read_entries(self, locations: list[tuple[int, int]]) -> list[dict[str, Any]]:
+        entries: list[dict[str, Any]] = []
+        handles: dict[int, Any] = {}
+        try:
+            for slot, offset in locations:
+                handle = handles.get(slot)
+                if handle is None:
+                    try:
+                        handle = self._files[slot].path.open("rb")
+                    except FileNotFoundError:
+                        continue
+                    handles[slot] = handle
+                handle.seek(offset)
+                line = handle.readline().decode("utf-8", errors="replace").strip()
+                entries.append(_to_entry(_parse(line), self._files[slot].service))
+        finally:
+            for handle in handles.values():
+                handle.close()
+        return entries
+
+    async def follow(
+        self,
+        request_id: Optional[str] = None,
+        service: Optional[str] = None,
+        level: Optional[str] = None,
+        poll_interval: float = 0.5,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Yield batches of matching entries as they are appended.
+
+        One (possibly empty) batch is yielded per poll so callers can send
+        keep-alives while the logs are quiet.
+        """
+        await asyncio.to_thread(self.refresh)
+        cursor, generation = self.line_count, self.generation
+        while True:
+            await asyncio.sleep(poll_interval)
+            await asyncio.to_thread(self.refresh)
+            end = self.line_count
+            if self.generation != generation:
+                # The index was rebuilt after a rotation.
+                cursor, generation = 0, self.generation
+            entries: list[dict[str, Any]] = []
+            if end > cursor:
+                entries = await asyncio.to_thread(
+                    self.query, request_id, service, level, end - cursor, cursor, end
+                )
+                cursor = end
+            yield entries
+
+
+def _post(index: dict[str, array], key: str, seq: int) -> None:
+    posting = index.get(key)
+    if posting is None:
+        posting = index[key] = array("q")
+    posting.append(seq)
+
+
+def _intersect(postings: list[Sequence[int]], after: int, end: int, limit: int) -> list[int]:
+    """Intersect sorted posting lists, returning at most ``limit`` sequences in ``[after, end)``."""
+    if not postings:
+        return list(range(after, min(end, after + limit)))
+    smallest, *others = sorted(postings, key=len)
+    results: list[int] = []
+    for index in range(bisect_left(smallest, after), len(smallest)):
+        seq = smallest[index]
+        if seq >= end:
+            break
+        if all(_contains(other, seq) for other in others):
+            results.append(seq)
+            if len(results) >= limit:
+                break
+    return results
+
+
+def _contains(posting: Sequence[int], seq: int) -> bool:
+    index = bisect_left(posting, seq)
+    return index < len(posting) and posting[index] == seq
+
+
+def _parse(text: str) -> dict[str, Any] | str:
+    try:
+        payload = json.loads(text)
+    except json.JSONDecodeError:
+        return text
+    return payload if isinstance(payload, dict) else text
+
+
+def _to_entry(payload: dict[str, Any] | str, service: str) -> dict[str, Any]:
+    if isinstance(payload, dict):
+        entry = dict(payload)
+        entry.setdefault("service", service)
+        return entry
+    return {"message": payload, "service": service}
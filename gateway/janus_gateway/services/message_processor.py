@@ -1,58 +1,356 @@
 """Message preprocessing for file attachments."""
 
-from typing import Any, TypeGuard
+import asyncio
+import hashlib
+import itertools
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import suppress
+from functools import lru_cache
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeGuard
 
+import structlog
+
+from janus_gateway.config import get_settings
 from janus_gateway.models.openai import FileContent, Message, TextContent
-from janus_gateway.services.file_extractor import FileExtractor
+from janus_gateway.services.file_extractor import ExtractionResult, FileExtractor, extract_file
+
+logger = structlog.get_logger()
+
+
+class ExtractionCache:
+    """LRU cache of extracted attachments keyed by content hash.
+
+    Clients re-send the full conversation, attachments included, on every
+    turn, so the same payload is seen many times per conversation.
+    """
+
+    def __init__(self, max_entries: int = 128) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, ExtractionResult] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(content: str, mime_type: str, filename: str) -> str:
+        """Build a cache key from the base64 payload and how it is parsed."""
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return f"{digest}:{mime_type}:{Path(filename).suffix.lower()}"
+
+    def get(self, key: str) -> Optional[ExtractionResult]:
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def set(self, key: str, result: ExtractionResult) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@lru_cache
+def get_extraction_cache() -> ExtractionCache:
+    """Get the shared extraction cache."""
+    return ExtractionCache(max_entries=get_settings().file_extraction_cache_size)
+
+
+# Attempts per attachment when its pool is killed or crashes under it.
+EXTRACTION_ATTEMPTS = 3
+
+# Worker side of the pick-up handshake, set by the pool initializer.
+_worker_started: Optional[Connection] = None
+
+
+def _init_extraction_worker(started: Connection) -> None:
+    global _worker_started
+    _worker_started = started
+
+
+def _run_extraction_job(
+    job_id: int,
+    extract: Callable[[str, str, str], ExtractionResult],
+    content: str,
+    mime_type: str,
+    name: str,
+) -> ExtractionResult:
+    """Report that a worker picked the job up, then extract."""
+    if _worker_started is not None:
+        _worker_started.send(job_id)
+    return extract(content, mime_type, name)
+
+
+class ExtractionPool:
+    """Spawned process pool for document parsing.
+
+    Workers are spawned rather than forked so they never inherit the
+    gateway's event loop or open sockets. Each worker reports when it picks
+    a job up, so the per-attachment timeout covers parsing only, not time
+    spent queued behind other attachments or waiting for a worker to start.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        context = multiprocessing.get_context("spawn")
+        reader, self._writer = context.Pipe(duplex=False)
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=context,
+            initializer=_init_extraction_worker,
+            initargs=(self._writer,),
+        )
+        self._job_ids = itertools.count()
+        self._waiters: dict[int, tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+        self._waiters_lock = threading.Lock()
+        threading.Thread(
+            target=self._read_started, args=(reader,), name="extraction-started", daemon=True
+        ).start()
+
+    async def run(
+        self,
+        extract: Callable[[str, str, str], ExtractionResult],
+        content: str,
+        mime_type: str,
+        name: str,
+        timeout: float,
+    ) -> ExtractionResult:
+        """Extract one attachment; ``timeout`` starts once a worker picks it up."""
+        loop = asyncio.get_running_loop()
+        job_id = next(self._job_ids)
+        started = asyncio.Event()
+        with self._waiters_lock:
+            self._waiters[job_id] = (loop, started)
+        future = loop.run_in_executor(
+            self.executor, _run_extraction_job, job_id, extract, content, mime_type, name
+        )
+        started_wait = asyncio.ensure_future(started.wait())
+        try:
+            await asyncio.wait({future, started_wait}, return_when=asyncio.FIRST_COMPLETED)
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            started_wait.cancel()
+            if not future.done():
+                future.cancel()
+            with self._waiters_lock:
+                self._waiters.pop(job_id, None)
+
+    def kill(self) -> None:
+        """Kill the workers; jobs still queued fail with ``BrokenProcessPool``."""
+        # ProcessPoolExecutor only gained a public way to stop running workers in 3.14.
+        kill_workers = getattr(self.executor, "kill_workers", None)
+        if kill_workers is not None:
+            kill_workers()
+        else:
+            for process in list((getattr(self.executor, "_processes", None) or {}).values()):
+                process.kill()
+        self.executor.shutdown(wait=False)
+        self._writer.close()
+
+    def shutdown(self) -> None:
+        """Stop accepting jobs and drop the ones not yet started."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self._writer.close()
+
+    def _read_started(self, reader: Connection) -> None:
+        with reader:
+            while True:
+                try:
+                    job_id = reader.recv()
+                except (EOFError, OSError):
+                    return
+                with self._waiters_lock:
+                    waiter = self._waiters.get(job_id)
+                if waiter is None:
+                    continue
+                loop, started = waiter
+                with suppress(RuntimeError):  # the waiting loop has closed
+                    loop.call_soon_threadsafe(started.set)
+
+
+@lru_cache
+def get_extraction_pool() -> ExtractionPool:
+    """Get the shared process pool used for document parsing."""
+    return ExtractionPool(max_workers=get_settings().file_extraction_workers)
+
+
+def shutdown_extraction_pool() -> None:
+    """Shut down the shared extraction pool if it was started."""
+    if get_extraction_pool.cache_info().currsize:
+        get_extraction_pool().shutdown()
+        get_extraction_pool.cache_clear()
+
+
+def recycle_extraction_pool(stale: ExtractionPool) -> None:
+    """Replace a shared pool whose worker hung or died.
+
+    The next :func:`get_extraction_pool` call builds a fresh pool, so later
+    attachments do not queue behind the hung worker. Other jobs on ``stale``
+    fail with ``BrokenProcessPool`` and are resubmitted by their callers.
+    """
+    if get_extraction_pool.cache_info().currsize and get_extraction_pool() is stale:
+        get_extraction_pool.cache_clear()
+    stale.kill()
 
 
 class MessageProcessor:
     """Process messages to extract file contents and prepare for LLM."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache: Optional[ExtractionCache] = None,
+        executor: Optional[Executor] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
         self.file_extractor = FileExtractor()
+        self._cache = cache
+        self._executor = executor
+        self._timeout = timeout
+
+    @property
+    def cache(self) -> ExtractionCache:
+        return self._cache if self._cache is not None else get_extraction_cache()
 
     def process_message(self, message: Message) -> Message:
-        """Convert file content parts into text parts."""
-        if isinstance(message.content, str) or message.content is None:
-            return message
+        """Convert file content parts into text parts.
 
-        if not message.content:
+        Extraction runs inline; async request handlers should use
+        :meth:`process_messages` so parsing does not block the event loop.
+        """
+        if not self._has_file_parts(message):
             return message
 
         processed_parts: list[Any] = []
-
-        for part in message.content:
+        for part in message.content or []:
             if self._is_file_part(part):
-                if isinstance(part, FileContent):
-                    file_info = part.file
-                    name = file_info.name
-                    mime_type = file_info.mime_type
-                    content = file_info.content
-                else:
-                    file_info = part.get("file", {})
-                    name = file_info.get("name", "unknown")
-                    mime_type = file_info.get("mime_type", "")
-                    content = file_info.get("content", "")
-
-                extracted = self.file_extractor.extract(
-                    content=content,
-                    mime_type=mime_type,
-                    filename=name,
-                )
-                processed_parts.append(
-                    TextContent(
-                        text=(
-                            f"\n[Attached file: {name}]\n"
-                            f"{extracted}\n[End of file]\n"
-                        )
+                name, mime_type, content = self._file_fields(part)
+                key = ExtractionCache.make_key(content, mime_type, name)
+                extracted = self.cache.get(key)
+                if extracted is None:
+                    extracted = self.file_extractor.extract_document(
+                        content=content,
+                        mime_type=mime_type,
+                        filename=name,
                     )
-                )
+                    self.cache.set(key, extracted)
+                processed_parts.append(self._attached_file_text(name, extracted))
             else:
                 processed_parts.append(part)
 
         return message.model_copy(update={"content": processed_parts})
 
+    async def process_messages(self, messages: list[Message]) -> list[Message]:
+        """Convert file parts in all messages without blocking the event loop."""
+        return list(
+            await asyncio.gather(*(self.process_message_async(message) for message in messages))
+        )
+
+    async def process_message_async(self, message: Message) -> Message:
+        """Async variant of :meth:`process_message`.
+
+        Document parsing is offloaded to a bounded process pool with a
+        per-attachment timeout; results are served from the content-hash
+        cache on repeat turns.
+        """
+        if not self._has_file_parts(message):
+            return message
+
+        processed_parts: list[Any] = []
+        for part in message.content or []:
+            if self._is_file_part(part):
+                name, mime_type, content = self._file_fields(part)
+                extracted = await self._extract_async(content, mime_type, name)
+                processed_parts.append(self._attached_file_text(name, extracted))
+            else:
+                processed_parts.append(part)
+
+        return message.model_copy(update={"content": processed_parts})
+
+    async def _extract_async(
+        self, content: str, mime_type: str, name: str
+    ) -> ExtractionResult:
+        key = ExtractionCache.make_key(content, mime_type, name)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        if not self.file_extractor.requires_parsing(mime_type, name):
+            extracted = self.file_extractor.extract_document(content, mime_type, name)
+            self.cache.set(key, extracted)
+            return extracted
+
+        settings = get_settings()
+        timeout = self._timeout if self._timeout is not None else settings.file_extraction_timeout
+        try:
+            extracted = await self._run_extraction(content, mime_type, name, timeout)
+        except asyncio.TimeoutError:
+            logger.warning("file_extraction_timeout", filename=name, timeout=timeout)
+            return ExtractionResult(f"[Timed out extracting {name}]")
+        except Exception as exc:
+            logger.warning("file_extraction_failed", filename=name, error=str(exc))
+            return ExtractionResult(f"[Failed to extract {name}: {exc}]")
+
+        self.cache.set(key, extracted)
+        return extracted
+
+    async def _run_extraction(
+        self, content: str, mime_type: str, name: str, timeout: float
+    ) -> ExtractionResult:
+        if self._executor is not None:
+            loop = asyncio.get_running_loop()
+            return await asyncio.wait_for(
+                loop.run_in_executor(self._executor, extract_file, content, mime_type, name),
+                timeout=timeout,
+            )
+        attempt = 1
+        while True:
+            pool = get_extraction_pool()
+            try:
+                return await pool.run(extract_file, content, mime_type, name, timeout)
+            except asyncio.TimeoutError:
+                # wait_for does not stop the worker; replace the pool so the
+                # hung parse cannot starve every later extraction.
+                recycle_extraction_pool(pool)
+                raise
+            except BrokenProcessPool:
+                # Another attachment's timeout killed the pool under this job,
+                # or a worker crashed; resubmit on a fresh pool.
+                recycle_extraction_pool(pool)
+                if attempt >= EXTRACTION_ATTEMPTS:
+                    raise
+                attempt += 1
+
+    @classmethod
+    def _has_file_parts(cls, message: Message) -> bool:
+        if isinstance(message.content, str) or not message.content:
+            return False
+        return any(cls._is_file_part(part) for part in message.content)
+
+    @staticmethod
+    def _file_fields(part: FileContent | dict[str, Any]) -> tuple[str, str, str]:
+        if isinstance(part, FileContent):
+            file_info = part.file
+            return file_info.name, file_info.mime_type, file_info.content
+        info = part.get("file", {})
+        return info.get("name", "unknown"), info.get("mime_type", ""), info.get("content", "")
+
+    @staticmethod
+    def _attached_file_text(name: str, extracted: ExtractionResult) -> TextContent:
+        header = f"{name} ({extracted.summary})" if extracted.summary else name
+        return TextContent(
+            text=f"\n[Attached file: {header}]\n{extracted.text}\n[End of file]\n"
+        )
+
     @staticmethod
     def _is_file_part(part: Any) -> TypeGuard[FileContent | dict[str, Any]]:
         return isinstance(part, FileContent) or (
@@ -0,0 +1,105 @@
+"""Incremental Server-Sent Events decoder.
+
+Shared by the gateway and baseline-agent-cli, which are built and deployed
+separately. The canonical copy is gateway/janus_gateway/services/sse_decoder.py;
+edit it there and run ``python scripts/sync_shared_modules.py`` to update the
+vendored copy (a test fails while the copies differ).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class SSEEvent:
+    """A decoded Server-Sent Event (or comment line)."""
+
+    data: str = ""
+    event: str | None = None
+    id: str | None = None
+    comment: str | None = None
+
+    def encode(self) -> str:
+        """Serialize the event back into SSE wire format."""
+        if self.comment is not None:
+            return f":{self.comment}\n\n"
+        lines = []
+        if self.event is not None:
+            lines.append(f"event: {self.event}")
+        if self.id is not None:
+            lines.append(f"id: {self.id}")
+        lines.extend(f"data: {line}" for line in self.data.split("\n"))
+        return "\n".join(lines) + "\n\n"
+
+
+class SSEDecoder:
+    """Incremental SSE decoder over raw bytes.
+
+    Each fed chunk is scanned once for line endings and a line split across
+    chunks is joined only when its terminator arrives, so decoding stays
+    linear in the stream size however the upstream chunks it. Multi-line
+    ``data:`` fields are joined with newlines as the SSE spec requires.
+    Comment lines (``: ping``) are returned only when ``include_comments``
+    is set.
+    """
+
+    def __init__(self, include_comments: bool = False) -> None:
+        self._include_comments = include_comments
+        self._partial: list[bytes] = []
+        self._data: list[str] = []
+        self._event: str | None = None
+        self._id: str | None = None
+
+    def feed(self, chunk: bytes) -> list[SSEEvent]:
+        """Decode ``chunk`` and return the events it completed."""
+        events: list[SSEEvent] = []
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end == -1:
+                break
+            line = chunk[start:end]
+            if self._partial:
+                self._partial.append(line)
+                line = b"".join(self._partial)
+                self._partial.clear()
+            self._process_line(line, events)
+            start = end + 1
+        if start < len(chunk):
+            self._partial.append(chunk[start:])
+        return events
+
+    def flush(self) -> list[SSEEvent]:
+        """Return the last event of a stream that ended without a blank line."""
+        events: list[SSEEvent] = []
+        if self._partial:
+            line = b"".join(self._partial)
+            self._partial.clear()
+            self._process_line(line, events)
+        self._process_line(b"", events)
+        return events
+
+    def _process_line(self, line: bytes, events: list[SSEEvent]) -> None:
+        if line.endswith(b"\r"):
+            line = line[:-1]
+        if not line:
+            if self._data:
+                events.append(SSEEvent(data="\n".join(self._data), event=self._event, id=self._id))
+            self._data = []
+            self._event = None
+            return
+        if line.startswith(b":"):
+            if self._include_comments:
+                events.append(SSEEvent(comment=line[1:].decode("utf-8", errors="replace")))
+            return
+        name, _, value = line.partition(b":")
+        if value.startswith(b" "):
+            value = value[1:]
+        text = value.decode("utf-8", errors="replace")
+        if name == b"data":
+            self._data.append(text)
+        elif name == b"event":
+            self._event = text
+        elif name == b"id":
+            self._id = text
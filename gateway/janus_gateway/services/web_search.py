@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Union
 
 import httpx
+import structlog
 
 from janus_gateway.config import get_settings
+from janus_gateway.services.competitor_registry import get_competitor_registry
+from janus_gateway.services.expiring_map import ExpiringMap
 
 _SERPER_URL = "https://google.serper.dev/search"
+_SEARCH_TIMEOUT_SECONDS = 30.0
+
+logger = structlog.get_logger()
+
+SearchOutcome = tuple[str, list[dict[str, str]]]
 
 
 def normalize_serper_results(payload: Any) -> list[dict[str, str]]:
@@ -67,11 +77,11 @@ async def serper_search(query: str, num_results: int = 10) -> list[dict[str, str
 
     payload = {"q": query, "num": max(1, num_results)}
     headers = {"X-API-KEY": api_key, "Content-Type": "application/json"}
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(_SERPER_URL, headers=headers, json=payload)
-        response.raise_for_status()
-        data = response.json()
-    return normalize_serper_results(data)
+    response = await get_competitor_registry().get_client().post(
+        _SERPER_URL, headers=headers, json=payload, timeout=_SEARCH_TIMEOUT_SECONDS
+    )
+    response.raise_for_status()
+    return normalize_serper_results(response.json())
 
 
 async def searxng_search(query: str, num_results: int = 10) -> list[dict[str, str]]:
@@ -86,18 +96,121 @@ async def searxng_search(query: str, num_results: int = 10) -> list[dict[str, st
         "q": query,
         "format": "json",
     }
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-    results = normalize_searxng_results(data)
+    response = await get_competitor_registry().get_client().get(
+        url, params=params, timeout=_SEARCH_TIMEOUT_SECONDS
+    )
+    response.raise_for_status()
+    results = normalize_searxng_results(response.json())
     if num_results > 0:
         results = results[: max(1, num_results)]
     return results
 
 
-async def web_search(query: str, num_results: int = 10) -> tuple[str, list[dict[str, str]]]:
-    """Search the web via Serper, falling back to SearXNG when configured."""
+class WebSearchCache:
+    """TTL cache for web search results with single-flight coalescing.
+
+    Identical queries that arrive while one is already in flight share its
+    upstream call. Provider failures are cached for a shorter TTL so a
+    failing provider is not hammered by retries.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 600.0,
+        negative_ttl_seconds: float = 30.0,
+        max_entries: int = 1024,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._entries: ExpiringMap[str, Union[SearchOutcome, RuntimeError]] = ExpiringMap(
+            ttl_seconds=ttl_seconds, max_size=max_entries
+        )
+        self._inflight: dict[str, asyncio.Task[SearchOutcome]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(query: str, num_results: int) -> str:
+        return f"{num_results}:{' '.join(query.split()).casefold()}"
+
+    async def get_or_fetch(
+        self, key: str, fetch: Callable[[], Awaitable[SearchOutcome]]
+    ) -> SearchOutcome:
+        if self._ttl_seconds <= 0:
+            self.misses += 1
+            return await fetch()
+
+        cached = self._entries.get(key)
+        if cached is not None:
+            self.hits += 1
+            if isinstance(cached, RuntimeError):
+                raise RuntimeError(str(cached))
+            source, results = cached
+            return source, list(results)
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.create_task(self._fetch_and_store(key, fetch))
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+        # Shielded so one caller disconnecting does not cancel the shared call.
+        source, results = await asyncio.shield(task)
+        return source, list(results)
+
+    async def _fetch_and_store(
+        self, key: str, fetch: Callable[[], Awaitable[SearchOutcome]]
+    ) -> SearchOutcome:
+        try:
+            outcome = await fetch()
+        except RuntimeError as exc:
+            if self._negative_ttl_seconds > 0:
+                self._entries.set(key, exc, ttl_seconds=self._negative_ttl_seconds)
+            raise
+        else:
+            self._entries.set(key, outcome)
+            return outcome
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "entries": len(self._entries),
+        }
+
+
+@lru_cache
+def get_web_search_cache() -> WebSearchCache:
+    """Get the shared web search cache."""
+    settings = get_settings()
+    return WebSearchCache(
+        ttl_seconds=settings.web_search_cache_ttl,
+        negative_ttl_seconds=settings.web_search_negative_ttl,
+        max_entries=settings.web_search_cache_size,
+    )
+
+
+async def web_search(query: str, num_results: int = 10) -> SearchOutcome:
+    """Search the web via Serper, falling back to SearXNG when configured.
+
+    Results are served from :class:`WebSearchCache` keyed by the normalized
+    query and ``num_results``.
+    """
+    cache = get_web_search_cache()
+    key = WebSearchCache.make_key(query, num_results)
+    source, results = await cache.get_or_fetch(
+        key, lambda: _search_providers(query, num_results)
+    )
+    logger.debug("web_search", source=source, results=len(results), **cache.stats())
+    return source, results
+
+
+async def _search_providers(query: str, num_results: int) -> SearchOutcome:
     settings = get_settings()
     last_error: Exception | None = None
 
@@ -1,6 +1,14 @@
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from janus_gateway.main import app
 from janus_gateway.models import CompetitorInfo
+from janus_gateway.routers import arena as arena_router
 from janus_gateway.services.arena import ArenaPromptStore, ArenaService
 from janus_gateway.services.competitor_registry import CompetitorRegistry
+from janus_gateway.services.expiring_map import ExpiringMap
 
 
 def test_arena_pair_distinct():
@@ -20,6 +28,76 @@ def test_arena_pair_distinct():
     assert model_a != model_b
 
 
+def _two_competitor_registry() -> CompetitorRegistry:
+    registry = CompetitorRegistry()
+    for competitor in registry.list_all(enabled_only=False):
+        registry.unregister(competitor.id)
+    for competitor_id in ("fast-model", "slow-model"):
+        registry.register(
+            CompetitorInfo(
+                id=competitor_id,
+                name=competitor_id,
+                description="Test competitor",
+                url=f"http://{competitor_id}.test",
+                enabled=True,
+                is_baseline=False,
+            )
+        )
+    return registry
+
+
+def test_arena_stream_multiplexes_side_tagged_deltas(monkeypatch):
+    registry = _two_competitor_registry()
+    started: list[str] = []
+
+    async def fake_stream(client, url, request, completion_id, settings, **kwargs):
+        started.append(request.model)
+        delay = 0.0 if request.model == "fast-model" else 0.2
+        await asyncio.sleep(delay)
+        chunk = {
+            "id": completion_id,
+            "model": request.model,
+            "choices": [{"index": 0, "delta": {"content": request.model}}],
+        }
+        yield ": ping\n\n"
+        yield f"data: {json.dumps(chunk)}\n\n"
+        yield "data: [DONE]\n\n"
+
+    monkeypatch.setattr(arena_router, "stream_from_competitor", fake_stream)
+    app.dependency_overrides[arena_router.get_competitor_registry] = lambda: registry
+    try:
+        response = TestClient(app).post(
+            "/v1/chat/completions/arena",
+            json={
+                "model": "arena",
+                "messages": [{"role": "user", "content": "Hello"}],
+                "stream": True,
+            },
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        line[len("data: "):]
+        for line in response.text.split("\n\n")
+        if line.startswith("data: ")
+    ]
+    assert events[-1] == "[DONE]"
+    payloads = [json.loads(event) for event in events[:-1]]
+    assert payloads[0]["object"] == "arena.prompt"
+    assert arena_router.prompt_store.get(payloads[0]["prompt_id"]) is not None
+
+    deltas = [payload for payload in payloads if "choices" in payload]
+    assert sorted(started) == ["fast-model", "slow-model"]
+    assert deltas[0]["choices"][0]["delta"]["content"] == "fast-model"
+    assert all("model" not in delta for delta in deltas)
+    assert {delta["side"] for delta in deltas} == {"a", "b"}
+    done_sides = [p["side"] for p in payloads if p.get("object") == "arena.side.done"]
+    assert sorted(done_sides) == ["a", "b"]
+
+
 def test_prompt_store_marks_vote():
     store = ArenaPromptStore(ttl_seconds=60)
     record = store.create("Hello world", "model-a", "model-b", user_id=None)
@@ -30,3 +108,17 @@ def test_prompt_store_marks_vote():
     fetched = store.get(record.prompt_id)
     assert fetched is not None
     assert fetched.voted is True
+
+
+def test_vote_history_expires_idle_clients(monkeypatch):
+    now = [0.0]
+    history = ExpiringMap(ttl_seconds=arena_router._VOTE_WINDOW_SECONDS, clock=lambda: now[0])
+    monkeypatch.setattr(arena_router, "_vote_history", history)
+    monkeypatch.setattr(arena_router.time, "monotonic", lambda: now[0])
+
+    arena_router._check_rate_limit("client-1")
+    assert len(history) == 1
+    now[0] = arena_router._VOTE_WINDOW_SECONDS + 1
+    arena_router._check_rate_limit("client-2")
+    assert history.get("client-1") is None
+    assert len(history) == 1
@@ -2,12 +2,15 @@
 
 import base64
 import hashlib
+import sqlite3
 
+import pytest
 from fastapi.testclient import TestClient
 
+from janus_gateway.main import app
 from janus_gateway.models import ArtifactType
 from janus_gateway.services import get_artifact_store
-from janus_gateway.services.artifact_store import build_data_url
+from janus_gateway.services.artifact_store import ArtifactStore, build_data_url
 
 
 def test_artifact_not_found(client: TestClient) -> None:
@@ -50,6 +53,23 @@ def test_artifact_retrieval(client: TestClient) -> None:
     store.delete(artifact.id)
 
 
+def test_artifact_download_touches_index_once(client: TestClient) -> None:
+    """A download looks the artifact up and records the access exactly once."""
+    store = get_artifact_store()
+    artifact = store.store(b"payload", "text/plain", "once.txt")
+    statements: list[str] = []
+    store._db.set_trace_callback(statements.append)
+    try:
+        response = client.get(f"/v1/artifacts/{artifact.id}")
+    finally:
+        store._db.set_trace_callback(None)
+        store.delete(artifact.id)
+
+    assert response.status_code == 200
+    assert sum(sql.startswith("SELECT * FROM artifacts") for sql in statements) == 1
+    assert sum(sql.startswith("UPDATE artifacts") for sql in statements) == 1
+
+
 def test_artifact_data_url_matches_sha() -> None:
     """Test base64 data URL decoding matches stored SHA256."""
     store = get_artifact_store()
@@ -72,3 +92,70 @@ def test_artifact_data_url_matches_sha() -> None:
         assert hashlib.sha256(decoded).hexdigest() == artifact.sha256
     finally:
         store.delete(artifact.id)
+
+
+def test_artifact_store_dedupes_and_persists(tmp_path) -> None:
+    """Identical payloads share one blob and metadata survives a restart."""
+    store = ArtifactStore(str(tmp_path))
+    first = store.store(b"same bytes", "text/plain", "a.txt")
+    second = store.store(b"same bytes", "text/plain", "b.txt")
+    assert first.sha256 == second.sha256
+    assert store.total_bytes() == len(b"same bytes")
+
+    store.delete(first.id)
+    assert store.get_data(second.id) == b"same bytes"
+    restored, path = store.get_with_path(second.id)
+    assert restored is not None and path is not None
+    assert path.read_bytes() == b"same bytes"
+    store.close()
+
+    reopened = ArtifactStore(str(tmp_path))
+    restored = reopened.get(second.id)
+    assert restored is not None
+    assert restored.display_name == "b.txt"
+    reopened.delete(second.id)
+    assert reopened.total_bytes() == 0
+    assert not any(path.is_file() for path in (tmp_path / "blobs").rglob("*"))
+
+
+def test_artifact_store_evicts_least_recently_used(tmp_path) -> None:
+    store = ArtifactStore(str(tmp_path), max_bytes=20)
+    oldest = store.store(b"a" * 8, "text/plain", "a.txt")
+    recent = store.store(b"b" * 8, "text/plain", "b.txt")
+    assert store.get(oldest.id) is not None  # touch: now most recently used
+    store.store(b"c" * 8, "text/plain", "c.txt")
+
+    assert store.get(recent.id) is None
+    assert store.get(oldest.id) is not None
+    assert store.total_bytes() == 16
+
+
+def test_artifact_store_cleanup_expired(tmp_path) -> None:
+    store = ArtifactStore(str(tmp_path), ttl_seconds=0)
+    artifact = store.store(b"short lived", "text/plain", "tmp.txt")
+    assert store.cleanup_expired() == 1
+    assert store.get(artifact.id) is None
+    assert store.total_bytes() == 0
+
+
+def test_artifact_range_request(client: TestClient) -> None:
+    store = get_artifact_store()
+    artifact = store.store(b"0123456789", "video/mp4", "clip.mp4")
+    try:
+        response = client.get(
+            f"/v1/artifacts/{artifact.id}", headers={"Range": "bytes=2-5"}
+        )
+        assert response.status_code == 206
+        assert response.content == b"2345"
+        assert response.headers["content-range"] == "bytes 2-5/10"
+    finally:
+        store.delete(artifact.id)
+
+
+def test_lifespan_shutdown_closes_artifact_store() -> None:
+    """The metadata index is closed on shutdown and reopened on the next start."""
+    with TestClient(app):
+        store = get_artifact_store()
+    with pytest.raises(sqlite3.ProgrammingError):
+        store._db.execute("SELECT 1")
+    assert get_artifact_store() is not store
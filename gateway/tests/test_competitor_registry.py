@@ -40,3 +40,15 @@ def test_langchain_url_hostport_uses_http(monkeypatch) -> None:
 def test_langchain_url_hostname_uses_https(monkeypatch) -> None:
     monkeypatch.setenv("BASELINE_LANGCHAIN_URL", "janus-baseline-langchain.onrender.com")
     assert _load_langchain_url() == "https://janus-baseline-langchain.onrender.com"
+
+
+def test_competitor_stats_endpoint(client) -> None:
+    get_competitor_registry.cache_clear()
+    registry = get_competitor_registry()
+    registry.health("baseline-cli-agent").record_success(0.25)
+
+    response = client.get("/v1/competitors/stats")
+    assert response.status_code == 200
+    stats = {entry["id"]: entry for entry in response.json()["data"]}
+    assert stats["baseline-cli-agent"]["ttft_ewma_ms"] == 250.0
+    assert stats["baseline-cli-agent"]["warm"] is True
@@ -79,3 +79,25 @@ def test_extract_pptx() -> None:
         "sample.pptx",
     )
     assert "Hello Slide" in extracted
+
+
+def test_extract_pdf_stops_at_text_budget(monkeypatch) -> None:
+    monkeypatch.setattr(FileExtractor, "MAX_TEXT_LENGTH", 500)
+    extractor = FileExtractor()
+    doc = fitz.open()
+    for i in range(20):
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(72, 72, 540, 760), f"Page body {i} " * 20)
+    result = extractor.extract_document(
+        _encode(doc.tobytes()), "application/pdf", "long.pdf"
+    )
+    assert len(result.text) == 500
+    assert result.total == 20
+    assert result.extracted < 20
+    assert result.summary == f"pages {result.extracted}/20"
+
+
+def test_extract_text_file_has_no_summary() -> None:
+    result = FileExtractor().extract_document(_encode(b"plain"), "text/plain", "notes.txt")
+    assert result.text == "plain"
+    assert result.summary == ""
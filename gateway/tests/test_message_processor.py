@@ -1,7 +1,20 @@
 """Tests for message preprocessing."""
 
+import base64
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import fitz
+
+from janus_gateway.config import get_settings
 from janus_gateway.models.openai import FileContent, FileInfo, Message, MessageRole
-from janus_gateway.services.message_processor import MessageProcessor
+from janus_gateway.services.file_extractor import ExtractionResult, extract_file
+from janus_gateway.services.message_processor import (
+    ExtractionCache,
+    MessageProcessor,
+    get_extraction_pool,
+    shutdown_extraction_pool,
+)
 
 
 def test_message_processor_converts_file_part_to_text() -> None:
@@ -23,3 +36,160 @@ def test_message_processor_converts_file_part_to_text() -> None:
     assert isinstance(processed.content, list)
     assert processed.content[0].type == "text"
     assert "Hello from file" in processed.content[0].text
+
+
+def _pdf_message(text: str, name: str = "report.pdf") -> Message:
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), text)
+    content = base64.b64encode(doc.tobytes()).decode("utf-8")
+    return Message(
+        role=MessageRole.USER,
+        content=[
+            FileContent(
+                file=FileInfo(
+                    name=name,
+                    mime_type="application/pdf",
+                    content=content,
+                    size=len(content),
+                )
+            )
+        ],
+    )
+
+
+async def test_process_messages_extracts_off_loop_and_caches(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def counting_extract(content: str, mime_type: str, filename: str) -> ExtractionResult:
+        calls.append(filename)
+        return extract_file(content, mime_type, filename)
+
+    monkeypatch.setattr(
+        "janus_gateway.services.message_processor.extract_file", counting_extract
+    )
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        processor = MessageProcessor(cache=ExtractionCache(), executor=executor)
+        message = _pdf_message("Hello PDF")
+        first = await processor.process_messages([message])
+        second = await processor.process_messages([message])
+
+    assert calls == ["report.pdf"]
+    assert isinstance(first[0].content, list)
+    assert "Hello PDF" in first[0].content[0].text
+    assert "[Attached file: report.pdf (pages 1/1)]" in first[0].content[0].text
+    assert first[0].content[0].text == second[0].content[0].text
+    assert processor.cache.hits == 1
+
+
+async def test_process_messages_times_out_slow_extraction(monkeypatch) -> None:
+    def slow_extract(content: str, mime_type: str, filename: str) -> ExtractionResult:
+        time.sleep(0.5)
+        return ExtractionResult("too late")
+
+    monkeypatch.setattr("janus_gateway.services.message_processor.extract_file", slow_extract)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        cache = ExtractionCache()
+        processor = MessageProcessor(cache=cache, executor=executor, timeout=0.05)
+        processed = await processor.process_messages([_pdf_message("Slow")])
+
+    assert isinstance(processed[0].content, list)
+    assert "Timed out extracting report.pdf" in processed[0].content[0].text
+    assert len(cache) == 0
+
+
+def hanging_extract(content: str, mime_type: str, filename: str) -> ExtractionResult:
+    # Module level so spawned pool workers can unpickle it.
+    time.sleep(60)
+    return ExtractionResult("never")
+
+
+def quick_extract(content: str, mime_type: str, filename: str) -> ExtractionResult:
+    return ExtractionResult(f"parsed {filename}")
+
+
+async def test_hung_extraction_does_not_block_the_next_one(monkeypatch) -> None:
+    monkeypatch.setenv("JANUS_FILE_EXTRACTION_WORKERS", "1")
+    get_settings.cache_clear()
+    shutdown_extraction_pool()
+    target = "janus_gateway.services.message_processor.extract_file"
+    try:
+        monkeypatch.setattr(target, hanging_extract)
+        hung_pool = get_extraction_pool()
+        hung = await MessageProcessor(cache=ExtractionCache(), timeout=2.0).process_messages(
+            [_pdf_message("Hung")]
+        )
+        assert "Timed out extracting report.pdf" in hung[0].content[0].text
+        assert get_extraction_pool() is not hung_pool
+
+        monkeypatch.setattr(target, quick_extract)
+        processed = await MessageProcessor(cache=ExtractionCache(), timeout=30.0).process_messages(
+            [_pdf_message("Next")]
+        )
+        assert "parsed report.pdf" in processed[0].content[0].text
+    finally:
+        shutdown_extraction_pool()
+        get_settings.cache_clear()
+
+
+def selective_extract(content: str, mime_type: str, filename: str) -> ExtractionResult:
+    if filename == "hang.pdf":
+        time.sleep(60)
+    return ExtractionResult(f"parsed {filename}")
+
+
+def slow_extract(content: str, mime_type: str, filename: str) -> ExtractionResult:
+    time.sleep(1.0)
+    return ExtractionResult(f"parsed {filename}")
+
+
+async def test_hung_extraction_leaves_concurrent_ones_intact(monkeypatch) -> None:
+    monkeypatch.setenv("JANUS_FILE_EXTRACTION_WORKERS", "2")
+    get_settings.cache_clear()
+    shutdown_extraction_pool()
+    monkeypatch.setattr(
+        "janus_gateway.services.message_processor.extract_file", selective_extract
+    )
+    names = ["hang.pdf", *(f"doc-{i}.pdf" for i in range(7))]
+    try:
+        processed = await MessageProcessor(cache=ExtractionCache(), timeout=2.0).process_messages(
+            [_pdf_message(name, name) for name in names]
+        )
+    finally:
+        shutdown_extraction_pool()
+        get_settings.cache_clear()
+
+    texts = [message.content[0].text for message in processed]
+    assert "Timed out extracting hang.pdf" in texts[0]
+    for name, text in zip(names[1:], texts[1:]):
+        assert f"parsed {name}" in text
+
+
+async def test_extraction_timeout_excludes_queue_wait(monkeypatch) -> None:
+    monkeypatch.setenv("JANUS_FILE_EXTRACTION_WORKERS", "1")
+    get_settings.cache_clear()
+    shutdown_extraction_pool()
+    monkeypatch.setattr("janus_gateway.services.message_processor.extract_file", slow_extract)
+    names = [f"slow-{i}.pdf" for i in range(3)]
+    try:
+        # Each parse fits its 1.5s budget, but the last one is queued for ~2s.
+        processed = await MessageProcessor(cache=ExtractionCache(), timeout=1.5).process_messages(
+            [_pdf_message(name, name) for name in names]
+        )
+    finally:
+        shutdown_extraction_pool()
+        get_settings.cache_clear()
+
+    for name, message in zip(names, processed):
+        assert f"parsed {name}" in message.content[0].text
+
+
+def test_extraction_cache_evicts_least_recently_used() -> None:
+    cache = ExtractionCache(max_entries=2)
+    cache.set("a", ExtractionResult("A"))
+    cache.set("b", ExtractionResult("B"))
+    assert cache.get("a") == ExtractionResult("A")
+    cache.set("c", ExtractionResult("C"))
+    assert cache.get("b") is None
+    assert cache.get("a") == ExtractionResult("A")
+    assert cache.get("c") == ExtractionResult("C")
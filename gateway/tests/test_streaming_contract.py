@@ -19,6 +19,7 @@ from janus_gateway.models import (
     MessageRole,
 )
 from janus_gateway.routers.chat import stream_from_competitor
+from janus_gateway.services.competitor_registry import CompetitorHealth
 
 
 class StubStreamResponse:
@@ -45,10 +46,31 @@ class StubStreamResponse:
                 await asyncio.sleep(delay)
             yield line
 
+    async def aiter_text(self):  # type: ignore[override]
+        async for line in self.aiter_lines():
+            yield f"{line}\n\n"
+
+    async def aiter_bytes(self):  # type: ignore[override]
+        async for line in self.aiter_lines():
+            yield f"{line}\n\n".encode("utf-8")
+
     async def aread(self) -> bytes:
         return b""
 
 
+class StubChunkedResponse(StubStreamResponse):
+    """Stubbed streaming response that yields arbitrary text chunks."""
+
+    async def aiter_lines(self):  # type: ignore[override]
+        raise AssertionError("passthrough mode must not split lines")
+
+    async def aiter_text(self):  # type: ignore[override]
+        for chunk, delay in zip(self._lines, self._delays, strict=True):
+            if delay:
+                await asyncio.sleep(delay)
+            yield chunk
+
+
 class StubStreamContext:
     """Async context manager wrapper for the stub response."""
 
@@ -304,3 +326,150 @@ async def test_gateway_surfaces_non_retryable_upstream_errors(
     assert client.attempts == 1, "Non-retryable 4xx should not be retried"
     joined = "".join(payloads)
     assert "Error from competitor: 400" in joined
+
+
+@pytest.mark.asyncio
+async def test_passthrough_forwards_raw_chunks_and_detects_split_done() -> None:
+    """Passthrough mode forwards chunks verbatim and finds a split [DONE]."""
+    request = ChatCompletionRequest(
+        model="baseline",
+        messages=[Message(role=MessageRole.USER, content="Hello")],
+        stream=True,
+    )
+    content_chunk = ChatCompletionChunk(
+        id="chatcmpl-test",
+        model="baseline",
+        choices=[ChunkChoice(delta=Delta(content="the literal [DONE] is content"))],
+    )
+    body = f"data: {content_chunk.model_dump_json()}\n\ndata: [DONE]\n\n"
+    split_at = body.index("[DONE]\n\n") + 3
+    chunks = [body[:20], body[20:split_at], body[split_at:], "data: late\n\n"]
+    client = StubClient(StubChunkedResponse(chunks))
+    settings = Settings(keep_alive_interval=1.0)
+
+    payloads = [
+        payload
+        async for payload in stream_from_competitor(
+            client, "http://example.test", request, "req-test", settings
+        )
+    ]
+
+    assert payloads == chunks[:3]
+
+
+@pytest.mark.asyncio
+async def test_passthrough_keep_alive_waits_for_event_boundary() -> None:
+    """Keep-alives are never injected into the middle of an upstream event."""
+    request = ChatCompletionRequest(
+        model="baseline",
+        messages=[Message(role=MessageRole.USER, content="Hello")],
+        stream=True,
+    )
+    chunks = ['data: {"choices": [', '{"delta": {}}]}\n\n', "data: [DONE]\n\n"]
+    client = StubClient(StubChunkedResponse(chunks, delays=[0.0, 0.35, 0.35]))
+    settings = Settings(keep_alive_interval=0.1)
+
+    payloads = [
+        payload
+        async for payload in stream_from_competitor(
+            client, "http://example.test", request, "req-test", settings
+        )
+    ]
+
+    first_ping = payloads.index(": ping\n\n")
+    assert payloads[:2] == chunks[:2]
+    assert first_ping == 2
+    assert payloads[-1] == chunks[2]
+
+
+@pytest.mark.asyncio
+async def test_debug_log_level_uses_line_mode() -> None:
+    """Debug logging decodes and classifies individual events."""
+    request = ChatCompletionRequest(
+        model="baseline",
+        messages=[Message(role=MessageRole.USER, content="Hello")],
+        stream=True,
+    )
+
+    class LineOnlyResponse(StubStreamResponse):
+        async def aiter_text(self):  # type: ignore[override]
+            raise AssertionError("debug mode must classify individual events")
+            yield ""
+
+    lines = ['data: {"choices": []}', "data: [DONE]"]
+    client = StubClient(LineOnlyResponse(lines))
+    settings = Settings(keep_alive_interval=1.0, log_level="DEBUG")
+
+    payloads = [
+        payload
+        async for payload in stream_from_competitor(
+            client, "http://example.test", request, "req-test", settings
+        )
+    ]
+
+    assert payloads == [f"{line}\n\n" for line in lines]
+
+
+@pytest.mark.asyncio
+async def test_debug_mode_keeps_multiline_events_intact() -> None:
+    """Events split across chunks and spanning several data lines stay whole."""
+    request = ChatCompletionRequest(
+        model="baseline",
+        messages=[Message(role=MessageRole.USER, content="Hello")],
+        stream=True,
+    )
+
+    class ChunkedBytesResponse(StubStreamResponse):
+        async def aiter_bytes(self):  # type: ignore[override]
+            for chunk in self._lines:
+                yield chunk.encode("utf-8")
+
+    chunks = [
+        'event: message\r\ndata: {"choices":',
+        ' []}\r\ndata: {"x": 1}\r\n\r\n: ping\n\n',
+        "data: [DONE]\n\n",
+    ]
+    client = StubClient(ChunkedBytesResponse(chunks))
+    settings = Settings(keep_alive_interval=1.0, log_level="DEBUG")
+
+    payloads = [
+        payload
+        async for payload in stream_from_competitor(
+            client, "http://example.test", request, "req-test", settings
+        )
+    ]
+
+    assert payloads == [
+        'event: message\ndata: {"choices": []}\ndata: {"x": 1}\n\n',
+        ": ping\n\n",
+        "data: [DONE]\n\n",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_records_competitor_health() -> None:
+    """Successful and failed streams update the competitor's health state."""
+    request = ChatCompletionRequest(
+        model="baseline",
+        messages=[Message(role=MessageRole.USER, content="Hello")],
+        stream=True,
+    )
+    settings = Settings(keep_alive_interval=1.0)
+    health = CompetitorHealth()
+
+    ok_client = StubClient(StubStreamResponse(['data: {"choices": []}', "data: [DONE]"]))
+    async for _ in stream_from_competitor(
+        ok_client, "http://example.test", request, "req-test", settings, health=health
+    ):
+        pass
+    assert health.requests == 1
+    assert health.ttft_ewma_ms is not None
+    assert health.last_seen_warm is not None
+
+    failing_client = StubClient(StubStreamResponse([], status_code=400))
+    async for _ in stream_from_competitor(
+        failing_client, "http://example.test", request, "req-test", settings, health=health
+    ):
+        pass
+    assert health.errors == 1
+    assert health.last_error == "HTTP 400"
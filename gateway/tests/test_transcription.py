@@ -34,12 +34,16 @@ class MockAsyncClient:
         return None
 
     async def post(
-        self, url: str, headers: Dict[str, str], json: Dict[str, Any]
+        self,
+        url: str,
+        headers: Dict[str, str],
+        json: Dict[str, Any],
+        timeout: Optional[float] = None,
     ) -> DummyResponse:
         self.request = {"url": url, "headers": headers, "json": json}
         return self.response
 
-    async def options(self, url: str) -> DummyResponse:
+    async def options(self, url: str, timeout: Optional[float] = None) -> DummyResponse:
         return self.response
 
 
@@ -56,7 +60,7 @@ def test_transcribe_audio_success(client, monkeypatch) -> None:
         return MockAsyncClient(response)
 
     monkeypatch.setattr(
-        "janus_gateway.routers.transcription.httpx.AsyncClient", mock_client
+        "janus_gateway.services.competitor_registry.CompetitorRegistry.get_client", mock_client
     )
 
     result = client.post("/api/transcribe", json={"audio_b64": "Zm9v", "language": "en"})
@@ -75,7 +79,7 @@ def test_transcribe_audio_omits_null_language(client, monkeypatch) -> None:
         return client_instance
 
     monkeypatch.setattr(
-        "janus_gateway.routers.transcription.httpx.AsyncClient", mock_client
+        "janus_gateway.services.competitor_registry.CompetitorRegistry.get_client", mock_client
     )
 
     result = client.post("/api/transcribe", json={"audio_b64": "Zm9v"})
@@ -97,7 +101,7 @@ def test_transcribe_audio_list_response(client, monkeypatch) -> None:
         return client_instance
 
     monkeypatch.setattr(
-        "janus_gateway.routers.transcription.httpx.AsyncClient", mock_client
+        "janus_gateway.services.competitor_registry.CompetitorRegistry.get_client", mock_client
     )
 
     result = client.post("/api/transcribe", json={"audio_b64": "Zm9v"})
@@ -138,7 +142,7 @@ def test_transcribe_audio_upstream_error(client, monkeypatch) -> None:
         return MockAsyncClient(response)
 
     monkeypatch.setattr(
-        "janus_gateway.routers.transcription.httpx.AsyncClient", mock_client
+        "janus_gateway.services.competitor_registry.CompetitorRegistry.get_client", mock_client
     )
 
     result = client.post("/api/transcribe", json={"audio_b64": "Zm9v"})
@@ -159,11 +163,11 @@ def test_transcribe_audio_timeout(client, monkeypatch) -> None:
         async def __aexit__(self, exc_type, exc, tb) -> None:
             return None
 
-        async def post(self, url, headers, json) -> DummyResponse:
+        async def post(self, url, headers, json, timeout=None) -> DummyResponse:
             raise httpx.TimeoutException("timeout")
 
     monkeypatch.setattr(
-        "janus_gateway.routers.transcription.httpx.AsyncClient",
+        "janus_gateway.services.competitor_registry.CompetitorRegistry.get_client",
         lambda *args, **kwargs: TimeoutClient(),
     )
 
@@ -184,7 +188,7 @@ def test_transcribe_audio_rate_limit(client, monkeypatch) -> None:
         return MockAsyncClient(response)
 
     monkeypatch.setattr(
-        "janus_gateway.routers.transcription.httpx.AsyncClient", mock_client
+        "janus_gateway.services.competitor_registry.CompetitorRegistry.get_client", mock_client
     )
 
     result = client.post("/api/transcribe", json={"audio_b64": "Zm9v"})
@@ -204,7 +208,7 @@ def test_transcribe_audio_invalid_api_key(client, monkeypatch) -> None:
         return MockAsyncClient(response)
 
     monkeypatch.setattr(
-        "janus_gateway.routers.transcription.httpx.AsyncClient", mock_client
+        "janus_gateway.services.competitor_registry.CompetitorRegistry.get_client", mock_client
     )
 
     result = client.post("/api/transcribe", json={"audio_b64": "Zm9v"})
@@ -236,7 +240,7 @@ def test_transcribe_health_api_key_configured(client, monkeypatch) -> None:
         return MockAsyncClient(response)
 
     monkeypatch.setattr(
-        "janus_gateway.routers.transcription.httpx.AsyncClient", mock_client
+        "janus_gateway.services.competitor_registry.CompetitorRegistry.get_client", mock_client
     )
 
     result = client.get("/api/transcribe/health")
@@ -258,11 +262,11 @@ def test_transcribe_health_endpoint_unreachable(client, monkeypatch) -> None:
         async def __aexit__(self, exc_type, exc, tb) -> None:
             return None
 
-        async def options(self, url: str) -> DummyResponse:
+        async def options(self, url: str, timeout: Optional[float] = None) -> DummyResponse:
             raise httpx.RequestError("connection failed")
 
     monkeypatch.setattr(
-        "janus_gateway.routers.transcription.httpx.AsyncClient",
+        "janus_gateway.services.competitor_registry.CompetitorRegistry.get_client",
         lambda *args, **kwargs: ErrorClient(),
     )
 
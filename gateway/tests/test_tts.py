@@ -34,7 +34,13 @@ class MockAsyncClient:
     async def __aexit__(self, exc_type, exc, tb) -> None:
         return None
 
-    async def post(self, url: str, headers: Dict[str, str], json: Dict[str, Any]) -> DummyResponse:
+    async def post(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        json: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> DummyResponse:
         self.request = {"url": url, "headers": headers, "json": json}
         return self.response
 
@@ -48,7 +54,9 @@ def test_tts_success(client, monkeypatch) -> None:
     def mock_client(*args, **kwargs) -> MockAsyncClient:
         return MockAsyncClient(response)
 
-    monkeypatch.setattr("janus_gateway.routers.tts.httpx.AsyncClient", mock_client)
+    monkeypatch.setattr(
+        "janus_gateway.services.competitor_registry.CompetitorRegistry.get_client", mock_client
+    )
 
     result = client.post("/api/tts", json={"text": "Hello", "voice": "af_sky", "speed": 1.0})
     assert result.status_code == 200
@@ -73,7 +81,9 @@ def test_tts_upstream_error(client, monkeypatch) -> None:
     def mock_client(*args, **kwargs) -> MockAsyncClient:
         return MockAsyncClient(response)
 
-    monkeypatch.setattr("janus_gateway.routers.tts.httpx.AsyncClient", mock_client)
+    monkeypatch.setattr(
+        "janus_gateway.services.competitor_registry.CompetitorRegistry.get_client", mock_client
+    )
 
     result = client.post("/api/tts", json={"text": "Hello"})
     assert result.status_code == 500
@@ -91,10 +101,13 @@ def test_tts_timeout(client, monkeypatch) -> None:
         async def __aexit__(self, exc_type, exc, tb) -> None:
             return None
 
-        async def post(self, url, headers, json) -> DummyResponse:
+        async def post(self, url, headers, json, timeout=None) -> DummyResponse:
             raise httpx.TimeoutException("timeout")
 
-    monkeypatch.setattr("janus_gateway.routers.tts.httpx.AsyncClient", lambda *args, **kwargs: TimeoutClient())
+    monkeypatch.setattr(
+        "janus_gateway.services.competitor_registry.CompetitorRegistry.get_client",
+        lambda *args, **kwargs: TimeoutClient(),
+    )
 
     result = client.post("/api/tts", json={"text": "Hello"})
     assert result.status_code == 504
@@ -1,5 +1,10 @@
 """Unit tests for competitor registry."""
 
+import asyncio
+
+import httpx
+import pytest
+
 from janus_gateway.models import CompetitorInfo
 from janus_gateway.services.competitor_registry import CompetitorRegistry
 
@@ -72,3 +77,102 @@ def test_list_enabled_only() -> None:
     active_ids = {entry.id for entry in registry.list_all(enabled_only=True)}
     assert "active" in active_ids
     assert "inactive" not in active_ids
+
+
+async def test_get_client_pools_per_competitor() -> None:
+    registry = CompetitorRegistry(http2=False)
+    baseline_client = registry.get_client("baseline-cli-agent")
+    assert registry.get_client("baseline-cli-agent") is baseline_client
+    assert registry.get_client() is not baseline_client
+    await registry.aclose()
+    assert baseline_client.is_closed
+    assert registry.get_client("baseline-cli-agent") is not baseline_client
+    await registry.aclose()
+
+
+def test_health_tracks_ttft_and_error_rate() -> None:
+    registry = CompetitorRegistry()
+    health = registry.health("baseline-cli-agent")
+    health.record_success(0.5)
+    health.record_success(1.0)
+    assert health.ttft_ewma_ms == pytest.approx(600.0)
+    assert health.is_warm(idle_seconds=60)
+
+    for _ in range(5):
+        health.record_error("HTTP 500")
+    assert health.errors == 5
+    assert not health.healthy
+    assert health.last_error == "HTTP 500"
+
+
+def test_completion_latency_is_kept_out_of_ttft() -> None:
+    registry = CompetitorRegistry()
+    health = registry.health("baseline-cli-agent")
+    health.record_success(0.2)
+    health.record_completion(30.0)
+    assert health.ttft_ewma_ms == pytest.approx(200.0)
+    assert health.completion_ewma_ms == pytest.approx(30000.0)
+    assert health.requests == 2
+
+    stats = {s.id: s for s in registry.stats(idle_seconds=60)}
+    assert stats["baseline-cli-agent"].completion_ewma_ms == 30000.0
+
+
+def test_list_healthy_skips_failing_competitors() -> None:
+    registry = CompetitorRegistry()
+    for competitor_id in ("fast", "slow", "broken"):
+        registry.register(CompetitorInfo(id=competitor_id, name=competitor_id, url="http://x"))
+    registry.health("fast").record_success(0.1)
+    registry.health("slow").record_success(2.0)
+    for _ in range(5):
+        registry.health("broken").record_error("timeout")
+
+    ids = [c.id for c in registry.list_healthy()]
+    assert "broken" not in ids
+    assert ids.index("fast") < ids.index("slow")
+    assert "broken" in {c.id for c in registry.list_healthy(min_count=10)}
+
+
+async def test_ping_marks_competitor_warm() -> None:
+    registry = CompetitorRegistry(http2=False)
+    competitor = registry.get_default()
+    assert competitor is not None
+    responses = iter([httpx.Response(429), httpx.Response(200, json={"status": "ok"})])
+    transport = httpx.MockTransport(lambda request: next(responses))
+    registry._clients[competitor.id] = httpx.AsyncClient(transport=transport)
+
+    assert await registry.ping(competitor) is False
+    assert registry.health(competitor.id).last_seen_warm is None
+    assert await registry.ping(competitor) is True
+    assert registry.health(competitor.id).is_warm(idle_seconds=60)
+    await registry.aclose()
+
+
+async def test_warm_keeper_survives_a_failing_round(monkeypatch) -> None:
+    registry = CompetitorRegistry(http2=False)
+    original_list_all = registry.list_all
+    rounds = 0
+    pinged = asyncio.Event()
+
+    def flaky_list_all(enabled_only: bool = True):
+        nonlocal rounds
+        rounds += 1
+        if rounds == 1:
+            raise RuntimeError("registry changed during iteration")
+        return original_list_all(enabled_only)
+
+    async def fake_ping(competitor) -> bool:
+        pinged.set()
+        return True
+
+    monkeypatch.setattr(registry, "list_all", flaky_list_all)
+    monkeypatch.setattr(registry, "ping", fake_ping)
+    task = asyncio.create_task(registry.run_warm_keeper(idle_seconds=1.0))
+    try:
+        await asyncio.wait_for(pinged.wait(), timeout=5)
+    finally:
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert rounds >= 2
+    await registry.aclose()
@@ -0,0 +1,63 @@
+"""Unit tests for the expiring map."""
+
+from janus_gateway.services.expiring_map import ExpiringMap
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    store: ExpiringMap[str, int] = ExpiringMap(ttl_seconds=10, clock=clock)
+    store.set("a", 1)
+    clock.now = 5
+    store.set("b", 2)
+
+    clock.now = 10
+    assert store.get("a") is None
+    assert store.get("b") == 2
+    assert "b" in store
+
+    clock.now = 15
+    assert store.purge() == 1
+    assert len(store) == 0
+
+
+def test_reset_restarts_ttl_and_skips_stale_heap_entries() -> None:
+    clock = FakeClock()
+    store: ExpiringMap[str, int] = ExpiringMap(ttl_seconds=10, clock=clock)
+    store.set("a", 1)
+    clock.now = 8
+    store.set("a", 2)
+
+    clock.now = 12
+    assert store.purge() == 0
+    assert store.get("a") == 2
+
+
+def test_max_size_evicts_entry_closest_to_expiry() -> None:
+    clock = FakeClock()
+    store: ExpiringMap[str, int] = ExpiringMap(ttl_seconds=10, max_size=2, clock=clock)
+    store.set("a", 1)
+    clock.now = 1
+    store.set("b", 2)
+    store.set("c", 3)
+
+    assert len(store) == 2
+    assert store.get("a") is None
+    assert store.get("b") == 2
+    assert store.get("c") == 3
+
+
+def test_heap_stays_bounded_under_repeated_updates() -> None:
+    clock = FakeClock()
+    store: ExpiringMap[str, int] = ExpiringMap(ttl_seconds=10, clock=clock)
+    for i in range(10_000):
+        store.set("hot", i)
+    assert len(store) == 1
+    assert len(store._heap) <= 2 * len(store) + 65
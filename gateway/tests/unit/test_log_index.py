@@ -0,0 +1,101 @@
+"""Unit tests for the debug log index."""
+
+import json
+from pathlib import Path
+
+from janus_gateway.services.log_index import LogIndex
+
+
+def _write(path: Path, *entries: dict | str) -> None:
+    with path.open("a", encoding="utf-8") as handle:
+        for entry in entries:
+            line = entry if isinstance(entry, str) else json.dumps(entry)
+            handle.write(f"{line}\n")
+
+
+def test_query_by_request_id_level_and_service(tmp_path: Path) -> None:
+    gateway_log = tmp_path / "gateway.log"
+    baseline_log = tmp_path / "baseline.log"
+    _write(
+        gateway_log,
+        {"event": "start", "request_id": "req-aaaaaaaa", "level": "info"},
+        {"event": "other", "request_id": "req-bbbbbbbb", "level": "info"},
+        {"event": "boom", "correlation_id": "corr-aaaaaaaa", "level": "ERROR"},
+    )
+    _write(baseline_log, "plain text line for req-aaaaaaaa", {"event": "x", "level": "info"})
+    index = LogIndex({"gateway": gateway_log, "baseline": baseline_log})
+
+    assert index.refresh() == 5
+    events = [entry.get("event") for entry in index.query(request_id="req-aaaaaaaa")]
+    assert events == ["start", None]
+    assert index.query(request_id="req-aaaaaaaa", service="baseline") == [
+        {"message": "plain text line for req-aaaaaaaa", "service": "baseline"}
+    ]
+    assert [entry["event"] for entry in index.query(level="error")] == ["boom"]
+    assert [entry["event"] for entry in index.query(request_id="corr-aaaaaaaa")] == ["boom"]
+    assert len(index.query(limit=2)) == 2
+
+
+def test_refresh_is_incremental_and_handles_rotation(tmp_path: Path) -> None:
+    log = tmp_path / "gateway.log"
+    _write(log, {"event": "one", "request_id": "req-11111111"})
+    index = LogIndex({"gateway": log})
+    assert index.refresh() == 1
+
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write('{"event": "partial"')
+    assert index.refresh() == 0
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write(', "request_id": "req-11111111"}\n')
+    assert index.refresh() == 1
+    assert [e["event"] for e in index.query(request_id="req-11111111")] == ["one", "partial"]
+
+    log.unlink()
+    _write(log, {"event": "rotated", "request_id": "req-11111111"})
+    index.refresh()
+    assert [e["event"] for e in index.query(request_id="req-11111111")] == ["rotated"]
+
+
+async def test_follow_yields_only_new_matching_entries(tmp_path: Path) -> None:
+    log = tmp_path / "gateway.log"
+    _write(log, {"event": "old", "level": "error"})
+    index = LogIndex({"gateway": log})
+    stream = index.follow(level="error", poll_interval=0.01)
+
+    first = await stream.__anext__()
+    assert first == []
+    _write(log, {"event": "new", "level": "error"}, {"event": "quiet", "level": "info"})
+    batch = await stream.__anext__()
+    assert [entry["event"] for entry in batch] == ["new"]
+    await stream.aclose()
+
+
+def test_query_stops_at_explicit_end(tmp_path: Path) -> None:
+    log = tmp_path / "gateway.log"
+    _write(log, {"event": "first", "level": "error"})
+    index = LogIndex({"gateway": log})
+    index.refresh()
+    end = index.line_count
+    # A concurrent refresh indexes more lines before the follower queries.
+    _write(log, {"event": "second", "level": "error"})
+    index.refresh()
+
+    assert [e["event"] for e in index.query(level="error", after=0, end=end)] == ["first"]
+    assert [e["event"] for e in index.query(after=0, end=end)] == ["first"]
+    assert [e["event"] for e in index.query(level="error", after=end)] == ["second"]
+
+
+def test_request_id_matches_id_fields_exactly(tmp_path: Path) -> None:
+    log = tmp_path / "gateway.log"
+    _write(
+        log,
+        {"event": "owner", "request_id": "req-aaaaaaaa"},
+        {"event": "mention", "message": "retrying req-aaaaaaaa"},
+        {"event": "longer", "request_id": "req-aaaaaaaa-retry"},
+    )
+    index = LogIndex({"gateway": log})
+    index.refresh()
+
+    # JSON lines match only through ID_FIELDS, and only on the whole value.
+    assert [e["event"] for e in index.query(request_id="req-aaaaaaaa")] == ["owner"]
+    assert index.query(request_id="req-aaaa") == []
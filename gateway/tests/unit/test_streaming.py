@@ -1,5 +1,6 @@
 """Unit tests for SSE helpers."""
 
+from janus_gateway.services.sse_decoder import SSEDecoder, SSEEvent
 from janus_gateway.services.streaming import (
     StreamChunk,
     create_done_marker,
@@ -86,3 +87,32 @@ def test_chunk_with_usage() -> None:
     )
     assert chunk.usage is not None
     assert chunk.usage["total_tokens"] == 30
+
+
+def test_decoder_joins_lines_split_across_chunks() -> None:
+    decoder = SSEDecoder()
+    stream = b'data: {"a": 1}\n\ndata: {"b":\ndata:  2}\n\n'
+
+    events = []
+    for index in range(len(stream)):
+        events.extend(decoder.feed(stream[index : index + 1]))
+
+    assert [event.data for event in events] == ['{"a": 1}', '{"b":\n 2}']
+
+
+def test_decoder_handles_crlf_fields_and_comments() -> None:
+    decoder = SSEDecoder(include_comments=True)
+    events = decoder.feed(b": ping\r\n\r\nevent: update\r\nid: 7\r\ndata: x\r\n\r\n")
+
+    assert events == [
+        SSEEvent(comment=" ping"),
+        SSEEvent(data="x", event="update", id="7"),
+    ]
+    assert events[1].encode() == "event: update\nid: 7\ndata: x\n\n"
+
+
+def test_decoder_flush_returns_unterminated_event() -> None:
+    decoder = SSEDecoder()
+    assert decoder.feed(b"data: [DONE]") == []
+    assert decoder.flush() == [SSEEvent(data="[DONE]")]
+    assert decoder.flush() == []
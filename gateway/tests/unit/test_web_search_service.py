@@ -1,6 +1,10 @@
 """Unit tests for gateway web search helpers."""
 
-from janus_gateway.services.web_search import normalize_serper_results
+import asyncio
+
+import pytest
+
+from janus_gateway.services.web_search import WebSearchCache, normalize_serper_results
 
 
 def test_normalize_serper_results() -> None:
@@ -21,3 +25,44 @@ def test_normalize_serper_results() -> None:
             "snippet": "Python 3.12.0 is the newest major release of the Python programming language.",
         }
     ]
+
+
+async def test_web_search_cache_coalesces_identical_queries() -> None:
+    cache = WebSearchCache(ttl_seconds=60)
+    calls = 0
+
+    async def fetch() -> tuple[str, list[dict[str, str]]]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "serper", [{"title": "t", "url": "u", "snippet": "s"}]
+
+    key = WebSearchCache.make_key("Python  release", 5)
+    assert key == WebSearchCache.make_key(" python release ", 5)
+    assert key != WebSearchCache.make_key("python release", 10)
+
+    results = await asyncio.gather(*(cache.get_or_fetch(key, fetch) for _ in range(5)))
+    assert calls == 1
+    assert all(result == results[0] for result in results)
+    assert cache.coalesced == 4
+
+    await cache.get_or_fetch(key, fetch)
+    assert calls == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+async def test_web_search_cache_negative_caches_provider_errors() -> None:
+    cache = WebSearchCache(ttl_seconds=60, negative_ttl_seconds=60)
+    calls = 0
+
+    async def failing_fetch() -> tuple[str, list[dict[str, str]]]:
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("Web search failed: boom")
+
+    key = WebSearchCache.make_key("query", 10)
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="boom"):
+            await cache.get_or_fetch(key, failing_fetch)
+    assert calls == 1
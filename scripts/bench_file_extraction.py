@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Benchmark event-loop blocking caused by gateway attachment extraction.
+
+Builds a synthetic corpus of PDF/DOCX/PPTX/XLSX attachments, then processes
+a multi-turn conversation (the same attachments re-sent every turn) with the
+inline ``MessageProcessor.process_message`` path and with the off-loop,
+cached ``MessageProcessor.process_messages`` path. A ticker task measures how
+long the event loop is blocked while extraction runs.
+
+Usage (from the repo root, with the gateway installed):
+
+    python scripts/bench_file_extraction.py --pages 200 --turns 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import io
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import fitz
+import openpyxl
+from docx import Document
+from pptx import Presentation
+from pptx.util import Inches
+
+from janus_gateway.models.openai import FileContent, FileInfo, Message, MessageRole
+from janus_gateway.services.message_processor import (
+    ExtractionCache,
+    MessageProcessor,
+    shutdown_extraction_executor,
+)
+
+TICK_SECONDS = 0.005
+FILLER = "Janus gateway attachment benchmark filler text. " * 12
+
+
+@dataclass
+class LoopStats:
+    wall_seconds: float
+    max_block_ms: float
+    total_block_ms: float
+
+
+def _encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("utf-8")
+
+
+def build_corpus(pages: int) -> list[tuple[str, str, str]]:
+    """Return (name, mime_type, base64 content) tuples."""
+    pdf = fitz.open()
+    for i in range(pages):
+        page = pdf.new_page()
+        page.insert_textbox(fitz.Rect(72, 72, 540, 760), f"Page {i + 1}\n{FILLER * 4}")
+    corpus = [("sample.pdf", "application/pdf", _encode(pdf.tobytes()))]
+
+    doc = Document()
+    for i in range(pages * 5):
+        doc.add_paragraph(f"Paragraph {i + 1}: {FILLER}")
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    corpus.append(
+        (
+            "sample.docx",
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            _encode(buffer.getvalue()),
+        )
+    )
+
+    presentation = Presentation()
+    for i in range(max(pages // 4, 1)):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[5])
+        textbox = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(8), Inches(4))
+        textbox.text_frame.text = f"Slide {i + 1}\n{FILLER}"
+    buffer = io.BytesIO()
+    presentation.save(buffer)
+    corpus.append(
+        (
+            "sample.pptx",
+            "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+            _encode(buffer.getvalue()),
+        )
+    )
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    for i in range(pages * 20):
+        sheet.append([i, f"row {i}", FILLER[:80], i * 1.5])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    corpus.append(
+        (
+            "sample.xlsx",
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            _encode(buffer.getvalue()),
+        )
+    )
+    return corpus
+
+
+def build_message(corpus: list[tuple[str, str, str]]) -> Message:
+    return Message(
+        role=MessageRole.USER,
+        content=[
+            FileContent(
+                file=FileInfo(name=name, mime_type=mime_type, content=content, size=len(content))
+            )
+            for name, mime_type, content in corpus
+        ],
+    )
+
+
+async def _measure(work: Callable[[], Awaitable[None]]) -> LoopStats:
+    max_block = 0.0
+    total_block = 0.0
+    stop = asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal max_block, total_block
+        last = time.perf_counter()
+        while not stop.is_set():
+            await asyncio.sleep(TICK_SECONDS)
+            now = time.perf_counter()
+            blocked = max(now - last - TICK_SECONDS, 0.0)
+            max_block = max(max_block, blocked)
+            total_block += blocked
+            last = now
+
+    tick_task = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK_SECONDS * 2)
+    start = time.perf_counter()
+    await work()
+    wall = time.perf_counter() - start
+    stop.set()
+    await tick_task
+    return LoopStats(wall, max_block * 1000, total_block * 1000)
+
+
+async def run(pages: int, turns: int) -> None:
+    corpus = build_corpus(pages)
+    message = build_message(corpus)
+    sizes = ", ".join(f"{name}={len(content) // 1024}KiB" for name, _, content in corpus)
+    print(f"corpus: {sizes}; {turns} turns re-sending all attachments")
+
+    inline = MessageProcessor(cache=ExtractionCache(max_entries=0))
+
+    async def inline_turns() -> None:
+        for _ in range(turns):
+            inline.process_message(message)
+            await asyncio.sleep(0)
+
+    before = await _measure(inline_turns)
+
+    # Spawn the worker pool outside the measured window.
+    await MessageProcessor(cache=ExtractionCache(max_entries=0)).process_messages([message])
+    offloaded = MessageProcessor(cache=ExtractionCache())
+
+    async def offloaded_turns() -> None:
+        for _ in range(turns):
+            await offloaded.process_messages([message])
+
+    after = await _measure(offloaded_turns)
+    shutdown_extraction_executor()
+
+    print(f"{'mode':<22}{'wall s':>10}{'max block ms':>16}{'total block ms':>18}")
+    for label, stats in (("inline (before)", before), ("pool+cache (after)", after)):
+        print(
+            f"{label:<22}{stats.wall_seconds:>10.2f}"
+            f"{stats.max_block_ms:>16.1f}{stats.total_block_ms:>18.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=100, help="Pages per synthetic document")
+    parser.add_argument("--turns", type=int, default=3, help="Conversation turns to replay")
+    args = parser.parse_args()
+    asyncio.run(run(args.pages, args.turns))
+
+
+if __name__ == "__main__":
+    main()
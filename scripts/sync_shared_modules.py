@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Copy modules shared between separately built packages from their canonical source.
+
+The gateway and baseline packages are built from their own directories, so
+code they share is vendored: each module has one canonical copy and the
+others are byte-identical copies written by this script.
+
+Usage (from the repo root):
+
+    python scripts/sync_shared_modules.py          # rewrite the vendored copies
+    python scripts/sync_shared_modules.py --check  # exit 1 if any copy drifted
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# canonical source -> vendored copies (paths relative to the repo root)
+SHARED_MODULES: dict[str, tuple[str, ...]] = {
+    "gateway/janus_gateway/services/sse_decoder.py": (
+        "baseline-agent-cli/janus_baseline_agent_cli/sse_decoder.py",
+    ),
+    "baseline-agent-cli/janus_baseline_agent_cli/services/keyword_matcher.py": (
+        "baseline-langchain/janus_baseline_langchain/services/keyword_matcher.py",
+    ),
+}
+
+
+def stale_copies(root: Path = REPO_ROOT) -> list[str]:
+    """Return the vendored copies whose content differs from their source."""
+    stale = []
+    for source, copies in SHARED_MODULES.items():
+        expected = (root / source).read_bytes()
+        for copy in copies:
+            path = root / copy
+            if not path.exists() or path.read_bytes() != expected:
+                stale.append(copy)
+    return stale
+
+
+def sync(root: Path = REPO_ROOT) -> list[str]:
+    """Rewrite every vendored copy from its source; return the paths written."""
+    written = []
+    for source, copies in SHARED_MODULES.items():
+        content = (root / source).read_bytes()
+        for copy in copies:
+            path = root / copy
+            if not path.exists() or path.read_bytes() != content:
+                path.write_bytes(content)
+                written.append(copy)
+    return written
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="report drifted copies instead of rewriting them",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        stale = stale_copies()
+        for path in stale:
+            print(f"out of sync: {path}", file=sys.stderr)
+        return 1 if stale else 0
+
+    for path in sync():
+        print(f"updated {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""Train and evaluate the baseline's local routing classifier.
+
+Training examples come from logged ``complexity_llm_verification`` events
+(JSON-lines logs; the routing LLM's decision is the label and the logged
+``routing_text``/``has_images`` the input) and from the bench ``train``
+split, labelled by category via ``CATEGORY_DECISIONS``.
+The model is evaluated on the bench ``dev`` split and on the fast/agent
+cases asserted in ``baseline-agent-cli/tests/test_complexity.py``, reporting
+accuracy and how much traffic clears the confidence threshold (and so
+skips the LLM).
+
+Usage (from the repo root, with baseline-agent-cli and numpy installed):
+
+    python scripts/train_routing_classifier.py --logs logs/baseline.jsonl \\
+        --output baseline-agent-cli/routing_classifier.json
+
+Then point ``BASELINE_AGENT_CLI_LOCAL_ROUTING_MODEL_PATH`` at the output.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from janus_baseline_agent_cli.routing import RoutingDecision, decision_requires_agent
+from janus_baseline_agent_cli.services.routing_classifier import (
+    DEFAULT_FEATURE_DIM,
+    LocalRoutingClassifier,
+    extract_features,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+BENCH_DIR = REPO_ROOT / "bench" / "datasets" / "public"
+COMPLEXITY_TESTS = REPO_ROOT / "baseline-agent-cli" / "tests" / "test_complexity.py"
+
+# Bench categories carry no routing label; these mirror what the routing
+# prompt asks for (tools/external actions -> agent, images -> *_kimi).
+CATEGORY_DECISIONS = {
+    "chat": RoutingDecision.FAST_QWEN,
+    "multimodal": RoutingDecision.FAST_KIMI,
+    "code": RoutingDecision.AGENT_NEMOTRON,
+    "agentic": RoutingDecision.AGENT_KIMI,
+    "research": RoutingDecision.AGENT_KIMI,
+    "deep_research": RoutingDecision.AGENT_KIMI,
+}
+LOG_EVENT = "complexity_llm_verification"
+
+
+@dataclass(frozen=True)
+class Example:
+    text: str
+    has_images: bool
+    decision: RoutingDecision | None  # None when only the path (fast/agent) is known
+    agent: bool
+
+
+def _message_text(content: object) -> tuple[str, bool]:
+    if isinstance(content, str):
+        return content, False
+    parts: list[str] = []
+    has_images = False
+    for part in content if isinstance(content, list) else []:
+        if not isinstance(part, dict):
+            continue
+        if part.get("type") == "text":
+            parts.append(str(part.get("text", "")))
+        elif part.get("type") == "image_url":
+            has_images = True
+    return " ".join(parts), has_images
+
+
+def load_logs(paths: Iterable[Path]) -> Iterator[Example]:
+    """Routing-LLM decisions from structlog JSON lines.
+
+    Uses the ``routing_text`` (the first ``MAX_FEATURE_CHARS`` of the prompt)
+    and ``has_images`` fields logged with each decision, i.e. the same input
+    the classifier sees at inference. Older events that only carry the
+    100-char ``text_preview`` are skipped rather than trained on truncated
+    prompts.
+    """
+    for path in paths:
+        with path.open(encoding="utf-8", errors="replace") as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(entry, dict) or entry.get("event") != LOG_EVENT:
+                    continue
+                try:
+                    decision = RoutingDecision(entry.get("decision"))
+                except ValueError:
+                    continue  # failed/conservative checks carry no decision
+                text = str(entry.get("routing_text") or "")
+                if text:
+                    has_images = bool(entry.get("has_images"))
+                    yield Example(text, has_images, decision, decision_requires_agent(decision))
+
+
+def load_bench(split: str) -> Iterator[Example]:
+    """Bench tasks labelled by ``CATEGORY_DECISIONS``."""
+    for path in sorted((BENCH_DIR / split).glob("*.jsonl")):
+        with path.open(encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                task = json.loads(line)
+                decision = CATEGORY_DECISIONS.get(task.get("category"))
+                messages = task.get("input", {}).get("messages", [])
+                user = [m for m in messages if m.get("role") == "user"]
+                if decision is None or not user:
+                    continue
+                text, has_images = _message_text(user[-1].get("content"))
+                yield Example(text, has_images, decision, decision_requires_agent(decision))
+
+
+def _is_complex_assertion(node: ast.expr) -> bool | None:
+    """Map ``assert is_complex`` style checks to the asserted path."""
+    if isinstance(node, ast.Name) and node.id == "is_complex":
+        return True
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        inner = _is_complex_assertion(node.operand)
+        return None if inner is None else not inner
+    if (
+        isinstance(node, ast.Compare)
+        and isinstance(node.left, ast.Attribute)
+        and node.left.attr == "is_complex"
+        and isinstance(node.ops[0], ast.Is)
+        and isinstance(node.comparators[0], ast.Constant)
+    ):
+        return bool(node.comparators[0].value)
+    return None
+
+
+def load_complexity_test_cases(path: Path = COMPLEXITY_TESTS) -> Iterator[Example]:
+    """Prompts and asserted paths from the heuristic complexity tests.
+
+    Tests that monkeypatch the routing LLM are skipped: their outcome is
+    whatever the fake returned, not a label.
+    """
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    for func in tree.body:
+        if not isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        if not func.name.startswith("test_") or any(
+            arg.arg == "monkeypatch" for arg in func.args.args
+        ):
+            continue
+        current: tuple[str, bool] | None = None
+        for statement in func.body:
+            if isinstance(statement, ast.Assert):
+                agent = _is_complex_assertion(statement.test)
+                if agent is not None and current is not None and current[0]:
+                    yield Example(current[0], current[1], None, agent)
+                    current = None
+                continue
+            for node in ast.walk(statement):
+                if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "Message":
+                    current = _test_message(node) or current
+
+
+def _test_message(call: ast.Call) -> tuple[str, bool] | None:
+    role = next((kw.value for kw in call.keywords if kw.arg == "role"), None)
+    if not (isinstance(role, ast.Attribute) and role.attr == "USER"):
+        return None
+    content = next((kw.value for kw in call.keywords if kw.arg == "content"), None)
+    if isinstance(content, ast.Constant) and isinstance(content.value, str):
+        return content.value, False
+    if isinstance(content, ast.List):
+        texts: list[str] = []
+        has_images = False
+        for part in content.elts:
+            name = getattr(getattr(part, "func", None), "id", "")
+            if name == "ImageUrlContent":
+                has_images = True
+            for kw in getattr(part, "keywords", []):
+                if kw.arg == "text" and isinstance(kw.value, ast.Constant):
+                    texts.append(str(kw.value.value))
+        return " ".join(texts), has_images
+    return None
+
+
+def train(
+    examples: list[Example],
+    dim: int = DEFAULT_FEATURE_DIM,
+    epochs: int = 300,
+    learning_rate: float = 0.5,
+    l2: float = 1e-3,
+) -> LocalRoutingClassifier:
+    """Full-batch gradient descent on softmax cross-entropy.
+
+    Only hashed columns that occur in the training data are materialised,
+    so the dense matrix is examples x observed features.
+    """
+    labelled = [example for example in examples if example.decision is not None]
+    classes = sorted({example.decision for example in labelled}, key=lambda d: d.value)
+    features = [extract_features(example.text, example.has_images, dim) for example in labelled]
+    columns = sorted({index for row in features for index in row})
+    column_of = {index: column for column, index in enumerate(columns)}
+
+    x = np.zeros((len(labelled), len(columns)))
+    for row, feature_row in enumerate(features):
+        for index, value in feature_row.items():
+            x[row, column_of[index]] = value
+    y = np.zeros((len(labelled), len(classes)))
+    for row, example in enumerate(labelled):
+        y[row, classes.index(example.decision)] = 1.0
+
+    weights = np.zeros((len(columns), len(classes)))
+    bias = np.zeros(len(classes))
+    for _ in range(epochs):
+        scores = x @ weights + bias
+        scores -= scores.max(axis=1, keepdims=True)
+        probabilities = np.exp(scores)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        error = (probabilities - y) / len(labelled)
+        weights -= learning_rate * (x.T @ error + l2 * weights)
+        bias -= learning_rate * error.sum(axis=0)
+
+    return LocalRoutingClassifier(
+        classes=classes,
+        weights={index: weights[column_of[index]].round(6).tolist() for index in columns},
+        bias=bias.round(6).tolist(),
+        dim=dim,
+    )
+
+
+def evaluate(
+    model: LocalRoutingClassifier, examples: list[Example], threshold: float
+) -> dict[str, float | None]:
+    """Accuracy overall and on the share of examples that clear ``threshold``."""
+    decision_hits = decision_total = path_hits = covered = covered_path_hits = 0
+    for example in examples:
+        decision, confidence = model.predict(example.text, example.has_images)
+        path_ok = decision_requires_agent(decision) == example.agent
+        path_hits += path_ok
+        if example.decision is not None:
+            decision_total += 1
+            decision_hits += decision == example.decision
+        if confidence >= threshold:
+            covered += 1
+            covered_path_hits += path_ok
+    count = max(len(examples), 1)
+    return {
+        "examples": len(examples),
+        "decision_accuracy": (
+            round(decision_hits / decision_total, 3) if decision_total else None
+        ),
+        "path_accuracy": round(path_hits / count, 3),
+        "coverage": round(covered / count, 3),
+        "covered_path_accuracy": round(covered_path_hits / max(covered, 1), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--logs", type=Path, nargs="*", default=[], help="JSON-lines log files")
+    parser.add_argument("--no-bench", action="store_true", help="Train on logs only")
+    parser.add_argument("--threshold", type=float, default=0.85, help="Confidence threshold")
+    parser.add_argument("--epochs", type=int, default=300)
+    parser.add_argument("--l2", type=float, default=1e-3)
+    parser.add_argument("--output", type=Path, help="Where to write the model JSON")
+    args = parser.parse_args()
+
+    training = list(load_logs(args.logs))
+    if not args.no_bench:
+        training.extend(load_bench("train"))
+    if not training:
+        parser.error("no training examples found")
+
+    model = train(training, epochs=args.epochs, l2=args.l2)
+    print(f"trained on {len(training)} examples, {len(model.weights)} active features")
+    for name, examples in (
+        ("train", training),
+        ("bench dev", list(load_bench("dev"))),
+        ("test_complexity.py", list(load_complexity_test_cases())),
+    ):
+        print(f"{name:>20}: {evaluate(model, examples, args.threshold)}")
+
+    if args.output:
+        model.save(args.output)
+        print(f"wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -290,6 +290,7 @@ export function ChatArea({
       url: typeof data.url === 'string' ? data.url : '',
       title: typeof data.title === 'string' ? data.title : '',
       image_base64: image,
+      mime_type: typeof data.mime_type === 'string' ? data.mime_type : undefined,
       timestamp: typeof data.timestamp === 'number' ? data.timestamp : Date.now() / 1000,
     };
   };
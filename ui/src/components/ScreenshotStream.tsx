@@ -37,7 +37,7 @@ export function ScreenshotStream({ screenshots, isLive }: ScreenshotStreamProps)
 
       <div className="relative rounded-lg overflow-hidden border border-ink-700">
         <img
-          src={`data:image/png;base64,${latestScreenshot.image_base64}`}
+          src={`data:${latestScreenshot.mime_type || 'image/png'};base64,${latestScreenshot.image_base64}`}
           alt={latestScreenshot.title || 'Browser screenshot'}
           className="w-full"
         />
@@ -74,7 +74,7 @@ export function ScreenshotStream({ screenshots, isLive }: ScreenshotStreamProps)
               aria-label={`View screenshot ${index + 1}`}
             >
               <img
-                src={`data:image/png;base64,${shot.image_base64}`}
+                src={`data:${shot.mime_type || 'image/png'};base64,${shot.image_base64}`}
                 alt={`Step ${index + 1}`}
                 className="w-full h-full object-cover"
               />
@@ -104,7 +104,7 @@ export function ScreenshotStream({ screenshots, isLive }: ScreenshotStreamProps)
               Close
             </button>
             <img
-              src={`data:image/png;base64,${screenshots[expanded].image_base64}`}
+              src={`data:${screenshots[expanded].mime_type || 'image/png'};base64,${screenshots[expanded].image_base64}`}
               alt={screenshots[expanded].title || 'Browser screenshot'}
               className="max-w-full max-h-full object-contain"
             />
@@ -166,6 +166,7 @@ export interface ScreenshotData {
   url: string;
   title: string;
   image_base64: string;
+  mime_type?: string;
   timestamp: number;
 }
 